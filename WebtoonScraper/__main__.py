@@ -1,23 +1,23 @@
 from __future__ import annotations
 
 import argparse
-import asyncio
 import contextlib
 import logging
 import sys
 from argparse import ArgumentParser, Namespace
 from collections.abc import Callable, Sequence
-from importlib.resources import files
 from pathlib import Path
-from typing import Any, Literal
-
-from rich.table import Table
+from typing import TYPE_CHECKING, Any, Literal
 
 import WebtoonScraper
 from WebtoonScraper import __version__
-from WebtoonScraper.base import console, logger, platforms
-from WebtoonScraper.exceptions import PlatformError, URLError
-from WebtoonScraper.scrapers import EpisodeRange, Scraper
+from WebtoonScraper.base import get_platform, load_platforms, logger, platform_names, platforms
+from WebtoonScraper.exceptions import LeaseHeldError, PlatformError, URLError, UseFetchEpisode
+
+# CLI는 짧게 여러 번 실행되는 경우가 많기 때문에 시작 시간을 줄이기 위해
+# asyncio, rich, httpx와 스크래퍼들은 실제로 필요할 때 불러옴
+if TYPE_CHECKING:
+    from WebtoonScraper.scrapers import EpisodeRange, Scraper
 
 
 class LazyVersionAction(argparse._VersionAction):
@@ -70,6 +70,8 @@ def _version_info() -> str:
                     "Download missing dependencies via `pip install -U WebtoonScraper[full]`"
                 )
 
+    from importlib.resources import files
+
     return f"WebtoonScraper {__version__} of Python {sys.version} at {str(files(WebtoonScraper))}"
 
 
@@ -93,6 +95,21 @@ def _parse_excluding(string: str) -> tuple[str, ...]:
     return tuple(value.strip() for value in string.split(",") if value.strip())
 
 
+def _parse_max_bandwidth(string: str):
+    from WebtoonScraper.bandwidth import parse_bandwidth_schedule
+
+    try:
+        return parse_bandwidth_schedule(string)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(str(exc)) from None
+
+
+def _parse_range(string: str) -> EpisodeRange:
+    from WebtoonScraper.scrapers import EpisodeRange
+
+    return EpisodeRange.from_string(string)
+
+
 parser = argparse.ArgumentParser(
     prog="WebtoonScraper",
     formatter_class=argparse.RawTextHelpFormatter,
@@ -132,16 +149,16 @@ download_subparser.add_argument(
     "-p",
     "--platform",
     type=lambda x: str(x).lower(),
-    choices=("url", *platforms),
+    choices=("url", *platform_names()),
     metavar="PLATFORM",
     default="url",
-    help=f"Webtoon platform to download. Only specify when you want to use webtoon id rather than url. Supported platforms: {', '.join(platforms)}",
+    help=f"Webtoon platform to download. Only specify when you want to use webtoon id rather than url. Supported platforms: {', '.join(platform_names())}",
 )
 download_subparser.add_argument("--cookie")
 download_subparser.add_argument(
     "-r",
     "--range",
-    type=EpisodeRange.from_string,
+    type=_parse_range,
     help="Episode number range you want to download.",
 )
 download_subparser.add_argument(
@@ -151,7 +168,23 @@ download_subparser.add_argument(
     default=Path.cwd(),
     help="Where 'webtoon directory' is stored",
 )
-download_subparser.add_argument("--list-episodes", action="store_true", help="List all episodes")
+download_subparser.add_argument("--list-episodes", action="store_true", help="List all episodes. Episodes are printed as each page of the listing arrives.")
+download_subparser.add_argument(
+    "--list-format",
+    choices=("table", "ndjson"),
+    default="table",
+    help="Output format of --list-episodes. 'ndjson' prints one JSON object per line. Defaults to 'table'.",
+)
+download_subparser.add_argument(
+    "--stream-listing",
+    action="store_true",
+    help="Start downloading episodes while the episode list is still being fetched.",
+)
+download_subparser.add_argument(
+    "--low-memory",
+    action="store_true",
+    help="Keep raw listing payloads in a temporary file instead of memory. Useful for webtoons with thousands of episodes.",
+)
 download_subparser.add_argument(
     "-O",
     "--option",
@@ -194,6 +227,220 @@ download_subparser.add_argument(
     help="Ignore errors on batch download.",
     action="store_true",
 )
+download_subparser.add_argument(
+    "--concat",
+    type=int,
+    nargs="?",
+    const=0,
+    metavar="PAGE_HEIGHT",
+    help="Concatenate each episode in worker processes while the next episodes are downloading.\n"
+    "Re-slice into pages of PAGE_HEIGHT pixels if provided.",
+)
+download_subparser.add_argument(
+    "--transcode",
+    choices=("webp", "avif"),
+    help="Transcode downloaded images in worker processes while the next episodes are downloading.\n"
+    "Runs after --concat of the episode is done.",
+)
+download_subparser.add_argument(
+    "--transcode-quality",
+    type=int,
+    default=80,
+    help="Quality of transcoded images. Defaults to 80.",
+)
+download_subparser.add_argument(
+    "--keep-originals",
+    action="store_true",
+    help="Keep original images in '_originals' of the webtoon directory when transcoding.",
+)
+download_subparser.add_argument(
+    "--viewer",
+    action="store_true",
+    help="Build or update static 'webtoon.html' viewer when the download ends.",
+)
+download_subparser.add_argument(
+    "--export",
+    choices=("cbz", "epub"),
+    help="Package each downloaded episode into an archive in the webtoon directory and remove the episode directory.\n"
+    "Runs after --concat and --transcode of the episode are done. Can't be used with --viewer.",
+)
+download_subparser.add_argument(
+    "--events",
+    type=Path,
+    metavar="EVENTS.jsonl",
+    help="Append download events (started, completed, failed, skipped, ...) with per-episode statistics to the file as JSON lines.",
+)
+download_subparser.add_argument(
+    "--metrics-file",
+    type=Path,
+    metavar="METRICS.prom",
+    help="Write Prometheus metrics to the file for textfile collector while downloading.",
+)
+download_subparser.add_argument(
+    "--metrics-port",
+    type=int,
+    metavar="PORT",
+    help="Serve Prometheus metrics on http://127.0.0.1:PORT/metrics while downloading.",
+)
+download_subparser.add_argument(
+    "--profile",
+    action="store_true",
+    help="Measure time spent in each phase of the download and print a breakdown table at the end.",
+)
+download_subparser.add_argument(
+    "--profile-output",
+    type=Path,
+    metavar="PROFILE.prof",
+    help="Run cProfile while downloading and dump pstats to the file. Implies --profile.",
+)
+download_subparser.add_argument(
+    "--profile-collapsed",
+    type=Path,
+    metavar="STACKS.txt",
+    help="Sample call stacks while downloading and write them in flamegraph-compatible collapsed format. Implies --profile.",
+)
+http_archive_group = download_subparser.add_mutually_exclusive_group()
+http_archive_group.add_argument(
+    "--record",
+    type=Path,
+    metavar="ARCHIVE.zip",
+    help="Record every HTTP request and response to the archive. Cookies and authorization headers are stripped unless --record-credentials is given.",
+)
+http_archive_group.add_argument(
+    "--replay",
+    type=Path,
+    metavar="ARCHIVE.zip",
+    help="Answer every HTTP request from an archive made with --record without accessing the network.",
+)
+download_subparser.add_argument(
+    "--record-credentials",
+    action="store_true",
+    help="Keep cookies and authorization headers in the archive made with --record.",
+)
+download_subparser.add_argument(
+    "--max-bandwidth",
+    type=_parse_max_bandwidth,
+    metavar="RATE",
+    help="Limit download bandwidth of images and other files in bytes per second, e.g. 500K, 2M or 1.5MiB. "
+    "Different limits can be set by time of day, e.g. '09:00-18:00=500K,22:00-06:00=unlimited,2M' (the last one is the default).",
+)
+download_subparser.add_argument(
+    "--hedge",
+    action="store_true",
+    help="Send a duplicate request for an image which has not started responding within the 95th percentile of observed latency, "
+    "and use whichever finishes first.",
+)
+download_subparser.add_argument(
+    "--hedge-budget",
+    type=float,
+    default=0.05,
+    metavar="RATIO",
+    help="Maximum ratio of duplicate requests to image requests sent with --hedge. Defaults to 0.05.",
+)
+download_subparser.add_argument(
+    "--adaptive-concurrency",
+    type=int,
+    nargs="?",
+    const=0,
+    metavar="MAX",
+    help="Adjust the number of concurrent requests (up to MAX, 10 by default) and per-host timeouts to observed latency and errors. "
+    "Concurrency grows while responses are healthy and is halved on 429, 5xx, timeouts or rising latency.",
+)
+download_subparser.add_argument(
+    "--lease",
+    action="store_true",
+    help="Hold lease files on webtoon and episode directories so that several processes or hosts can share one download directory (e.g. over NFS).",
+)
+download_subparser.add_argument(
+    "--lease-ttl",
+    type=float,
+    default=60.0,
+    metavar="SECONDS",
+    help="Leases which are not renewed for this long are considered stale and reclaimed by other workers. Defaults to 60.",
+)
+download_subparser.add_argument(
+    "--claim-dir",
+    type=Path,
+    metavar="DIRECTORY",
+    help="Share the list of webtoon IDs with other workers. Each webtoon is claimed in the directory before downloading, "
+    "and webtoons claimed or finished by other workers are skipped. Implies --lease.",
+)
+
+# concat subparser
+concat_subparser = subparsers.add_parser("concat", help="Concatenate episode images into one strip or uniform pages")
+concat_subparser.set_defaults(subparser_name="concat")
+concat_subparser.add_argument(
+    "webtoon_directories",
+    help="Webtoon directories to concatenate. A directory containing webtoon directories is also accepted",
+    type=Path,
+    nargs="+",
+)
+concat_subparser.add_argument(
+    "--page-height",
+    type=int,
+    help="Re-slice concatenated episodes into pages of given height. Each episode becomes one PNG image if omitted.",
+)
+concat_subparser.add_argument(
+    "--page-format",
+    choices=("jpg", "png", "webp"),
+    default="jpg",
+    help="Image format of re-sliced pages.",
+)
+concat_subparser.add_argument(
+    "--target-directory",
+    type=Path,
+    help="Where concatenated webtoon is stored. Defaults to 'TITLE(ID, concatenated)' next to the webtoon directory.",
+)
+
+# transcode subparser
+transcode_subparser = subparsers.add_parser("transcode", help="Transcode images of downloaded webtoons into WebP or AVIF")
+transcode_subparser.set_defaults(subparser_name="transcode")
+transcode_subparser.add_argument(
+    "webtoon_directories",
+    help="Webtoon directories to transcode. A directory containing webtoon directories is also accepted",
+    type=Path,
+    nargs="+",
+)
+transcode_subparser.add_argument("-f", "--format", choices=("webp", "avif"), default="webp", help="Image format to transcode into.")
+transcode_subparser.add_argument("-q", "--quality", type=int, default=80, help="Quality of transcoded images. Defaults to 80.")
+transcode_subparser.add_argument(
+    "--keep-originals",
+    action="store_true",
+    help="Keep original images in '_originals' of the webtoon directory instead of deleting them.",
+)
+
+# viewer subparser
+viewer_subparser = subparsers.add_parser("viewer", help="Build static 'webtoon.html' viewers of downloaded webtoons")
+viewer_subparser.set_defaults(subparser_name="viewer")
+viewer_subparser.add_argument(
+    "webtoon_directories",
+    help="Webtoon directories to build viewer. A directory containing webtoon directories is also accepted",
+    type=Path,
+    nargs="+",
+)
+viewer_subparser.add_argument("--no-thumbnails", action="store_true", help="Do not make preview thumbnails of episodes.")
+viewer_subparser.add_argument("--rebuild", action="store_true", help="Rebuild every episode page instead of only new or changed ones.")
+
+# export subparser
+export_subparser = subparsers.add_parser("export", help="Export downloaded webtoons into CBZ or EPUB")
+export_subparser.set_defaults(subparser_name="export")
+export_subparser.add_argument(
+    "webtoon_directories",
+    help="Webtoon directories to export. A directory containing webtoon directories is also accepted",
+    type=Path,
+    nargs="+",
+)
+export_subparser.add_argument("-f", "--format", choices=("cbz", "epub"), default="cbz", help="Archive format to export into.")
+export_subparser.add_argument(
+    "--single",
+    action="store_true",
+    help="Export whole webtoon into one archive instead of one archive per episode.",
+)
+export_subparser.add_argument(
+    "--target-directory",
+    type=Path,
+    help="Where archives are stored. Defaults to 'TITLE(ID, FORMAT)' next to the webtoon directory.",
+)
 
 
 def _register(platform_name: str, scraper=None):
@@ -207,7 +454,7 @@ def _register(platform_name: str, scraper=None):
 def instantiate(webtoon_platform: str, webtoon_id: str) -> Scraper:
     """웹툰 플랫폼 코드와 웹툰 ID로부터 스크레퍼를 인스턴스화하여 반환합니다. cookie, bearer 등의 추가적인 설정이 필요할 수도 있습니다."""
 
-    Scraper: type[Scraper] | None = platforms.get(webtoon_platform.lower())  # type: ignore
+    Scraper: type[Scraper] | None = get_platform(webtoon_platform.lower())  # type: ignore
     if Scraper is None:
         raise ValueError(f"Invalid webtoon platform: {webtoon_platform}")
     return Scraper._from_string(webtoon_id)
@@ -216,7 +463,7 @@ def instantiate(webtoon_platform: str, webtoon_id: str) -> Scraper:
 def instantiate_from_url(webtoon_url: str) -> Scraper:
     """웹툰 URL로부터 자동으로 알맞은 스크래퍼를 인스턴스화합니다. cookie, bearer 등의 추가적인 설정이 필요할 수 있습니다."""
 
-    for PlatformClass in platforms.values():
+    for PlatformClass in load_platforms().values():
         try:
             platform = PlatformClass.from_url(webtoon_url)
         except URLError:
@@ -257,7 +504,115 @@ def setup_instance(
 
 
 async def parse_download(args: argparse.Namespace) -> None:
+    if args.viewer and args.export:
+        raise ValueError("--viewer can't be used with --export since exported episode directories are removed.")
+
+    if args.events:
+        from WebtoonScraper.events import EventRecorder
+
+        event_recorder = EventRecorder(args.events)
+    else:
+        event_recorder = None
+
+    if args.metrics_file or args.metrics_port:
+        from WebtoonScraper.metrics import MetricsCollector
+
+        metrics_collector = MetricsCollector(args.metrics_file)
+        if args.metrics_port:
+            metrics_collector.serve(args.metrics_port)
+    else:
+        metrics_collector = None
+
+    if args.record:
+        from WebtoonScraper.recording import HTTPRecorder
+
+        http_archive = HTTPRecorder(args.record, strip_credentials=not args.record_credentials)
+    elif args.replay:
+        from WebtoonScraper.recording import HTTPReplayer
+
+        http_archive = HTTPReplayer(args.replay)
+    else:
+        http_archive = None
+
+    if args.lease or args.claim_dir:
+        from WebtoonScraper.leases import LeaseManager
+
+        lease_manager = LeaseManager(args.lease_ttl)
+    else:
+        lease_manager = None
+
+    if args.max_bandwidth:
+        from WebtoonScraper.bandwidth import BandwidthLimiter
+        from WebtoonScraper.scrapers import Scraper
+
+        rate, schedule = args.max_bandwidth
+        previous_bandwidth_limiter = Scraper.bandwidth_limiter
+        Scraper.bandwidth_limiter = BandwidthLimiter(rate, schedule=schedule)
+
+    if args.hedge:
+        from WebtoonScraper.hedging import HedgePolicy
+        from WebtoonScraper.scrapers import Scraper
+
+        previous_hedge_policy = Scraper.hedge_policy
+        Scraper.hedge_policy = HedgePolicy(budget_ratio=args.hedge_budget)
+
+    if args.adaptive_concurrency is not None:
+        from WebtoonScraper.adaptive import AdaptiveController
+
+        concurrency_controller = AdaptiveController(maximum=args.adaptive_concurrency or None)
+    else:
+        concurrency_controller = None
+
+    phase_timer = profiler = stack_sampler = None
+    if args.profile or args.profile_output or args.profile_collapsed:
+        from WebtoonScraper.profiling import PhaseTimer, StackSampler
+
+        phase_timer = PhaseTimer()
+        if args.profile_output:
+            import cProfile
+
+            profiler = cProfile.Profile()
+            profiler.enable()
+        if args.profile_collapsed:
+            stack_sampler = StackSampler()
+            stack_sampler.start()
+
+    try:
+        await _download_webtoons(args, event_recorder, metrics_collector, phase_timer, http_archive, lease_manager, concurrency_controller)
+    finally:
+        if lease_manager:
+            lease_manager.close()
+        if http_archive:
+            http_archive.close()
+        if event_recorder:
+            event_recorder.close()
+        if metrics_collector:
+            metrics_collector.close()
+        if profiler:
+            profiler.disable()
+            profiler.dump_stats(args.profile_output)
+            logger.info(f"Profile is saved to {args.profile_output}. Inspect it with `python -m pstats {args.profile_output}` or snakeviz.")
+        if stack_sampler:
+            stack_sampler.stop()
+            stack_sampler.write_collapsed(args.profile_collapsed)
+            logger.info(f"Collapsed stacks are saved to {args.profile_collapsed}. Render it with flamegraph.pl or speedscope.")
+        if phase_timer:
+            phase_timer.print_table()
+        # 클래스 변수는 프로세스 전체에 남으니 같은 프로세스에서 다시 호출될 때 영향을 주지 않도록 되돌림
+        if args.max_bandwidth:
+            Scraper.bandwidth_limiter = previous_bandwidth_limiter
+        if args.hedge:
+            Scraper.hedge_policy = previous_hedge_policy
+
+
+async def _download_webtoons(args: argparse.Namespace, event_recorder, metrics_collector, phase_timer, http_archive, lease_manager, concurrency_controller) -> None:
     for webtoon_id in args.webtoon_ids:
+        claim = scraper = None
+        if args.claim_dir:
+            claim = lease_manager.claim(args.claim_dir, f"{args.platform}-{webtoon_id}")
+            if claim is None:
+                logger.info(f"Webtoon {webtoon_id} is claimed or finished by another worker. Skipping.")
+                continue
         try:
             scraper = setup_instance(
                 webtoon_id,
@@ -267,18 +622,14 @@ async def parse_download(args: argparse.Namespace) -> None:
                 options=dict(args.option or {}),
                 existing_episode_policy=args.existing_episode,
             )
+            if http_archive:
+                http_archive.register(scraper)
+            if concurrency_controller:
+                concurrency_controller.register(scraper)
 
+            scraper.low_memory = args.low_memory
             if args.list_episodes:
-                await scraper.fetch_all()
-                table = Table(show_header=True, header_style="bold blue", box=None)
-                table.add_column("Episode number [dim](ID)[/dim]", width=12)
-                table.add_column("Episode Title", style="bold")
-                for i, (episode_id, episode_title) in enumerate(zip(scraper.episode_ids, scraper.episode_titles, strict=True), 1):
-                    table.add_row(
-                        f"[red][bold]{i:04d}[/bold][/red] [dim]({episode_id})[/dim]",
-                        str(episode_title),
-                    )
-                console.print(table)
+                await _list_episodes(scraper, args.list_format)
                 return
 
             if args.no_progress_bar:
@@ -292,29 +643,212 @@ async def parse_download(args: argparse.Namespace) -> None:
             if hasattr(scraper, "thread_number"):
                 scraper.thread_number = args.thread_number  # type: ignore
 
+            processors = []
+            if args.concat is not None:
+                from WebtoonScraper.processing import ImageConcatenator
+
+                processors.append(ImageConcatenator(args.concat or None, max_workers=args.thread_number))
+            if args.transcode:
+                from WebtoonScraper.processing import ImageTranscoder
+
+                transcoder = ImageTranscoder(
+                    args.transcode,
+                    args.transcode_quality,
+                    keep_originals=args.keep_originals,
+                    max_workers=args.thread_number,
+                )
+                # 변환은 원본 이미지를 지우거나 옮기니 같은 에피소드의 이어붙이기가 끝난 뒤에 실행함
+                transcoder.dependencies.extend(processors)
+                processors.append(transcoder)
+            for processor in processors:
+                processor.register(scraper)
+            if args.viewer:
+                from WebtoonScraper.webtoon_viewer import WebtoonViewerBuilder
+
+                WebtoonViewerBuilder(max_workers=args.thread_number).register(scraper)
+            if args.export:
+                from WebtoonScraper.export import ArchiveExporter
+
+                exporter = ArchiveExporter(args.export, max_workers=args.thread_number)
+                # 에피소드 디렉토리를 지우기 전에 이어붙이기와 변환이 끝나야 함
+                exporter.dependencies.extend(processors)
+                exporter.register(scraper)
+            if event_recorder:
+                event_recorder.register(scraper)
+            if metrics_collector:
+                metrics_collector.register(scraper)
+            scraper.phase_timer = phase_timer
+            scraper.lease_manager = lease_manager
+            scraper.stream_listing = args.stream_listing
+
             scraper.information_to_exclude = args.excluding
             scraper.previous_status_to_skip = args.skip_status
             scraper.download_range = args.range
             await scraper.async_download_webtoon()
+            if claim:
+                lease_manager.complete(claim)
+        except LeaseHeldError as exc:
+            # 다른 작업자가 이미 다운로드하고 있으니 오류가 아님
+            logger.warning(str(exc))
         except Exception as exc:
             if args.suppress_error_on_batch:
                 logger.error(f"Error occurred while downloading {webtoon_id}", exc_info=exc)
                 continue
             else:
                 raise
+        finally:
+            if metrics_collector and scraper is not None:
+                metrics_collector.unregister(scraper)
+            if claim:
+                lease_manager.release(claim)
+
+
+async def _list_episodes(scraper: Scraper, list_format: str) -> None:
+    """에피소드 목록을 불러오는 대로 출력합니다."""
+    # 연령 제한 등은 웹툰 정보를 불러올 때 확인됨
+    with contextlib.suppress(UseFetchEpisode):
+        await scraper.fetch_webtoon_information()
+
+    if list_format == "ndjson":
+        from WebtoonScraper import json_codec
+
+        async for episode in scraper.aiter_episodes():
+            record = dict(no=episode.no + 1, id=episode.id, title=episode.title, charged=episode.charged)
+            sys.stdout.write(json_codec.dumps(record, default=str) + "\n")
+            sys.stdout.flush()
+        return
+
+    from rich.table import Table
+
+    from WebtoonScraper.base import console
+
+    # 표는 모든 행이 모여야 출력되기 때문에 열 너비를 고정한 표를 행마다 출력함
+    show_header = True
+    async for episode in scraper.aiter_episodes():
+        table = Table(show_header=show_header, header_style="bold blue", box=None)
+        table.add_column("Episode number [dim](ID)[/dim]", width=12)
+        table.add_column("Episode Title", style="bold")
+        table.add_row(
+            f"[red][bold]{episode.no + 1:04d}[/bold][/red] [dim]({episode.id})[/dim]",
+            str(episode.title),
+        )
+        console.print(table)
+        show_header = False
+
+
+def parse_concat(args: argparse.Namespace) -> None:
+    from WebtoonScraper.processing import concat_webtoon, iter_webtoon_directories
+
+    webtoon_directories = list(iter_webtoon_directories(args.webtoon_directories))
+    if args.target_directory and len(webtoon_directories) > 1:
+        raise ValueError("--target-directory can't be used with multiple webtoon directories.")
+    for webtoon_directory in webtoon_directories:
+        target_directory = concat_webtoon(
+            webtoon_directory,
+            args.target_directory,
+            args.page_height,
+            max_workers=args.thread_number,
+            image_format=args.page_format,
+        )
+        logger.info(f"Concatenated webtoon is stored at {target_directory}")
+
+
+def parse_transcode(args: argparse.Namespace) -> None:
+    from WebtoonScraper.processing import format_saving, iter_webtoon_directories, transcode_webtoon
+
+    for webtoon_directory in iter_webtoon_directories(args.webtoon_directories):
+        before, after = transcode_webtoon(
+            webtoon_directory,
+            args.format,
+            args.quality,
+            keep_originals=args.keep_originals,
+            max_workers=args.thread_number,
+        )
+        logger.info(f"{webtoon_directory.name} transcoded ({format_saving(before, after)})")
+
+
+def parse_viewer(args: argparse.Namespace) -> None:
+    from WebtoonScraper.processing import iter_webtoon_directories
+    from WebtoonScraper.webtoon_viewer import build_viewer
+
+    for webtoon_directory in iter_webtoon_directories(args.webtoon_directories):
+        index_path = build_viewer(
+            webtoon_directory,
+            thumbnails=not args.no_thumbnails,
+            max_workers=args.thread_number,
+            rebuild=args.rebuild,
+        )
+        logger.info(f"Viewer is built at {index_path}")
+
+
+def parse_export(args: argparse.Namespace) -> None:
+    from WebtoonScraper.export import export_webtoon
+    from WebtoonScraper.processing import iter_webtoon_directories
+
+    webtoon_directories = list(iter_webtoon_directories(args.webtoon_directories))
+    if args.target_directory and len(webtoon_directories) > 1 and not args.single:
+        raise ValueError("--target-directory can't be used with multiple webtoon directories unless --single is set.")
+    for webtoon_directory in webtoon_directories:
+        export_webtoon(
+            webtoon_directory,
+            args.format,
+            args.target_directory,
+            single_archive=args.single,
+            max_workers=args.thread_number,
+        )
+
+
+async def run_command(args: argparse.Namespace) -> None:
+    match args.subparser_name:
+        case "download":
+            await parse_download(args)
+        case "concat":
+            parse_concat(args)
+        case "transcode":
+            parse_transcode(args)
+        case "export":
+            parse_export(args)
+        case "viewer":
+            parse_viewer(args)
+        case unknown_subparser:
+            raise NotImplementedError(f"{unknown_subparser} is not a valid command.")
 
 
 def main(argv=None, *, propagate_keyboard_interrupt: bool = False) -> Literal[0, 1]:
+    # --help, --version, --mock은 asyncio를 불러오기 전에 처리함
+    args = _parse_args(argv)
+    if args.mock:
+        return _print_mock_result(args)
+
+    import asyncio
+
     if propagate_keyboard_interrupt:
-        return asyncio.run(async_main(argv))
+        return asyncio.run(_run_parsed(args))
     else:
         try:
-            return asyncio.run(async_main(argv))
+            return asyncio.run(_run_parsed(args))
         except KeyboardInterrupt:
             logger.error("Aborted")
             return 1
 
 
+def _parse_args(argv) -> argparse.Namespace:
+    # 다른 곳에서 이미 version 커맨드를 추가했다면 따로 추가하지 않음
+    with contextlib.suppress(argparse.ArgumentError):
+        _add_version(parser)
+    args = parser.parse_args(argv)  # 주어진 argv가 None이면 sys.argv[1:]을 기본값으로 삼음
+
+    # 어떠한 command도 입력하지 않았을 경우 도움말을 표시함.
+    if not hasattr(args, "subparser_name"):
+        args = parser.parse_args(["--help"])
+    return args
+
+
+def _print_mock_result(args: argparse.Namespace) -> Literal[0]:
+    print("Arguments:", str(args).removeprefix("Namespace(").removesuffix(")"))
+    return 0
+
+
 async def async_main(argv=None) -> Literal[0, 1]:
     """모든 CLI 명령어를 처리하는 함수입니다.
 
@@ -328,43 +862,32 @@ async def async_main(argv=None) -> Literal[0, 1]:
         이 함수는 KeyboardInterrupt를 제외한 어떠한 오류도 발생시키지 않습니다.
         그 대신 성공했을 때는 0을, 실패했을 때에는 1을 반환합니다.
     """
-    # 다른 곳에서 이미 version 커맨드를 추가했다면 따로 추가하지 않음
-    with contextlib.suppress(argparse.ArgumentError):
-        _add_version(parser)
-    args = parser.parse_args(argv)  # 주어진 argv가 None이면 sys.argv[1:]을 기본값으로 삼음
-
-    # 어떠한 command도 입력하지 않았을 경우 도움말을 표시함.
-    if not hasattr(args, "subparser_name"):
-        args = parser.parse_args(["--help"])
+    args = _parse_args(argv)
 
     # --mock 인자가 포함된 경우 실제 다운로드까지 가지 않고 표현된 인자를 보여주고 종료.
     if args.mock:
-        print("Arguments:", str(args).removeprefix("Namespace(").removesuffix(")"))
-        return 0
+        return _print_mock_result(args)
+    return await _run_parsed(args)
 
+
+async def _run_parsed(args: argparse.Namespace) -> Literal[0, 1]:
     if args.verbose:
         logger.setLevel(logging.DEBUG)
 
     if not args.format_error:
-        match args.subparser_name:
-            case "download":
-                await parse_download(args)
-            case unknown_subparser:
-                raise NotImplementedError(f"{unknown_subparser} is not a valid command.")
+        await run_command(args)
         return 0
     else:
         try:
-            match args.subparser_name:
-                case "download":
-                    await parse_download(args)
-                case unknown_subparser:
-                    raise NotImplementedError(f"{unknown_subparser} is not a valid command.")
+            await run_command(args)
         except KeyboardInterrupt:
             logger.error("Aborted")
             return 1
         except SystemExit as exc:
             return exc.code  # type: ignore
         except BaseException:
+            from WebtoonScraper.base import console
+
             console.print_exception()
             return 1
         else:
@@ -0,0 +1,275 @@
+"""응답 지연 시간과 오류에 따라 동시 요청 수와 호스트별 타임아웃을 조절합니다.
+
+동시 요청 수는 AIMD(additive increase, multiplicative decrease) 방식으로 조절됩니다.
+
+* 요청이 정상적으로 끝날 때마다 동시 요청 수를 `1 / limit`씩 늘립니다. 즉, 대략 한도만큼의 요청이 성공할 때마다 1씩 늘어납니다.
+* 429, 5xx 응답이나 타임아웃이 발생하면 동시 요청 수를 `decrease`배로 줄입니다.
+    동시에 진행되던 요청들이 한꺼번에 실패하며 한도가 바닥까지 떨어지지 않도록 `cooldown`초 안에는 한 번만 줄입니다.
+* 최근 `window`개 응답의 p95 지연 시간이 지금까지 관측된 가장 낮은 p95의 `latency_tolerance`배를 넘어도 줄입니다.
+
+타임아웃은 호스트별로 최근 응답 지연 시간의 p95에 `timeout_multiplier`를 곱한 값을 읽기 타임아웃으로 사용하며,
+`min_timeout`과 `max_timeout` 사이로 제한됩니다. 응답이 `timeout_samples`개 모이기 전에는 클라이언트의 기본 타임아웃을 사용합니다.
+
+둘 다 httpx의 transport 단계에서 동작하기 때문에 httpc가 내부적으로 재시도한 요청들도 모두 반영됩니다.
+한도가 바뀌면 `concurrency_adjusted` 콜백이 호출되며, 기본적으로 로그가 남고 MetricsCollector에도 기록됩니다.
+
+```python
+from WebtoonScraper.adaptive import AdaptiveController
+
+controller = AdaptiveController()
+controller.register(scraper)
+await scraper.async_download_webtoon()
+```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from typing import TYPE_CHECKING, NamedTuple
+
+import httpx
+
+from .base import logger
+from .recording import _replace_transports
+
+if TYPE_CHECKING:
+    from .scrapers import Scraper
+
+__all__ = ["AdaptiveController", "AdaptiveLimiter", "Adjustment"]
+
+
+def _percentile(values, percentile: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, math.ceil(len(ordered) * percentile) - 1)]
+
+
+class Adjustment(NamedTuple):
+    """동시 요청 수의 변경 내역입니다. reason은 `healthy`, `latency`, `timeout`, `status_429`, `status_503` 등입니다."""
+
+    previous: int
+    limit: int
+    reason: str
+
+    @property
+    def direction(self) -> str:
+        return "increase" if self.limit > self.previous else "decrease"
+
+
+class AdaptiveLimiter:
+    """한도가 바뀌는 `asyncio.Semaphore`입니다. `async with`로 사용합니다.
+
+    한도가 줄어들더라도 이미 진행 중인 요청은 취소되지 않으며, 진행 중인 요청 수가 새 한도 아래로 내려갈 때까지 새 요청이 기다립니다.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int = 1,
+        maximum: int = 10,
+        *,
+        decrease: float = 0.5,
+        latency_tolerance: float = 2.0,
+        window: int = 50,
+        cooldown: float = 1.0,
+    ) -> None:
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.window = window
+        self.cooldown = cooldown
+        self.in_flight = 0
+        self.baseline_p95: float | None = None
+        self._limit = float(min(maximum, max(minimum, initial)))
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._decreased_at = -math.inf
+        self._condition = asyncio.Condition()
+
+    @property
+    def limit(self) -> int:
+        return int(self._limit)
+
+    async def __aenter__(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+
+    async def __aexit__(self, *_) -> None:
+        async with self._condition:
+            self.in_flight -= 1
+            self._condition.notify_all()
+
+    def on_success(self, latency: float) -> Adjustment | None:
+        """정상적인 응답을 반영합니다. 한도가 바뀌었다면 변경 내역을 반환합니다."""
+        latencies = self._latencies
+        latencies.append(latency)
+        if len(latencies) == self.window:
+            p95 = _percentile(latencies, 0.95)
+            latencies.clear()
+            if self.baseline_p95 is not None and p95 > self.baseline_p95 * self.latency_tolerance:
+                return self._decrease("latency")
+            self.baseline_p95 = p95 if self.baseline_p95 is None else min(self.baseline_p95, p95)
+
+        previous = self.limit
+        self._limit = min(self.maximum, self._limit + 1 / self._limit)
+        return Adjustment(previous, self.limit, "healthy") if self.limit != previous else None
+
+    def on_failure(self, reason: str) -> Adjustment | None:
+        """429, 5xx 응답이나 타임아웃을 반영합니다. 한도가 바뀌었다면 변경 내역을 반환합니다."""
+        return self._decrease(reason)
+
+    def _decrease(self, reason: str) -> Adjustment | None:
+        now = time.monotonic()
+        if now - self._decreased_at < self.cooldown:
+            return None
+        self._decreased_at = now
+        previous = self.limit
+        self._limit = max(self.minimum, self._limit * self.decrease)
+        # 한도가 바뀌었으니 이전 한도에서 관측된 지연 시간은 버림
+        self._latencies.clear()
+        return Adjustment(previous, self.limit, reason) if self.limit != previous else None
+
+
+class _AdaptiveTransport(httpx.AsyncBaseTransport):
+    def __init__(self, transport: httpx.AsyncBaseTransport, controller: AdaptiveController, scraper: Scraper) -> None:
+        self.transport = transport
+        self.controller = controller
+        self.scraper = scraper
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        if (read_timeout := self.controller.host_timeouts.get(host)) is not None:
+            request.extensions["timeout"] = {**request.extensions.get("timeout", {}), "read": read_timeout}
+
+        start = time.perf_counter()
+        try:
+            response = await self.transport.handle_async_request(request)
+        except httpx.TimeoutException:
+            await self.controller._report(self.scraper, "timeout")
+            raise
+        latency = time.perf_counter() - start
+
+        status = response.status_code
+        if status == 429 or status >= 500:
+            await self.controller._report(self.scraper, f"status_{status}")
+        else:
+            self.controller._observe_latency(host, latency)
+            await self.controller._report(self.scraper, None, latency)
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class AdaptiveController:
+    """스크래퍼의 동시 요청 수와 호스트별 타임아웃을 조절합니다.
+
+    여러 스크래퍼에 등록할 수 있습니다. 호스트별 지연 시간은 모든 스크래퍼가 공유하며,
+    동시 요청 수는 스크래퍼마다 따로 조절되지만 다음 다운로드는 마지막으로 조절된 한도에서 시작합니다.
+
+    `maximum`이 None이라면 스크래퍼의 `max_concurrent_requests`를 최대 한도로 사용하고,
+    값이 주어진다면 스크래퍼의 `max_concurrent_requests`를 그 값으로 바꿉니다.
+    `initial`이 None이라면 최대 한도의 절반에서 시작합니다.
+    """
+
+    def __init__(
+        self,
+        minimum: int = 1,
+        maximum: int | None = None,
+        initial: int | None = None,
+        *,
+        decrease: float = 0.5,
+        latency_tolerance: float = 2.0,
+        window: int = 50,
+        cooldown: float = 1.0,
+        min_timeout: float = 2.0,
+        max_timeout: float = 30.0,
+        timeout_multiplier: float = 4.0,
+        timeout_samples: int = 20,
+    ) -> None:
+        self.minimum = minimum
+        self.maximum = maximum
+        self.initial = initial
+        self.decrease = decrease
+        self.latency_tolerance = latency_tolerance
+        self.window = window
+        self.cooldown = cooldown
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.timeout_multiplier = timeout_multiplier
+        self.timeout_samples = timeout_samples
+        self.host_timeouts: dict[str, float] = {}
+        """호스트별로 현재 사용하는 읽기 타임아웃(초)입니다."""
+        self._host_latencies: dict[str, deque[float]] = {}
+        self._host_counts: dict[str, int] = {}
+        self._last_limit: int | None = None
+
+    # MARK: REGISTRATION
+
+    def register(self, scraper: Scraper) -> None:
+        if self.maximum is not None:
+            scraper.max_concurrent_requests = self.maximum
+        scraper.concurrency_controller = self
+        _replace_transports(scraper, lambda transport: _AdaptiveTransport(transport, self, scraper))
+
+    def unregister(self, scraper: Scraper) -> None:
+        if scraper.concurrency_controller is self:
+            scraper.concurrency_controller = None
+        _replace_transports(scraper, lambda transport: transport.transport if isinstance(transport, _AdaptiveTransport) else transport)
+
+    def close(self) -> None:
+        pass
+
+    def create_limiter(self, scraper: Scraper) -> AdaptiveLimiter:
+        """스크래퍼의 다운로드에 사용할 limiter를 만듭니다. 스크래퍼가 다운로드를 시작할 때마다 호출됩니다."""
+        maximum = scraper.max_concurrent_requests
+        initial = self._last_limit or self.initial or max(1, maximum // 2)
+        return AdaptiveLimiter(
+            initial,
+            self.minimum,
+            maximum,
+            decrease=self.decrease,
+            latency_tolerance=self.latency_tolerance,
+            window=self.window,
+            cooldown=self.cooldown,
+        )
+
+    # MARK: SIGNALS
+
+    async def _report(self, scraper: Scraper, failure: str | None, latency: float = 0) -> None:
+        limiter = getattr(scraper, "_request_limiter", None)
+        if not isinstance(limiter, AdaptiveLimiter):
+            return
+        adjustment = limiter.on_success(latency) if failure is None else limiter.on_failure(failure)
+        if adjustment is None:
+            return
+        self._last_limit = adjustment.limit
+        await scraper.callbacks.async_callback(
+            "concurrency_adjusted",
+            scraper.callbacks.create(
+                "Concurrency limit {direction}d from {previous} to {limit} ({reason}).",
+                level="debug" if adjustment.direction == "increase" else "info",
+            ),
+            previous=adjustment.previous,
+            limit=adjustment.limit,
+            reason=adjustment.reason,
+            direction=adjustment.direction,
+        )
+
+    def _observe_latency(self, host: str, latency: float) -> None:
+        latencies = self._host_latencies.get(host)
+        if latencies is None:
+            latencies = self._host_latencies[host] = deque(maxlen=max(self.timeout_samples, 100))
+        latencies.append(latency)
+        count = self._host_counts[host] = self._host_counts.get(host, 0) + 1
+        # 매 응답마다 정렬하지 않도록 timeout_samples개마다 다시 계산함
+        if count % self.timeout_samples:
+            return
+        p95 = _percentile(latencies, 0.95)
+        timeout = round(min(self.max_timeout, max(self.min_timeout, p95 * self.timeout_multiplier)), 1)
+        if self.host_timeouts.get(host) != timeout:
+            self.host_timeouts[host] = timeout
+            logger.debug(f"Read timeout for {host} is set to {timeout}s (p95 latency {p95:.3f}s).")
@@ -0,0 +1,144 @@
+"""프로세스 전체의 다운로드 대역폭을 제한하는 token bucket입니다.
+
+`Scraper.bandwidth_limiter`에 설정하면 이미지와 배경음악 등을 받을 때 실제로 전송된 바이트 수만큼 토큰을 소비합니다.
+클래스 변수로 설정하면 프로세스의 모든 스크래퍼, 모든 동시 요청이 하나의 제한을 공유합니다.
+
+```python
+from WebtoonScraper.bandwidth import BandwidthLimiter
+from WebtoonScraper.scrapers import Scraper
+
+Scraper.bandwidth_limiter = BandwidthLimiter(2_000_000)  # 초당 2MB
+Scraper.bandwidth_limiter.rate = 500_000  # 다운로드 도중에도 바꿀 수 있음
+```
+
+* 이벤트 루프에 묶인 객체를 사용하지 않기 때문에 여러 이벤트 루프나 스레드에서 함께 사용할 수 있습니다.
+* 기다리는 작업들은 최대 `_MAX_SLEEP`초마다 깨어나 다시 확인하기 때문에 제한을 바꾸면 곧바로 반영됩니다.
+* `schedule`을 설정하면 시간대에 따라 제한이 자동으로 바뀝니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import threading
+import time
+from datetime import datetime
+from datetime import time as dt_time
+
+__all__ = ["BandwidthLimiter", "parse_bandwidth", "parse_bandwidth_schedule"]
+
+type BandwidthSchedule = list[tuple[dt_time, dt_time, float | None]]
+
+_MAX_SLEEP = 0.25
+_MIN_BURST = 16 * 1024
+_SCHEDULE_CHECK_INTERVAL = 1.0
+_UNITS = {"": 1, "k": 1000, "m": 1000**2, "g": 1000**3, "ki": 1024, "mi": 1024**2, "gi": 1024**3}
+
+
+class BandwidthLimiter:
+    """초당 `rate` 바이트를 넘지 않도록 전송을 늦추는 token bucket입니다.
+
+    `burst`는 쉬고 있던 뒤에 한 번에 보낼 수 있는 최대 바이트 수로, 기본값은 0.25초 분량입니다.
+    `rate`가 None이면 제한하지 않습니다.
+    """
+
+    def __init__(self, rate: float | None = None, burst: float | None = None, schedule: BandwidthSchedule | None = None) -> None:
+        self._lock = threading.Lock()
+        self._rate = rate
+        self._burst_setting = burst
+        self._tokens = self._burst
+        self._updated_at = time.monotonic()
+        self.schedule = schedule
+        """`(시작 시각, 끝 시각, 제한)`의 리스트입니다. 현재 시각에 해당하는 항목이 없다면 생성될 때의 `rate`를 사용합니다."""
+        self._default_rate = rate
+        self._schedule_checked_at = -_SCHEDULE_CHECK_INTERVAL
+
+    @property
+    def rate(self) -> float | None:
+        return self._rate
+
+    @rate.setter
+    def rate(self, rate: float | None) -> None:
+        with self._lock:
+            self._refill(time.monotonic())
+            self._rate = rate
+            self._default_rate = rate
+            self._tokens = min(self._tokens, self._burst)
+
+    @property
+    def _burst(self) -> float:
+        if self._burst_setting is not None:
+            return self._burst_setting
+        return max(_MIN_BURST, (self._rate or 0) / 4)
+
+    def _refill(self, now: float) -> None:
+        if self._rate is not None:
+            self._tokens = min(self._burst, self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+    def _apply_schedule(self, now: float) -> None:
+        if self.schedule is None or now - self._schedule_checked_at < _SCHEDULE_CHECK_INTERVAL:
+            return
+        self._schedule_checked_at = now
+        current = datetime.now().time()
+        for start, end, rate in self.schedule:
+            # 자정을 넘어가는 구간(예: 22:00-06:00)도 지원함
+            if (start <= current < end) if start <= end else (current >= start or current < end):
+                break
+        else:
+            rate = self._default_rate
+        if rate != self._rate:
+            self._rate = rate
+            self._tokens = min(self._tokens, self._burst)
+
+    async def consume(self, amount: int) -> None:
+        """amount 바이트를 전송할 수 있을 때까지 기다립니다."""
+        if amount <= 0 or (self._rate is None and self.schedule is None):
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                self._apply_schedule(now)
+                if self._rate is None:
+                    return
+                # burst보다 큰 청크도 통과할 수 있도록 burst만큼 모이면 보내고 나머지는 빚으로 남김
+                needed = min(amount, self._burst)
+                if self._tokens >= needed:
+                    self._tokens -= amount
+                    return
+                wait = (needed - self._tokens) / self._rate
+            await asyncio.sleep(min(wait, _MAX_SLEEP))
+
+
+def parse_bandwidth(text: str) -> float | None:
+    """`500K`, `2M`, `1.5MiB/s`처럼 쓰인 대역폭을 초당 바이트 수로 바꿉니다. `0`이나 `unlimited`는 None입니다.
+
+    K, M, G는 1000의 거듭제곱이고 Ki, Mi, Gi는 1024의 거듭제곱입니다.
+    """
+    text = text.strip().lower()
+    if text in ("", "0", "none", "unlimited"):
+        return None
+    matched = re.fullmatch(r"(?P<number>\d+(?:\.\d+)?)\s*(?P<unit>[kmg]i?)?b?(?:/s)?", text)
+    if not matched:
+        raise ValueError(f"Invalid bandwidth: {text!r}. Use a number of bytes per second like 500K, 2M or 1.5MiB.")
+    return float(matched["number"]) * _UNITS[matched["unit"] or ""]
+
+
+def parse_bandwidth_schedule(text: str) -> tuple[float | None, BandwidthSchedule | None]:
+    """`--max-bandwidth`의 값을 `(기본 제한, 시간대별 제한)`으로 바꿉니다.
+
+    `2M`처럼 제한만 쓰거나, `09:00-18:00=500K,22:00-06:00=unlimited,2M`처럼 시간대별 제한과 기본 제한을 쉼표로 구분해 쓸 수 있습니다.
+    """
+    default: float | None = None
+    schedule: BandwidthSchedule = []
+    for part in text.split(","):
+        period, sep, value = part.rpartition("=")
+        if not sep:
+            default = parse_bandwidth(value)
+            continue
+        start, dash, end = period.partition("-")
+        if not dash:
+            raise ValueError(f"Invalid time range: {period!r}. Use a range like 09:00-18:00.")
+        schedule.append((dt_time.fromisoformat(start.strip()), dt_time.fromisoformat(end.strip()), parse_bandwidth(value)))
+    return default, schedule or None
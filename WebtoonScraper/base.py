@@ -1,26 +1,83 @@
-"""WebtoonScraper의 기본 정보들을 모아놓은 모듈입니다. circular import를 피하기 위해 필요합니다."""
+"""WebtoonScraper의 기본 정보들을 모아놓은 모듈입니다. circular import를 피하기 위해 필요합니다.
+
+CLI가 빠르게 시작할 수 있도록 이 모듈은 rich나 httpx 등의 무거운 모듈을 불러오지 않습니다.
+`console`과 로그 handler는 처음 사용될 때 rich를 불러옵니다.
+"""
 
 from __future__ import annotations
 
+import importlib
 import logging
 import os
 from typing import TYPE_CHECKING
 
-from rich.console import Console
-from rich.logging import RichHandler
-
 if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.logging import RichHandler
+
     from WebtoonScraper.scrapers import Scraper
 
+    console: Console
+
 __version__ = "5.13.0"
 platforms: dict[str, type[Scraper]] = {}
-console = Console()
+"""불러온 플랫폼들입니다. 스크래퍼 클래스가 정의될 때 자동으로 등록됩니다."""
+lazy_platforms: dict[str, str] = {
+    "naver_webtoon": "WebtoonScraper.scrapers._naver_webtoon",
+}
+"""플랫폼 코드와 해당 플랫폼의 스크래퍼가 정의된 모듈입니다. 모듈은 `get_platform()` 등으로 플랫폼이 필요해질 때 불러옵니다."""
+
+
+def __getattr__(name: str):
+    if name == "console":
+        from rich.console import Console
+
+        global console
+        console = Console()
+        return console
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class _LazyRichHandler(logging.Handler):
+    """처음으로 로그를 출력할 때 RichHandler를 만드는 handler입니다."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._handler: RichHandler | None = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if self._handler is None:
+            from rich.logging import RichHandler
+
+            self._handler = RichHandler(show_time=False, show_path=False, markup=True)
+        self._handler.handle(record)
+
 
 logger = logging.getLogger("WebtoonScraper")
-logger.addHandler(RichHandler(show_time=False, show_path=False, markup=True))
+logger.addHandler(_LazyRichHandler())
 logger.setLevel(logging.INFO)
 
 
+def platform_names() -> list[str]:
+    """스크래퍼를 불러오지 않고 사용할 수 있는 모든 플랫폼 코드를 반환합니다."""
+    return list(dict.fromkeys([*lazy_platforms, *platforms]))
+
+
+def get_platform(platform_name: str) -> type[Scraper] | None:
+    """플랫폼 코드에 해당하는 스크래퍼를 반환합니다. 아직 불러오지 않았다면 해당 모듈을 불러옵니다."""
+    if (scraper := platforms.get(platform_name)) is None and (module := lazy_platforms.get(platform_name)):
+        importlib.import_module(module)
+        scraper = platforms.get(platform_name)
+    return scraper
+
+
+def load_platforms() -> dict[str, type[Scraper]]:
+    """모든 플랫폼의 스크래퍼를 불러온 뒤 `platforms`를 반환합니다."""
+    for module in lazy_platforms.values():
+        importlib.import_module(module)
+    return platforms
+
+
 def get_default_thread_number() -> int:
     # 우선 THREAD_NUMBER environ이 있는지 확인
     # 이 값이 계속 변할 수 있기에 정확한 값을 불러오려면
@@ -2,16 +2,18 @@
 
 from __future__ import annotations
 
-import json
+import gzip
 import os
 import re
 import typing
 from collections import defaultdict
+from collections.abc import Iterator, Mapping
 from contextlib import suppress
 from pathlib import Path
 
 from fieldenum import Variant, fieldenum
 
+from WebtoonScraper import json_codec
 from WebtoonScraper.base import logger
 
 PathOrStr = str | Path
@@ -158,16 +160,58 @@ def _directories_and_files_of(
     return sorted(directories), sorted(files)
 
 
+INFORMATION_NAME = "information.json"
+SIDECAR_CATEGORIES = ("extra",)
+"""information.json과 따로 저장되는 카테고리들입니다."""
+
+
+class InformationSidecar(Mapping):
+    """information.json과 따로 저장된 카테고리입니다. 처음 접근할 때 파일을 읽습니다."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._data: dict | None = None
+
+    def _load(self) -> dict:
+        if self._data is None:
+            try:
+                data = self.path.read_bytes()
+                self._data = json_codec.loads(gzip.decompress(data) if self.path.suffix == ".gz" else data)
+            except Exception as exc:
+                logger.warning(f"Failed to load {self.path.name}: {exc}")
+                self._data = {}
+        return self._data  # type: ignore
+
+    def __getitem__(self, key: str):
+        return self._load()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._load())
+
+    def __len__(self) -> int:
+        return len(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._data is not None else "not loaded"
+        return f"<{type(self).__name__} {self.path.name} ({state})>"
+
+
 def load_information_json(directory: Path) -> dict | None:
-    information = directory / "information.json"
+    """information.json을 불러옵니다.
+
+    따로 저장된 카테고리(`sidecars`)는 InformationSidecar로 바뀌어 해당 카테고리에 처음 접근할 때 읽힙니다.
+    모든 정보가 information.json 하나에 저장되어 있는 예전 형식도 그대로 불러올 수 있습니다.
+    """
+    information = directory / INFORMATION_NAME
     with suppress(Exception):
-        with open(information, encoding="utf-8") as f:
-            return json.load(f)
+        data = json_codec.loads(information.read_bytes())
+        for category, file_name in data.pop("sidecars", {}).items():
+            data[category] = InformationSidecar(directory / file_name)
+        return data
 
     snapshot = directory.parent / f"{directory.name}.snapshots"
     with suppress(Exception):
-        with open(snapshot, encoding="utf-8") as f:
-            data = json.load(f)
+        data = json_codec.loads(snapshot.read_bytes())
         latest_snapshot_no = data["selected_snapshots"][-1]
         snapshot = data["snapshots"][latest_snapshot_no]
         metadata = snapshot["meta"]
@@ -176,6 +220,46 @@ def load_information_json(directory: Path) -> dict | None:
     return None
 
 
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    # 저장하는 도중에 중단되더라도 이전 파일이 깨지지 않도록 임시 파일에 쓴 뒤 교체함
+    temp_path = path.with_name(f".{path.name}.tmp")
+    temp_path.write_bytes(data)
+    os.replace(temp_path, path)
+
+
+def save_information_json(
+    directory: Path,
+    information: dict,
+    sidecar_categories: typing.Iterable[str] = SIDECAR_CATEGORIES,
+    compress_sidecars: bool = True,
+) -> None:
+    """information.json을 저장합니다.
+
+    `sidecar_categories`에 해당하는 카테고리(주로 용량이 큰 `extra`)는 `information.<카테고리>.json(.gz)`에 따로 저장되고,
+    information.json에는 그 파일의 이름만 `sidecars`에 기록됩니다.
+    더 이상 사용되지 않는 이전의 sidecar 파일들은 삭제됩니다.
+    """
+    core = dict(information)
+    sidecars: dict[str, str] = {}
+    for category in sidecar_categories:
+        if not isinstance(data := core.get(category), Mapping):
+            continue
+        del core[category]
+        file_name = f"information.{category}.json" + (".gz" if compress_sidecars else "")
+        encoded = json_codec.dumpb(data)
+        _write_bytes_atomic(directory / file_name, gzip.compress(encoded, compresslevel=6) if compress_sidecars else encoded)
+        sidecars[category] = file_name
+    if sidecars:
+        core["sidecars"] = sidecars
+
+    _write_bytes_atomic(directory / INFORMATION_NAME, json_codec.dumpb(core))
+
+    for stale in directory.glob("information.*.json*"):
+        if stale.name not in sidecars.values():
+            with suppress(OSError):
+                stale.unlink()
+
+
 def check_filename_state(file_or_directory_name: str) -> DirectoryState:
     """한 파일(혹은 디렉토리) 이름의 상태를 확인합니다."""
     for state in DIRECTORY_STATES:
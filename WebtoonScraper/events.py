@@ -0,0 +1,106 @@
+"""다운로드 이벤트를 JSON Lines 형식으로 기록합니다.
+
+각 줄은 하나의 이벤트이며 다음과 같은 형태를 가집니다.
+
+```json
+{"time": "2025-01-01T00:00:00.000000+00:00", "event": "download_completed", "platform": "naver_webtoon", "webtoon_id": 819217,
+ "episode": 3, "duration": 1.52, "bytes": 5242880, "files": 40, "requests": 42, "retries": 0, "errors": 0, "latency_avg": 0.08, "latency_max": 0.31}
+```
+
+에피소드 번호(`episode`)는 1부터 시작합니다.
+"""
+
+from __future__ import annotations
+
+import functools
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, TYPE_CHECKING
+
+from . import json_codec
+
+if TYPE_CHECKING:
+    from .scrapers import Scraper
+
+__all__ = ["EVENTS", "EventRecorder"]
+
+EVENTS = (
+    "download_started",
+    "downloading",
+    "download_completed",
+    "download_failed",
+    "download_skipped",
+    "download_skipped_by_range",
+    "side_asset_failed",
+    "concurrency_adjusted",
+    "download_ended",
+)
+
+
+class EventRecorder:
+    """스크래퍼의 콜백 트리거를 JSON Lines 파일에 기록합니다.
+
+    여러 스크래퍼에 등록할 수 있으며, 파일은 이어쓰기 모드로 열립니다.
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        self.path = Path(path)
+        self._file: IO[str] | None = None
+        self._recorders: dict[int, dict[str, functools.partial]] = {}
+
+    def register(self, scraper: Scraper) -> None:
+        if self._file is None:
+            self._file = self.path.open("a", encoding="utf-8")
+        recorders = self._recorders[id(scraper)] = {event: functools.partial(self.record, event) for event in EVENTS}
+        for event, recorder in recorders.items():
+            scraper.callbacks.register(event, recorder)
+
+    def unregister(self, scraper: Scraper) -> None:
+        for event, recorder in self._recorders.pop(id(scraper), {}).items():
+            scraper.callbacks.remove(event, recorder)
+        if not self._recorders:
+            self.close()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def record(self, event: str, scraper: Scraper, **context) -> None:
+        # download_ended는 시작과 끝에 한 번씩 불림
+        if event == "download_ended" and not context.get("finishing"):
+            return
+        if self._file is None:
+            return
+
+        record: dict = dict(
+            time=datetime.now(timezone.utc).isoformat(),
+            event=event,
+            platform=scraper.PLATFORM,
+            webtoon_id=scraper.webtoon_id,
+        )
+        if "episode_no" in context:
+            record["episode"] = context["episode_no"] + 1
+        for key in ("reason", "skipped_count", "asset_name", "exc_name", "exc", "is_successful", "previous", "limit"):
+            if key in context:
+                record[key] = context[key]
+        if "skipped_ranges" in context:
+            # 처음과 끝 에피소드 번호(1부터 시작, 끝 포함)의 쌍
+            record["episodes"] = [[skipped.start + 1, skipped.stop] for skipped in context["skipped_ranges"]]
+        if (stats := context.get("stats")) is not None:
+            record.update(stats)
+        elif event == "download_ended":
+            record.update(_total_stats(getattr(scraper, "download_stats", {}).values()))
+
+        self._file.write(json_codec.dumps(record, default=str) + "\n")
+        self._file.flush()
+
+
+def _total_stats(stats) -> dict:
+    total = dict(episodes=0, duration=0.0, bytes=0, files=0, requests=0, retries=0, errors=0)
+    for episode_stats in stats:
+        total["episodes"] += 1
+        for key in ("duration", "bytes", "files", "requests", "retries", "errors"):
+            total[key] += episode_stats.get(key) or 0
+    total["duration"] = round(total["duration"], 3)
+    return total
@@ -5,8 +5,7 @@ from __future__ import annotations
 from contextlib import contextmanager
 from typing import TYPE_CHECKING
 
-from httpx import HTTPStatusError
-
+# httpx는 불러오는 데에 시간이 오래 걸리기 때문에 CLI가 빠르게 시작할 수 있도록 필요할 때 불러옴
 if TYPE_CHECKING:
     from pathlib import Path
     from typing import Self
@@ -34,7 +33,12 @@ class WebtoonIdError(WebtoonScraperError):
 
     @classmethod
     @contextmanager
-    def redirect_error(cls, scraper: _Scraper, rating_notice=False, error_type: type[BaseException] | tuple[type[BaseException], ...] = HTTPStatusError):
+    def redirect_error(cls, scraper: _Scraper, rating_notice=False, error_type: type[BaseException] | tuple[type[BaseException], ...] | None = None):
+        """`error_type`의 오류를 이 오류로 바꿉니다. `error_type`의 기본값은 `httpx.HTTPStatusError`입니다."""
+        from httpx import HTTPStatusError
+
+        if error_type is None:
+            error_type = HTTPStatusError
         try:
             yield
         except ExceptionGroup as exc:
@@ -108,6 +112,17 @@ class RefreshableAuthenticationError(AuthenticationError):
         self.location = location
 
 
+class LeaseHeldError(WebtoonScraperError):
+    """Another process or host holds the lease of the directory."""
+
+    @classmethod
+    def from_lease(cls, path: Path) -> Self:
+        from .leases import read_lease
+
+        owner = (read_lease(path) or {}).get("owner")
+        return cls(f"{path.parent} is being downloaded by another worker ({owner or 'unknown owner'}). Lease file: {path}")
+
+
 class UseFetchEpisode(WebtoonScraperError):
     """`fetch_episode_information` do all."""
 
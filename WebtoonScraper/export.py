@@ -0,0 +1,290 @@
+"""다운로드된 웹툰을 e-reader용 CBZ나 EPUB 파일로 내보냅니다.
+
+이미지는 이미 압축된 형식이기 때문에 zip의 stored(무압축) 모드로 저장하고,
+파일은 `ZipFile.write`를 통해 조금씩 복사되기 때문에 에피소드 전체를 메모리에 올리지 않습니다.
+에피소드별 아카이브는 프로세스 풀에서 병렬로 만들어집니다.
+"""
+
+from __future__ import annotations
+
+import functools
+import html
+import mimetypes
+import os
+import shutil
+import typing
+import uuid
+import zipfile
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+from .base import logger
+from .directory_state import _directories_and_files_of, load_information_json
+from .processing import EpisodeProcessor, _run_episode_jobs, derived_webtoon_directory, episode_images
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from .scrapers import Scraper
+
+ExportFormat = typing.Literal["cbz", "epub"]
+EXPORT_FORMATS: tuple[ExportFormat, ...] = ("cbz", "epub")
+IMAGE_MEDIA_TYPES = {
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+    "gif": "image/gif",
+    "webp": "image/webp",
+    "avif": "image/avif",
+    "bmp": "image/bmp",
+}
+
+
+class Chapter(NamedTuple):
+    title: str
+    images: list[Path]
+    extras: list[Path] = []
+    """오디오 등 이미지가 아닌 파일입니다. 에피소드 디렉토리를 삭제할 때 함께 보존하기 위해 사용됩니다."""
+
+
+def _extension(path: Path) -> str:
+    return path.suffix[1:].lower()
+
+
+def write_cbz(output: Path, chapters: Sequence[Chapter], *, series: str, writer: str | None = None, number: int | None = None) -> Path:
+    """챕터들을 CBZ로 저장합니다. 챕터가 여러 개라면 챕터마다 디렉토리를 나누어 저장합니다."""
+    temp_output = output.with_name(f"._{output.name}.tmp")
+    page_count = sum(len(chapter.images) for chapter in chapters)
+    comic_info = [
+        '<?xml version="1.0" encoding="utf-8"?>',
+        "<ComicInfo>",
+        f"  <Title>{html.escape(chapters[0].title if len(chapters) == 1 else series)}</Title>",
+        f"  <Series>{html.escape(series)}</Series>",
+    ]
+    if number is not None:
+        comic_info.append(f"  <Number>{number}</Number>")
+    if writer:
+        comic_info.append(f"  <Writer>{html.escape(writer)}</Writer>")
+    comic_info += [f"  <PageCount>{page_count}</PageCount>", "</ComicInfo>"]
+
+    with zipfile.ZipFile(temp_output, "w", zipfile.ZIP_STORED) as archive:
+        for chapter_no, chapter in enumerate(chapters, 1):
+            prefix = "" if len(chapters) == 1 else f"{chapter_no:04d}. {chapter.title}/"
+            for file in (*chapter.images, *chapter.extras):
+                archive.write(file, prefix + file.name)
+        archive.writestr("ComicInfo.xml", "\n".join(comic_info), zipfile.ZIP_DEFLATED)
+    os.replace(temp_output, output)
+    return output
+
+
+def write_epub(output: Path, chapters: Sequence[Chapter], *, title: str, writer: str | None = None) -> Path:
+    """챕터들을 EPUB 3로 저장합니다. 이미지 한 장당 XHTML 페이지 하나가 만들어집니다."""
+    temp_output = output.with_name(f"._{output.name}.tmp")
+    identifier = uuid.uuid5(uuid.NAMESPACE_URL, f"{title}/{'/'.join(chapter.title for chapter in chapters)}")
+    manifest = ['<item id="nav" href="nav.xhtml" media-type="application/xhtml+xml" properties="nav"/>']
+    spine = []
+    nav = []
+
+    with zipfile.ZipFile(temp_output, "w", zipfile.ZIP_DEFLATED) as archive:
+        # mimetype은 반드시 첫 번째 파일이어야 하며 압축되지 않아야 함
+        archive.writestr("mimetype", "application/epub+zip", zipfile.ZIP_STORED)
+        archive.writestr(
+            "META-INF/container.xml",
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            '<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">'
+            '<rootfiles><rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/></rootfiles>'
+            "</container>",
+        )
+        for chapter_no, chapter in enumerate(chapters, 1):
+            for page_no, image in enumerate(chapter.images, 1):
+                name = f"{chapter_no:04d}_{page_no:03d}"
+                image_href = f"images/{name}.{_extension(image)}"
+                archive.write(image, f"OEBPS/{image_href}", zipfile.ZIP_STORED)
+                archive.writestr(
+                    f"OEBPS/pages/{name}.xhtml",
+                    '<?xml version="1.0" encoding="utf-8"?>\n'
+                    '<html xmlns="http://www.w3.org/1999/xhtml"><head><meta charset="utf-8"/>'
+                    f"<title>{html.escape(chapter.title)}</title>"
+                    '<style>body{margin:0;padding:0}img{display:block;width:100%}</style></head>'
+                    f'<body><img src="../{image_href}" alt=""/></body></html>',
+                )
+                manifest.append(f'<item id="img{name}" href="{image_href}" media-type="{IMAGE_MEDIA_TYPES.get(_extension(image), "application/octet-stream")}"/>')
+                manifest.append(f'<item id="page{name}" href="pages/{name}.xhtml" media-type="application/xhtml+xml"/>')
+                spine.append(f'<itemref idref="page{name}"/>')
+                if page_no == 1:
+                    nav.append(f'<li><a href="pages/{name}.xhtml">{html.escape(chapter.title)}</a></li>')
+            for extra_no, extra in enumerate(chapter.extras, 1):
+                extra_href = f"extras/{chapter_no:04d}_{extra.name}"
+                archive.write(extra, f"OEBPS/{extra_href}", zipfile.ZIP_STORED)
+                media_type = mimetypes.guess_type(extra.name)[0] or "application/octet-stream"
+                manifest.append(f'<item id="extra{chapter_no:04d}_{extra_no:03d}" href="{extra_href}" media-type="{media_type}"/>')
+
+        archive.writestr(
+            "OEBPS/nav.xhtml",
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            '<html xmlns="http://www.w3.org/1999/xhtml" xmlns:epub="http://www.idpf.org/2007/ops"><head><meta charset="utf-8"/>'
+            f"<title>{html.escape(title)}</title></head>"
+            f'<body><nav epub:type="toc"><ol>{"".join(nav)}</ol></nav></body></html>',
+        )
+        modified = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+        creator = f"<dc:creator>{html.escape(writer)}</dc:creator>" if writer else ""
+        archive.writestr(
+            "OEBPS/content.opf",
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            '<package xmlns="http://www.idpf.org/2007/opf" version="3.0" unique-identifier="uid">'
+            '<metadata xmlns:dc="http://purl.org/dc/elements/1.1/">'
+            f'<dc:identifier id="uid">urn:uuid:{identifier}</dc:identifier>'
+            f"<dc:title>{html.escape(title)}</dc:title>{creator}<dc:language>ko</dc:language>"
+            f'<meta property="dcterms:modified">{modified}</meta>'
+            f"</metadata><manifest>{''.join(manifest)}</manifest><spine>{''.join(spine)}</spine></package>",
+        )
+    os.replace(temp_output, output)
+    return output
+
+
+def export_episode(
+    episode_directory: Path | str,
+    output: Path | str,
+    export_format: ExportFormat = "cbz",
+    *,
+    episode_title: str,
+    series: str,
+    writer: str | None = None,
+    number: int | None = None,
+    remove_directory: bool = False,
+) -> Path:
+    """에피소드 디렉토리 하나를 아카이브로 내보냅니다.
+
+    remove_directory가 True라면 아카이브가 완전히 저장된 뒤에 에피소드 디렉토리를 삭제합니다.
+    프로세스 풀에서 실행될 수 있도록 모듈 최상단에 정의되어 있습니다.
+    """
+    episode_directory = Path(episode_directory)
+    output = Path(output)
+    images = episode_images(episode_directory)
+    extras = [file for file in _directories_and_files_of(episode_directory)[1] if file not in images] if remove_directory else []
+    chapters = [Chapter(episode_title, images, extras)]
+    if export_format == "cbz":
+        write_cbz(output, chapters, series=series, writer=writer, number=number)
+    else:
+        write_epub(output, chapters, title=f"{series} - {episode_title}", writer=writer)
+    if remove_directory:
+        shutil.rmtree(episode_directory)
+    return output
+
+
+class _EpisodeEntry(NamedTuple):
+    number: int
+    title: str
+    directory: Path
+
+
+def _episode_entries(webtoon_directory: Path) -> tuple[dict, list[_EpisodeEntry]]:
+    """information.json의 순서와 제목을 이용해 에피소드 목록을 만듭니다. 정보가 없다면 디렉토리 이름 순서를 따릅니다."""
+    information = load_information_json(webtoon_directory) or {}
+    directory_names: list[str | None] = information.get("episode_dir_names") or []
+    titles: list[str | None] = information.get("episode_titles") or []
+    existing = {directory.name: directory for directory in _directories_and_files_of(webtoon_directory)[0]}
+
+    entries = []
+    for index, directory_name in enumerate(directory_names):
+        if directory_name is None or (directory := existing.pop(directory_name, None)) is None:
+            continue
+        title = titles[index] if index < len(titles) and titles[index] else directory_name
+        entries.append(_EpisodeEntry(index + 1, title, directory))
+
+    # information.json에 기록되지 않은 디렉토리는 이름 순서대로 뒤에 붙임
+    for directory_name, directory in existing.items():
+        number_str, _, title = directory_name.partition(". ")
+        number = int(number_str) if number_str.isdigit() else len(entries) + 1
+        entries.append(_EpisodeEntry(number, title or directory_name, directory))
+    return information, entries
+
+
+def export_webtoon(
+    webtoon_directory: Path | str,
+    export_format: ExportFormat = "cbz",
+    target_directory: Path | str | None = None,
+    *,
+    single_archive: bool = False,
+    max_workers: int | None = None,
+    skip_existing: bool = True,
+) -> Path:
+    """웹툰 디렉토리를 아카이브로 내보내고 아카이브가 저장된 디렉토리를 반환합니다.
+
+    Args:
+        webtoon_directory: 내보낼 웹툰 디렉토리입니다.
+        export_format: `cbz`나 `epub` 중 하나입니다.
+        target_directory: 아카이브를 저장할 디렉토리입니다. 기본값은 `제목(id, 형식)`입니다.
+        single_archive: True라면 에피소드별 아카이브 대신 웹툰 전체를 하나의 아카이브로 저장합니다.
+            이 경우에는 병렬로 처리되지 않습니다.
+        max_workers: 사용할 프로세스의 개수입니다. 기본값은 CPU 코어의 개수입니다.
+        skip_existing: 이미 아카이브가 존재하는 에피소드는 건너뜁니다.
+    """
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {export_format!r}")
+    webtoon_directory = Path(webtoon_directory)
+    target_directory = Path(target_directory) if target_directory else derived_webtoon_directory(webtoon_directory, export_format)
+    target_directory.mkdir(parents=True, exist_ok=True)
+
+    information, entries = _episode_entries(webtoon_directory)
+    series = information.get("title") or webtoon_directory.name
+    writer = information.get("author")
+
+    if single_archive:
+        output = target_directory / f"{webtoon_directory.name}.{export_format}"
+        chapters = [Chapter(entry.title, episode_images(entry.directory)) for entry in entries]
+        if export_format == "cbz":
+            write_cbz(output, chapters, series=series, writer=writer)
+        else:
+            write_epub(output, chapters, title=series, writer=writer)
+        logger.info(f"{len(chapters)} episode(s) exported to {output}")
+        return target_directory
+
+    jobs: list[tuple[Path, Callable, tuple]] = []
+    for entry in entries:
+        output = target_directory / f"{entry.directory.name}.{export_format}"
+        if skip_existing and output.exists():
+            continue
+        function = functools.partial(export_episode, episode_title=entry.title, series=series, writer=writer, number=entry.number)
+        jobs.append((entry.directory, function, (entry.directory, output, export_format)))
+
+    for episode_directory, output in _run_episode_jobs(jobs, max_workers, "export"):
+        logger.debug(f"{episode_directory.name!r} exported to {output.name!r}")
+    logger.info(f"{len(jobs)} episode(s) exported to {target_directory}")
+    return target_directory
+
+
+class ArchiveExporter(EpisodeProcessor):
+    """다운로드된 에피소드를 곧바로 아카이브로 만드는 훅입니다.
+
+    아카이브는 웹툰 디렉토리 안에 `에피소드 디렉토리 이름.cbz`의 형태로 저장되며,
+    keep_directory가 False(기본값)라면 아카이브가 저장된 뒤 에피소드 디렉토리가 삭제되어 낱개의 파일이 남지 않습니다.
+    스크래퍼는 아카이브가 있는 에피소드를 이미 다운로드된 것으로 간주합니다.
+    """
+
+    def __init__(
+        self,
+        export_format: ExportFormat = "cbz",
+        *,
+        keep_directory: bool = False,
+        max_workers: int | None = None,
+        max_pending: int | None = None,
+    ) -> None:
+        if export_format not in EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format: {export_format!r}")
+        super().__init__(max_workers, max_pending)
+        self.export_format: ExportFormat = export_format
+        self.keep_directory = keep_directory
+
+    def process(self, scraper: Scraper, episode_no: int, episode_directory: Path) -> tuple[Callable, tuple] | None:
+        function = functools.partial(
+            export_episode,
+            episode_title=scraper.episode_titles[episode_no] or episode_directory.name,
+            series=scraper.title,
+            writer=scraper.author,
+            number=episode_no + 1,
+            remove_directory=not self.keep_directory,
+        )
+        output = episode_directory.with_name(f"{episode_directory.name}.{self.export_format}")
+        return function, (episode_directory, output, self.export_format)
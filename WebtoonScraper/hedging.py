@@ -0,0 +1,143 @@
+"""응답이 늦어지는 이미지 요청을 한 번 더 보내(hedging) 꼬리 지연 시간을 줄입니다.
+
+CDN 노드 하나가 이미지 하나를 몇 초씩 붙잡고 있으면 에피소드 전체가 그 이미지를 기다리게 됩니다.
+`Scraper.hedge_policy`를 설정하면 이미지 요청이 지금까지 관측된 첫 바이트 지연 시간의 `percentile` 분위수 안에
+응답을 받기 시작하지 못했을 때 같은 요청을 한 번 더 보내고, 먼저 끝난 쪽의 결과를 사용하며 나머지는 취소합니다.
+
+```python
+from WebtoonScraper.hedging import HedgePolicy
+from WebtoonScraper.scrapers import Scraper
+
+Scraper.hedge_policy = HedgePolicy(percentile=0.95, budget_ratio=0.05)
+```
+
+* 요청이 `min_samples`개 관측되기 전에는 기준을 정할 수 없으니 hedging하지 않습니다.
+* 중복 요청이 부하를 키우지 않도록 요청 하나당 `budget_ratio`개의 예산이 쌓이며(최대 `max_budget`개),
+    중복 요청 하나가 예산 하나를 사용합니다. 예산이 없다면 원래 요청을 계속 기다립니다.
+* 클래스 변수로 설정하면 프로세스의 모든 스크래퍼가 하나의 예산과 지연 시간 기록을 공유합니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+
+from .base import logger
+
+__all__ = ["HedgePolicy"]
+
+type FirstByteCallback = Callable[[], None]
+
+
+class HedgePolicy:
+    """이미지 요청을 언제, 얼마나 중복해서 보낼지 정합니다."""
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        budget_ratio: float = 0.05,
+        max_budget: float = 10,
+        *,
+        min_delay: float = 0.05,
+        min_samples: int = 20,
+        window: int = 200,
+    ) -> None:
+        self.percentile = percentile
+        self.budget_ratio = budget_ratio
+        self.max_budget = max_budget
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.requests = 0
+        """hedging의 대상이 된 요청의 수입니다."""
+        self.hedged = 0
+        """중복 요청을 보낸 횟수입니다."""
+        self.hedge_wins = 0
+        """중복 요청이 원래 요청보다 먼저 끝난 횟수입니다."""
+        self.denied = 0
+        """기준 시간을 넘겼지만 예산이 없어 중복 요청을 보내지 못한 횟수입니다."""
+        self._lock = threading.Lock()
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._budget = 0.0
+
+    def threshold(self) -> float | None:
+        """중복 요청을 보내기 전에 기다릴 시간입니다. 관측된 요청이 부족하다면 None입니다."""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, math.ceil(len(ordered) * self.percentile) - 1)
+        return max(self.min_delay, ordered[index])
+
+    def observe(self, latency: float) -> None:
+        """첫 바이트를 받기까지 걸린 시간을 기록합니다."""
+        with self._lock:
+            self._latencies.append(latency)
+
+    def _try_spend(self) -> bool:
+        with self._lock:
+            if self._budget < 1:
+                self.denied += 1
+                return False
+            self._budget -= 1
+            self.hedged += 1
+            return True
+
+    async def fetch[T](self, request: Callable[[FirstByteCallback], Awaitable[T]], description: str = "") -> T:
+        """request를 실행하고, 기준 시간 안에 첫 바이트를 받지 못하면 한 번 더 실행해 먼저 끝난 결과를 반환합니다.
+
+        request는 응답을 받기 시작했을 때 호출할 콜백을 인자로 받는 코루틴 함수입니다.
+        두 요청이 모두 실패하면 원래 요청의 예외가 발생합니다.
+        """
+        threshold = self.threshold()
+        with self._lock:
+            self.requests += 1
+            self._budget = min(self.max_budget, self._budget + self.budget_ratio)
+
+        primary_first_byte = asyncio.Event()
+        primary = asyncio.ensure_future(request(self._first_byte_callback(primary_first_byte)))
+        if threshold is None:
+            return await primary
+
+        tasks = [primary]
+        try:
+            waiter = asyncio.ensure_future(primary_first_byte.wait())
+            try:
+                await asyncio.wait((primary, waiter), timeout=threshold, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                waiter.cancel()
+            if primary.done() or primary_first_byte.is_set() or not self._try_spend():
+                return await primary
+
+            logger.debug(f"No response in {threshold:.3f}s. Sending a hedged request{description and f' for {description}'}.")
+            hedge = asyncio.ensure_future(request(self._first_byte_callback(asyncio.Event())))
+            tasks.append(hedge)
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            with self._lock:
+                                self.hedge_wins += 1
+                        return task.result()
+            return primary.result()
+        finally:
+            losers = [task for task in tasks if not task.done()]
+            for task in losers:
+                task.cancel()
+            # 취소된 요청이 남긴 예외는 무시함
+            await asyncio.gather(*losers, return_exceptions=True)
+
+    def _first_byte_callback(self, event: asyncio.Event) -> FirstByteCallback:
+        started_at = time.perf_counter()
+
+        def on_first_byte() -> None:
+            if not event.is_set():
+                self.observe(time.perf_counter() - started_at)
+                event.set()
+
+        return on_first_byte
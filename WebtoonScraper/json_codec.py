@@ -0,0 +1,129 @@
+"""설치되어 있다면 orjson이나 msgspec을, 그렇지 않다면 표준 라이브러리를 사용하는 JSON 코덱입니다.
+
+API 응답, information.json, 스냅샷처럼 자주 읽고 쓰는 JSON은 이 모듈을 거칩니다.
+
+* 출력은 항상 `ensure_ascii=False`에 구분자가 `(",", ":")`인 표준 라이브러리의 출력과 같은 형식입니다.
+* 빠른 백엔드가 처리하지 못하는 값(64비트를 넘는 정수, `NaN` 리터럴 등)을 만나면 표준 라이브러리로 다시 처리합니다.
+    따라서 파싱 결과와 예외(`json.JSONDecodeError` 등)는 백엔드와 관계없이 같습니다.
+* 다만 빠른 백엔드는 NaN과 무한대를 null로, datetime 등을 `default`를 거치지 않고 ISO 형식으로 저장합니다.
+* 환경 변수 `WEBTOON_SCRAPER_JSON`에 `orjson`, `msgspec`, `json` 중 하나를 설정하거나 `set_backend()`로 백엔드를 고를 수 있습니다.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import typing
+from collections.abc import Callable
+
+__all__ = ["BACKENDS", "backend", "dumpb", "dumps", "loads", "set_backend"]
+
+BACKENDS = ("orjson", "msgspec", "json")
+type _Buffer = str | bytes | bytearray | memoryview
+
+
+def _stdlib_loads(data: _Buffer) -> typing.Any:
+    return json.loads(bytes(data) if isinstance(data, memoryview) else data)
+
+
+def _stdlib_dumps(obj: typing.Any, default: Callable | None) -> str:
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=default)
+
+
+def _orjson() -> tuple[Callable, Callable]:
+    import orjson
+
+    def loads(data: _Buffer) -> typing.Any:
+        return orjson.loads(data)
+
+    def dumpb(obj: typing.Any, default: Callable | None) -> bytes:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+
+    return loads, dumpb
+
+
+def _msgspec() -> tuple[Callable, Callable]:
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder()
+
+    def loads(data: _Buffer) -> typing.Any:
+        return decoder.decode(data)
+
+    def dumpb(obj: typing.Any, default: Callable | None) -> bytes:
+        return encoder.encode(obj) if default is None else msgspec.json.encode(obj, enc_hook=default)
+
+    return loads, dumpb
+
+
+_fast_loads: Callable[[_Buffer], typing.Any] | None = None
+_fast_dumpb: Callable[[typing.Any, Callable | None], bytes] | None = None
+_backend = "json"
+
+
+def backend() -> str:
+    """현재 사용 중인 백엔드의 이름입니다."""
+    return _backend
+
+
+def set_backend(name: str | None = None) -> str:
+    """백엔드를 바꾸고 그 이름을 반환합니다.
+
+    name이 None이라면 설치된 백엔드 중 가장 빠른 것을 사용합니다.
+    설치되지 않은 백엔드를 지정하면 ImportError가 발생합니다.
+    """
+    global _fast_loads, _fast_dumpb, _backend
+    if name is None:
+        for candidate in BACKENDS[:-1]:
+            try:
+                return set_backend(candidate)
+            except ImportError:
+                pass
+        name = "json"
+
+    match name:
+        case "orjson":
+            _fast_loads, _fast_dumpb = _orjson()
+        case "msgspec":
+            _fast_loads, _fast_dumpb = _msgspec()
+        case "json":
+            _fast_loads = _fast_dumpb = None
+        case other:
+            raise ValueError(f"Unknown JSON backend: {other!r}. Use one of {', '.join(BACKENDS)}.")
+    _backend = name
+    return name
+
+
+def loads(data: _Buffer) -> typing.Any:
+    """JSON을 파싱합니다. str과 UTF-8로 인코딩된 bytes를 모두 받습니다."""
+    if _fast_loads is not None:
+        try:
+            return _fast_loads(data)
+        except Exception:
+            # 잘못된 JSON이라면 표준 라이브러리에서도 실패하므로 예외의 종류가 백엔드에 따라 달라지지 않음
+            pass
+    return _stdlib_loads(data)
+
+
+def dumpb(obj: typing.Any, *, default: Callable | None = None) -> bytes:
+    """UTF-8로 인코딩된 JSON을 만듭니다."""
+    if _fast_dumpb is not None:
+        try:
+            return _fast_dumpb(obj, default)
+        except Exception:
+            pass
+    return _stdlib_dumps(obj, default).encode("utf-8")
+
+
+def dumps(obj: typing.Any, *, default: Callable | None = None) -> str:
+    """JSON 문자열을 만듭니다."""
+    if _fast_dumpb is not None:
+        try:
+            return _fast_dumpb(obj, default).decode("utf-8")
+        except Exception:
+            pass
+    return _stdlib_dumps(obj, default)
+
+
+set_backend(os.environ.get("WEBTOON_SCRAPER_JSON") or None)
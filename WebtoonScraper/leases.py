@@ -0,0 +1,228 @@
+"""여러 프로세스나 호스트가 같은 다운로드 디렉토리(NFS 등)를 공유할 때 작업이 겹치지 않도록 하는 lease입니다.
+
+lease는 `O_CREAT | O_EXCL`로 만든 lock 파일이며, 소유자 정보(호스트, pid, 토큰)가 JSON으로 기록됩니다.
+
+* 소유자는 `ttl`보다 짧은 간격으로 lock 파일의 수정 시각을 갱신(heartbeat)합니다.
+* 수정 시각이 `ttl`보다 오래된 lock 파일은 소유자가 비정상적으로 종료된 것으로 보고 다른 프로세스가 회수합니다.
+    회수는 lock 파일의 이름을 바꾸는 방식으로 이루어지기 때문에 여러 프로세스가 동시에 회수하더라도 하나만 성공합니다.
+    이름을 바꾼 뒤에는 그 파일이 만료를 확인한 파일과 같은지(inode, 수정 시각, 토큰) 확인하고,
+    그 사이 다른 프로세스가 새로 얻은 lease였다면 되돌립니다.
+* 수정 시각을 비교하기 때문에 호스트들의 시계가 `ttl`보다 충분히 작은 오차로 맞춰져 있어야 합니다.
+
+스크래퍼에 `lease_manager`를 설정하면 웹툰 디렉토리와 에피소드 디렉토리에 lease를 사용합니다.
+`LeaseManager.claim()`을 사용하면 여러 작업자가 하나의 웹툰 ID 목록을 나누어 다운로드할 수 있습니다.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import secrets
+import socket
+import threading
+import time
+from contextlib import suppress
+from pathlib import Path
+
+from . import json_codec
+from .base import logger
+from .exceptions import LeaseHeldError
+
+__all__ = ["DEFAULT_TTL", "Lease", "LeaseManager", "read_lease"]
+
+DEFAULT_TTL = 60.0
+
+
+def read_lease(path: Path) -> dict | None:
+    """lock 파일에 기록된 소유자 정보를 읽습니다. 파일이 없거나 기록 중이라면 None을 반환합니다."""
+    try:
+        return json_codec.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+class Lease:
+    """lock 파일 하나로 표현되는 lease입니다. 갱신은 `renew()`로 직접 하거나 LeaseManager에 맡기세요."""
+
+    def __init__(self, path: Path, owner: str, ttl: float = DEFAULT_TTL) -> None:
+        self.path = path
+        self.owner = owner
+        self.ttl = ttl
+        self.token = secrets.token_hex(8)
+        self.held = False
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.path} ({'held' if self.held else 'not held'})>"
+
+    def __enter__(self) -> Lease:
+        if not self.try_acquire():
+            raise LeaseHeldError.from_lease(self.path)
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.release()
+
+    def try_acquire(self) -> bool:
+        """lease를 얻으면 True를, 다른 소유자가 가지고 있다면 False를 반환합니다. 만료된 lease는 회수합니다."""
+        # 만료된 lease를 회수한 직후에 다른 프로세스가 먼저 lease를 얻을 수 있으니 두 번까지만 시도함
+        for _ in range(2):
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            except FileExistsError:
+                if not self._reclaim_if_stale():
+                    return False
+                continue
+            info = dict(owner=self.owner, host=socket.gethostname(), pid=os.getpid(), token=self.token, ttl=self.ttl, acquired_at=time.time())
+            with os.fdopen(fd, "wb") as f:
+                f.write(json_codec.dumpb(info))
+            self.held = True
+            return True
+        return False
+
+    def renew(self) -> bool:
+        """lease의 만료 시각을 늦춥니다. 다른 소유자에게 회수되었다면 False를 반환합니다."""
+        if not self.held:
+            return False
+        info = read_lease(self.path)
+        if info is None or info.get("token") != self.token:
+            self.held = False
+            logger.warning(f"Lease {self.path} was reclaimed by {info and info.get('owner')!r}. Another worker may be working on it.")
+            return False
+        with suppress(OSError):
+            os.utime(self.path)
+        return True
+
+    def release(self) -> None:
+        """lease를 반환합니다. 이미 다른 소유자에게 넘어간 lease라면 lock 파일을 건드리지 않습니다."""
+        if not self.held:
+            return
+        self.held = False
+        info = read_lease(self.path)
+        if info is not None and info.get("token") == self.token:
+            with suppress(FileNotFoundError):
+                self.path.unlink()
+
+    def _reclaim_if_stale(self) -> bool:
+        """lock 파일이 만료되었다면 제거하고 True를 반환합니다. 이미 없어졌을 때도 True입니다."""
+        try:
+            inspected = self.path.stat()
+        except FileNotFoundError:
+            return True
+        info = read_lease(self.path) or {}
+        ttl = info.get("ttl") or self.ttl
+        if time.time() - inspected.st_mtime < ttl:
+            return False
+
+        # 이름을 바꾸는 것은 원자적이기 때문에 여러 프로세스가 동시에 회수하더라도 하나만 성공함
+        grave = self.path.with_name(f"{self.path.name}.{self.token}.stale")
+        try:
+            os.rename(self.path, grave)
+        except FileNotFoundError:
+            return True
+
+        # 만료 여부를 확인한 뒤 이름을 바꾸기 전에 다른 프로세스가 먼저 회수하고 새 lease를 얻었다면
+        # 방금 이름을 바꾼 파일은 그 프로세스의 lease이니 되돌리고 회수에 실패한 것으로 처리함
+        renamed = grave.stat()
+        renamed_info = read_lease(grave) or {}
+        if (renamed.st_ino, renamed.st_mtime_ns) != (inspected.st_ino, inspected.st_mtime_ns) or renamed_info.get("token") != info.get("token"):
+            self._restore(grave)
+            return False
+
+        with suppress(OSError):
+            grave.unlink()
+        logger.info(f"Reclaimed stale lease {self.path} held by {info.get('owner')!r}.")
+        return True
+
+    def _restore(self, grave: Path) -> None:
+        # 되돌리는 사이에 또 다른 프로세스가 lease를 얻었다면 덮어쓰지 않음.
+        # 이 경우 원래 소유자는 다음 갱신에서 lease를 잃었음을 알게 됨.
+        try:
+            os.link(grave, self.path)
+        except FileExistsError:
+            logger.warning(f"Could not restore lease {self.path} renamed while reclaiming it. Another worker acquired it in the meantime.")
+        except OSError:
+            # 하드 링크를 지원하지 않는 파일 시스템
+            if not self.path.exists():
+                os.rename(grave, self.path)
+        finally:
+            with suppress(OSError):
+                grave.unlink()
+
+
+class LeaseManager:
+    """lease를 얻고, 가지고 있는 모든 lease를 하나의 백그라운드 스레드에서 갱신합니다.
+
+    이벤트 루프가 이미지 처리 등으로 바쁘더라도 갱신이 밀리지 않도록 스레드를 사용합니다.
+    사용이 끝나면 `close()`로 모든 lease를 반환하세요.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_TTL, owner: str | None = None, heartbeat_interval: float | None = None) -> None:
+        self.ttl = ttl
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}"
+        self.heartbeat_interval = heartbeat_interval or ttl / 3
+        self._leases: set[Lease] = set()
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def try_acquire(self, path: Path) -> Lease | None:
+        """path에 lease를 얻어 반환합니다. 다른 소유자가 가지고 있다면 None을 반환합니다."""
+        lease = Lease(path, self.owner, self.ttl)
+        if not lease.try_acquire():
+            return None
+        with self._lock:
+            self._leases.add(lease)
+            if self._thread is None:
+                self._stopped.clear()
+                self._thread = threading.Thread(target=self._heartbeat, name="lease-heartbeat", daemon=True)
+                self._thread.start()
+        return lease
+
+    def release(self, lease: Lease) -> None:
+        with self._lock:
+            self._leases.discard(lease)
+        lease.release()
+
+    def claim(self, claim_directory: Path | str, key: str) -> Lease | None:
+        """작업 목록 중 key에 해당하는 작업을 맡습니다.
+
+        다른 작업자가 맡고 있거나 이미 끝난 작업이라면 None을 반환합니다.
+        작업을 끝냈다면 `complete()`를, 실패했다면 `release()`를 호출하세요.
+        """
+        claim_directory = Path(claim_directory)
+        claim_directory.mkdir(parents=True, exist_ok=True)
+        name = re.sub(r"[^\w.-]", "_", key)
+        done = claim_directory / f"{name}.done"
+        if done.exists():
+            return None
+        lease = self.try_acquire(claim_directory / f"{name}.lease")
+        # lease를 얻기 직전에 다른 작업자가 작업을 끝냈을 수 있음
+        if lease is not None and done.exists():
+            self.release(lease)
+            return None
+        return lease
+
+    def complete(self, lease: Lease) -> None:
+        """claim()으로 맡은 작업이 끝났음을 기록하고 lease를 반환합니다."""
+        done = lease.path.with_suffix(".done")
+        done.write_bytes(json_codec.dumpb(dict(owner=self.owner, completed_at=time.time())))
+        self.release(lease)
+
+    def close(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        with self._lock:
+            leases, self._leases = self._leases, set()
+        for lease in leases:
+            lease.release()
+
+    def _heartbeat(self) -> None:
+        while not self._stopped.wait(self.heartbeat_interval):
+            with self._lock:
+                leases = list(self._leases)
+            for lease in leases:
+                if not lease.renew():
+                    with self._lock:
+                        self._leases.discard(lease)
@@ -0,0 +1,344 @@
+"""다운로드와 HTTP 통신에 대한 Prometheus 형식의 지표를 제공합니다.
+
+외부 의존성 없이 Prometheus의 텍스트 형식(text exposition format)만 구현합니다.
+지표는 node_exporter의 textfile collector가 읽을 파일로 쓰거나(`MetricsCollector.write_textfile`),
+localhost의 `/metrics` 엔드포인트로 제공할 수 있습니다(`MetricsCollector.serve`).
+
+값을 올리는 작업은 락 하나와 딕셔너리 연산뿐이라 상시 켜두어도 부담이 적고,
+동시 요청 수나 대기열 길이처럼 매번 바뀌는 값은 지표를 내보낼 때만 계산합니다.
+"""
+
+from __future__ import annotations
+
+import bisect
+import os
+import threading
+import time
+from collections.abc import Callable, Iterable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import httpx
+
+from .base import logger
+from .scrapers._ledger import ATTEMPTS, STARTED_AT
+
+if TYPE_CHECKING:
+    from .scrapers import Scraper
+
+__all__ = ["Counter", "Gauge", "Histogram", "MetricsCollector", "MetricsRegistry"]
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+EPISODE_BUCKETS = (0.5, 1, 2, 5, 10, 30, 60, 120, 300)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: tuple[str, ...], values: tuple, extra: str = "") -> str:
+    labels = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values, strict=True)]
+    if extra:
+        labels.append(extra)
+    return "{" + ",".join(labels) + "}" if labels else ""
+
+
+class _Metric:
+    TYPE = ""
+
+    def __init__(self, registry: MetricsRegistry, name: str, documentation: str, labels: Iterable[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._lock = registry._lock
+        registry._metrics.append(self)
+
+    def render(self) -> list[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.TYPE}"]
+
+
+class Counter(_Metric):
+    TYPE = "counter"
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._values: dict[tuple, float] = {}
+
+    def inc(self, *labels, amount: float = 1) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def get(self, *labels) -> float:
+        return self._values.get(labels, 0)
+
+    def render(self) -> list[str]:
+        lines = super().render()
+        for labels, value in self._values.items():
+            lines.append(f"{self.name}{_format_labels(self.label_names, labels)} {value}")
+        return lines
+
+
+class Gauge(_Metric):
+    """값을 직접 설정하거나, 지표를 내보낼 때마다 `function`을 호출해 값을 계산합니다."""
+
+    TYPE = "gauge"
+
+    def __init__(self, *args, function: Callable[[], Iterable[tuple[tuple, float]]] | None = None, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._values: dict[tuple, float] = {}
+        self.function = function
+
+    def set(self, value: float, *labels) -> None:
+        with self._lock:
+            self._values[labels] = value
+
+    def render(self) -> list[str]:
+        lines = super().render()
+        values = dict(self._values)
+        if self.function is not None:
+            values.update(self.function())
+        for labels, value in values.items():
+            lines.append(f"{self.name}{_format_labels(self.label_names, labels)} {value}")
+        return lines
+
+
+class Histogram(_Metric):
+    TYPE = "histogram"
+
+    def __init__(self, *args, buckets: Iterable[float] = LATENCY_BUCKETS, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.buckets = tuple(sorted(buckets))
+        # labels: [버킷별 개수..., +Inf 개수, 합계]
+        self._values: dict[tuple, list[float]] = {}
+
+    def observe(self, value: float, *labels) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            try:
+                counts = self._values[labels]
+            except KeyError:
+                counts = self._values[labels] = [0] * (len(self.buckets) + 2)
+            counts[index] += 1
+            counts[-1] += value
+
+    def count(self, *labels) -> int:
+        return int(sum(self._values.get(labels, [0])[:-1]))
+
+    def render(self) -> list[str]:
+        lines = super().render()
+        for labels, counts in self._values.items():
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts, strict=False):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_format_labels(self.label_names, labels, f'le="{bound}"')} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.label_names, labels)} {counts[-1]}")
+            lines.append(f"{self.name}_count{_format_labels(self.label_names, labels)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._metrics: list[_Metric] = []
+
+    def counter(self, name: str, documentation: str, labels: Iterable[str] = ()) -> Counter:
+        return Counter(self, name, documentation, labels)
+
+    def gauge(self, name: str, documentation: str, labels: Iterable[str] = (), function=None) -> Gauge:
+        return Gauge(self, name, documentation, labels, function=function)
+
+    def histogram(self, name: str, documentation: str, labels: Iterable[str] = (), buckets: Iterable[float] = LATENCY_BUCKETS) -> Histogram:
+        return Histogram(self, name, documentation, labels, buckets=buckets)
+
+    def render(self) -> str:
+        with self._lock:
+            lines = [line for metric in self._metrics for line in metric.render()]
+        return "\n".join(lines) + "\n"
+
+
+class MetricsCollector:
+    """스크래퍼의 HTTP 통신과 에피소드 다운로드를 지표로 수집합니다.
+
+    여러 스크래퍼에 등록할 수 있으며, 지표는 플랫폼별로 구분됩니다.
+    진행 중인 요청 수 등의 게이지는 다운로드 중인 스크래퍼만 보고하며, 다운로드가 끝나면 스크래퍼를 참조하지 않습니다.
+
+    Example:
+        ```python
+        collector = MetricsCollector()
+        collector.serve(9464)  # 또는 collector.textfile = "/var/lib/node_exporter/webtoon_scraper.prom"
+        collector.register(scraper)
+        await scraper.async_download_webtoon()
+        ```
+    """
+
+    def __init__(self, textfile: Path | str | None = None, *, textfile_interval: float = 10) -> None:
+        self.textfile = textfile and Path(textfile)
+        self.textfile_interval = textfile_interval
+        self._last_written = 0.0
+        self._scrapers: dict[int, Scraper] = {}
+        self._hooks: dict[int, tuple[Callable, Callable]] = {}
+        self._server: ThreadingHTTPServer | None = None
+
+        self.registry = registry = MetricsRegistry()
+        self.requests = registry.counter("webtoon_scraper_http_requests_total", "HTTP responses received.", ("platform", "host", "status"))
+        self.retries = registry.counter("webtoon_scraper_http_retries_total", "HTTP requests sent again after a failed attempt.", ("platform", "host"))
+        self.request_latency = registry.histogram("webtoon_scraper_http_response_seconds", "Time to response headers.", ("platform", "host"))
+        self.image_latency = registry.histogram("webtoon_scraper_image_response_seconds", "Time to response headers of image requests.", ("platform",))
+        self.downloaded_bytes = registry.counter("webtoon_scraper_downloaded_bytes_total", "Bytes of images and side assets written.", ("platform",))
+        self.episodes = registry.counter("webtoon_scraper_episodes_total", "Episodes processed, by result.", ("platform", "status"))
+        self.episode_duration = registry.histogram("webtoon_scraper_episode_seconds", "Time taken to download an episode.", ("platform", "status"), buckets=EPISODE_BUCKETS)
+        self.concurrency_adjustments = registry.counter(
+            "webtoon_scraper_concurrency_adjustments_total", "Changes of the adaptive concurrency limit.", ("platform", "direction", "reason")
+        )
+        registry.gauge("webtoon_scraper_concurrency_limit", "Current limit of concurrent requests.", ("platform", "webtoon_id"), function=self._concurrency_limit)
+        registry.gauge("webtoon_scraper_host_read_timeout_seconds", "Read timeout adapted to the latency of the host.", ("host",), function=self._host_timeouts)
+        registry.gauge("webtoon_scraper_requests_in_flight", "Requests holding a slot of the request limiter.", ("platform", "webtoon_id"), function=self._in_flight)
+        registry.gauge("webtoon_scraper_pending_callbacks", "Callbacks waiting or running in a thread or a queue.", ("platform", "webtoon_id"), function=self._pending_callbacks)
+        registry.gauge("webtoon_scraper_background_tasks", "Unfinished background tasks such as comment downloads.", ("platform", "webtoon_id"), function=self._background_tasks)
+
+    # MARK: REGISTRATION
+
+    def register(self, scraper: Scraper) -> None:
+        platform = scraper.PLATFORM
+
+        async def on_request(request: httpx.Request) -> None:
+            if request.extensions.get(ATTEMPTS, 1) > 1:
+                self.retries.inc(platform, request.url.host)
+
+        async def on_response(response: httpx.Response) -> None:
+            host = response.request.url.host
+            self.requests.inc(platform, host, str(response.status_code))
+            if (started_at := response.request.extensions.get(STARTED_AT)) is not None:
+                elapsed = time.perf_counter() - started_at
+                self.request_latency.observe(elapsed, platform, host)
+                if response.headers.get("content-type", "").startswith("image/"):
+                    self.image_latency.observe(elapsed, platform)
+
+        # 재시도 여부와 시작 시각은 스크래퍼가 기본으로 등록하는 hook이 기록하니 그 뒤에 등록해야 함
+        scraper.client.event_hooks["request"].append(on_request)
+        scraper.client.event_hooks["response"].append(on_response)
+        self._hooks[id(scraper)] = on_request, on_response
+
+        scraper.callbacks.register("download_started", self._download_started)
+        scraper.callbacks.register("download_completed", self._episode_done)
+        scraper.callbacks.register("download_failed", self._episode_done)
+        scraper.callbacks.register("download_skipped", self._episode_skipped)
+        scraper.callbacks.register("download_skipped_by_range", self._episodes_skipped_by_range)
+        scraper.callbacks.register("download_ended", self._download_ended)
+        scraper.callbacks.register("concurrency_adjusted", self._concurrency_adjusted)
+
+    def unregister(self, scraper: Scraper) -> None:
+        self._scrapers.pop(id(scraper), None)
+        if hooks := self._hooks.pop(id(scraper), None):
+            on_request, on_response = hooks
+            scraper.client.event_hooks["request"].remove(on_request)
+            scraper.client.event_hooks["response"].remove(on_response)
+        scraper.callbacks.remove("download_started", self._download_started)
+        scraper.callbacks.remove("download_completed", self._episode_done)
+        scraper.callbacks.remove("download_failed", self._episode_done)
+        scraper.callbacks.remove("download_skipped", self._episode_skipped)
+        scraper.callbacks.remove("download_skipped_by_range", self._episodes_skipped_by_range)
+        scraper.callbacks.remove("download_ended", self._download_ended)
+        scraper.callbacks.remove("concurrency_adjusted", self._concurrency_adjusted)
+
+    # MARK: CALLBACKS
+
+    def _episode_done(self, scraper: Scraper, episode_no: int, **context) -> None:
+        status = scraper.download_status[episode_no] or "failed"
+        platform = scraper.PLATFORM
+        self.episodes.inc(platform, status)
+        if (stats := context.get("stats")) is not None:
+            self.episode_duration.observe(stats["duration"], platform, status)
+            self.downloaded_bytes.inc(platform, amount=stats["bytes"])
+        self._maybe_write_textfile()
+
+    def _episode_skipped(self, scraper: Scraper, reason: str, **context) -> None:
+        self.episodes.inc(scraper.PLATFORM, reason)
+
+    def _episodes_skipped_by_range(self, scraper: Scraper, reason: str, skipped_count: int, **context) -> None:
+        self.episodes.inc(scraper.PLATFORM, reason, amount=skipped_count)
+
+    def _download_started(self, scraper: Scraper, **context) -> None:
+        self._scrapers[id(scraper)] = scraper
+
+    def _download_ended(self, scraper: Scraper, finishing: bool, **context) -> None:
+        if finishing:
+            self._scrapers.pop(id(scraper), None)
+            self.write_textfile()
+
+    def _concurrency_adjusted(self, scraper: Scraper, direction: str, reason: str, **context) -> None:
+        self.concurrency_adjustments.inc(scraper.PLATFORM, direction, reason)
+
+    # MARK: GAUGES
+
+    def _per_scraper(self, function: Callable[[Scraper], float]) -> list[tuple[tuple, float]]:
+        return [((scraper.PLATFORM, str(scraper.webtoon_id)), function(scraper)) for scraper in list(self._scrapers.values())]
+
+    def _in_flight(self):
+        return self._per_scraper(lambda scraper: scraper.requests_in_flight)
+
+    def _concurrency_limit(self):
+        return self._per_scraper(lambda scraper: scraper.request_limit)
+
+    def _host_timeouts(self):
+        timeouts: dict[str, float] = {}
+        for scraper in list(self._scrapers.values()):
+            if scraper.concurrency_controller is not None:
+                timeouts |= scraper.concurrency_controller.host_timeouts
+        return [((host,), timeout) for host, timeout in timeouts.items()]
+
+    def _pending_callbacks(self):
+        return self._per_scraper(lambda scraper: scraper.callbacks.pending_count)
+
+    def _background_tasks(self):
+        return self._per_scraper(lambda scraper: scraper.background_tasks)
+
+    # MARK: OUTPUT
+
+    def render(self) -> str:
+        return self.registry.render()
+
+    def write_textfile(self, path: Path | str | None = None) -> None:
+        """textfile collector가 읽을 수 있도록 지표를 파일에 원자적으로 씁니다."""
+        path = Path(path) if path else self.textfile
+        if path is None:
+            return
+        temp_path = path.with_name(f".{path.name}.tmp")
+        temp_path.write_text(self.render(), "utf-8")
+        os.replace(temp_path, path)
+        self._last_written = time.monotonic()
+
+    def _maybe_write_textfile(self) -> None:
+        if self.textfile is not None and time.monotonic() - self._last_written >= self.textfile_interval:
+            self.write_textfile()
+
+    def serve(self, port: int, host: str = "127.0.0.1") -> ThreadingHTTPServer:
+        """`http://host:port/metrics`에서 지표를 제공하는 서버를 데몬 스레드에서 실행합니다."""
+        collector = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = collector.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args) -> None:
+                logger.debug(f"metrics server: {format % args}")
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=self._server.serve_forever, name="WebtoonScraperMetrics", daemon=True).start()
+        return self._server
+
+    def close(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        self.write_textfile()
@@ -0,0 +1,542 @@
+"""다운로드된 웹툰 디렉토리를 후처리합니다.
+
+에피소드 이미지를 하나의 긴 이미지로 이어붙이거나 일정한 높이의 페이지로 다시 자르는 기능과
+이미지를 WebP나 AVIF로 변환하는 기능을 제공합니다.
+후처리는 CPU를 많이 사용하기 때문에 에피소드 단위로 프로세스 풀에서 실행되며,
+CLI 명령어(`webtoon concat`, `webtoon transcode`)로 이미 다운로드된 디렉토리에 적용하거나
+다운로드 도중 훅으로 등록해 다음 에피소드를 다운로드하는 동안 처리할 수 있습니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+import shutil
+import struct
+import zlib
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from PIL import Image, features
+
+from .base import logger
+from .directory_state import DirectoryState, _directories_and_files_of, check_container_state
+
+if TYPE_CHECKING:
+    from .scrapers import Scraper
+
+IMAGE_EXTENSIONS = frozenset({"jpg", "jpeg", "png", "gif", "webp", "avif", "bmp"})
+# 애니메이션이 있을 수 있는 gif와 이미 변환된 이미지는 변환하지 않음
+TRANSCODABLE_EXTENSIONS = frozenset({"jpg", "jpeg", "png", "bmp"})
+TRANSCODE_FORMATS = {"webp": "WEBP", "avif": "AVIF"}
+ORIGINALS_DIRECTORY_NAME = "_originals"
+BACKGROUND_COLOR = (255, 255, 255)
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_IDAT_SIZE = 1 << 16
+
+
+def episode_images(episode_directory: Path) -> list[Path]:
+    """에피소드 디렉토리에서 이미지 파일만 순서대로 골라냅니다. 오디오 등 다른 파일은 제외됩니다."""
+    image_pattern = DirectoryState.Image(is_merged=False).pattern()
+    _, files = _directories_and_files_of(episode_directory)
+    return [
+        file for file in files
+        if (matched := image_pattern.match(file.name)) and matched["extension"].lower() in IMAGE_EXTENSIONS
+    ]
+
+
+def derived_webtoon_directory(webtoon_directory: Path, tag: str) -> Path:
+    """`제목(id)` 형태의 웹툰 디렉토리 이름으로부터 `제목(id, tag)` 형태의 디렉토리 경로를 만듭니다."""
+    matched = DirectoryState.WebtoonDirectory(is_merged=None).pattern().match(webtoon_directory.name)
+    if matched is None:
+        return webtoon_directory.with_name(f"{webtoon_directory.name} ({tag})")
+    return webtoon_directory.with_name(f"{matched['webtoon_name']}({matched['webtoon_id']}, {tag})")
+
+
+def _measure(images: Sequence[Path]) -> tuple[int, list[int]]:
+    """canvas의 폭과 각 이미지의 높이를 구합니다. Image.open은 헤더만 읽기 때문에 이미지 전체를 디코딩하지 않습니다."""
+    width = 0
+    heights = []
+    for image_path in images:
+        with Image.open(image_path) as image:
+            width = max(width, image.width)
+            heights.append(image.height)
+    return width, heights
+
+
+def _open_tile(image_path: Path, width: int) -> Image.Image:
+    """이미지를 RGB로 변환하고 폭이 좁다면 가운데 정렬해 canvas의 폭에 맞춥니다."""
+    with Image.open(image_path) as image:
+        if image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info):
+            rgba = image.convert("RGBA")
+            tile = Image.new("RGB", rgba.size, BACKGROUND_COLOR)
+            tile.paste(rgba, mask=rgba.getchannel("A"))
+        else:
+            tile = image.convert("RGB")
+
+    if tile.width == width:
+        return tile
+    fitted = Image.new("RGB", (width, tile.height), BACKGROUND_COLOR)
+    fitted.paste(tile, ((width - tile.width) // 2, 0))
+    return fitted
+
+
+def _write_png_chunk(file, chunk_type: bytes, data: bytes) -> None:
+    file.write(struct.pack(">I", len(data)))
+    file.write(chunk_type)
+    file.write(data)
+    file.write(struct.pack(">I", zlib.crc32(data, zlib.crc32(chunk_type))))
+
+
+def concat_images(images: Sequence[Path], output: Path, *, compress_level: int = 6) -> Path:
+    """이미지들을 세로로 이어붙여 하나의 PNG 파일로 저장합니다.
+
+    Pillow로 전체 canvas를 만들면 50000픽셀이 넘는 에피소드에서 수백 MB의 메모리를 사용하기 때문에
+    PNG 스트림을 직접 인코딩해 한 번에 타일 하나만 메모리에 올립니다.
+    """
+    width, heights = _measure(images)
+    height = sum(heights)
+    if not width or not height:
+        raise ValueError("There are no images to concatenate.")
+
+    temp_output = output.with_name(f"._{output.name}.tmp")
+    compressor = zlib.compressobj(compress_level)
+    stride = width * 3
+    with temp_output.open("wb") as f:
+        f.write(_PNG_SIGNATURE)
+        # 8-bit RGB, non-interlaced
+        _write_png_chunk(f, b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        pending = bytearray()
+        for image_path in images:
+            raw = _open_tile(image_path, width).tobytes()
+            # 각 행 앞에 필터 타입 0(None)을 붙임
+            scanlines = b"".join(b"\x00" + raw[start:start + stride] for start in range(0, len(raw), stride))
+            pending += compressor.compress(scanlines)
+            while len(pending) >= _IDAT_SIZE:
+                _write_png_chunk(f, b"IDAT", bytes(pending[:_IDAT_SIZE]))
+                del pending[:_IDAT_SIZE]
+        pending += compressor.flush()
+        if pending:
+            _write_png_chunk(f, b"IDAT", bytes(pending))
+        _write_png_chunk(f, b"IEND", b"")
+    os.replace(temp_output, output)
+    return output
+
+
+def slice_images(
+    images: Sequence[Path],
+    output_directory: Path,
+    page_height: int,
+    *,
+    image_format: str = "jpg",
+    quality: int = 90,
+) -> list[Path]:
+    """이미지들을 이어붙인 뒤 일정한 높이의 페이지로 다시 자릅니다. 마지막 페이지는 남은 높이만큼만 저장됩니다.
+
+    메모리에는 현재 만들고 있는 페이지 하나와 타일 하나만 올라갑니다.
+    """
+    if page_height <= 0:
+        raise ValueError(f"Page height must be positive: {page_height}")
+
+    width, _ = _measure(images)
+    pages: list[Path] = []
+    page = Image.new("RGB", (width, page_height), BACKGROUND_COLOR)
+    filled = 0
+
+    def save_page(page: Image.Image) -> None:
+        page_path = output_directory / f"{len(pages) + 1:03d}.{image_format}"
+        temp_path = page_path.with_name(f"._{page_path.name}.tmp")
+        page.save(temp_path, format=Image.registered_extensions()[f".{image_format}"], quality=quality)
+        os.replace(temp_path, page_path)
+        pages.append(page_path)
+
+    for image_path in images:
+        tile = _open_tile(image_path, width)
+        offset = 0
+        while offset < tile.height:
+            amount = min(page_height - filled, tile.height - offset)
+            page.paste(tile.crop((0, offset, width, offset + amount)), (0, filled))
+            filled += amount
+            offset += amount
+            if filled == page_height:
+                save_page(page)
+                page = Image.new("RGB", (width, page_height), BACKGROUND_COLOR)
+                filled = 0
+
+    if filled:
+        save_page(page.crop((0, 0, width, filled)))
+    return pages
+
+
+def concat_episode(
+    episode_directory: Path | str,
+    output_directory: Path | str,
+    page_height: int | None = None,
+    *,
+    image_format: str = "jpg",
+    quality: int = 90,
+) -> int:
+    """에피소드 디렉토리 하나를 이어붙여 output_directory에 저장하고 저장된 이미지의 개수를 반환합니다.
+
+    page_height가 None이면 하나의 PNG(`001.png`)로, 아니라면 해당 높이의 페이지들로 저장합니다.
+    프로세스 풀에서 실행될 수 있도록 모듈 최상단에 정의되어 있습니다.
+    """
+    episode_directory = Path(episode_directory)
+    output_directory = Path(output_directory)
+    images = episode_images(episode_directory)
+    if not images:
+        return 0
+
+    output_directory.mkdir(parents=True, exist_ok=True)
+    if page_height is None:
+        concat_images(images, output_directory / "001.png")
+        return 1
+    return len(slice_images(images, output_directory, page_height, image_format=image_format, quality=quality))
+
+
+def _copy_webtoon_metadata(webtoon_directory: Path, target_directory: Path) -> None:
+    """결과 디렉토리도 웹툰 디렉토리로 인식될 수 있도록 information.json(따로 저장된 카테고리 포함)과 썸네일을 복사합니다."""
+    target_directory.mkdir(parents=True, exist_ok=True)
+    for file in _directories_and_files_of(webtoon_directory)[1]:
+        if file.name.startswith(("information.", "thumbnail.")):
+            shutil.copy2(file, target_directory / file.name)
+
+
+def concat_webtoon(
+    webtoon_directory: Path | str,
+    target_directory: Path | str | None = None,
+    page_height: int | None = None,
+    *,
+    max_workers: int | None = None,
+    image_format: str = "jpg",
+    quality: int = 90,
+    skip_existing: bool = True,
+) -> Path:
+    """웹툰 디렉토리의 모든 에피소드를 프로세스 풀에서 병렬로 이어붙입니다.
+
+    Args:
+        webtoon_directory: 이어붙일 웹툰 디렉토리입니다.
+        target_directory: 결과를 저장할 디렉토리입니다. 기본값은 `제목(id, concatenated)`입니다.
+        page_height: 다시 자를 페이지의 높이입니다. None이면 에피소드당 하나의 이미지로 이어붙입니다.
+        max_workers: 사용할 프로세스의 개수입니다. 기본값은 CPU 코어의 개수입니다.
+        skip_existing: 이미 결과 디렉토리가 존재하는 에피소드는 건너뜁니다.
+
+    Returns:
+        결과가 저장된 디렉토리를 반환합니다.
+    """
+    webtoon_directory = Path(webtoon_directory)
+    if target_directory is None:
+        target_directory = derived_webtoon_directory(webtoon_directory, "concatenated")
+    target_directory = Path(target_directory)
+    _copy_webtoon_metadata(webtoon_directory, target_directory)
+
+    jobs = []
+    function = functools.partial(concat_episode, image_format=image_format, quality=quality)
+    for episode_directory in _directories_and_files_of(webtoon_directory)[0]:
+        output_directory = target_directory / episode_directory.name
+        if skip_existing and output_directory.is_dir() and os.listdir(output_directory):
+            logger.debug(f"Concatenated episode {episode_directory.name!r} already exists.")
+            continue
+        jobs.append((episode_directory, function, (episode_directory, output_directory, page_height)))
+
+    for episode_directory, image_count in _run_episode_jobs(jobs, max_workers, "concatenate"):
+        logger.info(f"{episode_directory.name!r} concatenated into {image_count} image(s)")
+    return target_directory
+
+
+def _run_episode_jobs(jobs: Sequence[tuple[Path, Callable, tuple]], max_workers: int | None, verb: str) -> Iterable[tuple[Path, Any]]:
+    """에피소드별 작업을 프로세스 풀에서 실행하고 성공한 작업의 결과를 순서대로 내보냅니다. 실패한 작업은 로그만 남깁니다."""
+    if not jobs:
+        return
+    with ProcessPoolExecutor(max_workers) as executor:
+        futures: dict[Future, Path] = {executor.submit(function, *args): episode_directory for episode_directory, function, args in jobs}
+        for future, episode_directory in futures.items():
+            try:
+                result = future.result()
+            except Exception as exc:
+                logger.error(f"Failed to {verb} {episode_directory.name!r}. {type(exc).__name__}: {exc}")
+            else:
+                yield episode_directory, result
+
+
+def transcode_image(
+    image_path: Path,
+    image_format: str = "webp",
+    quality: int = 80,
+    *,
+    originals_directory: Path | None = None,
+) -> tuple[Path, int, int]:
+    """이미지 하나를 변환하고 (결과 경로, 원본 크기, 결과 크기)를 반환합니다.
+
+    변환된 이미지는 임시 파일에 저장된 뒤 `os.replace`로 옮겨지기 때문에 중간에 중단되더라도
+    이미지가 깨지거나 사라지지 않습니다. 원본은 결과가 자리를 잡은 뒤에야 삭제되거나
+    originals_directory로 옮겨지며, 이전 실행이 그 사이에 중단되었다면 원본만 정리합니다.
+    변환 결과가 원본보다 크다면 원본을 그대로 둡니다.
+    """
+    pillow_format = TRANSCODE_FORMATS[image_format]
+    original_size = image_path.stat().st_size
+    target_path = image_path.with_suffix(f".{image_format}")
+    if target_path == image_path:
+        return image_path, original_size, original_size
+
+    if not target_path.exists():
+        temp_path = target_path.with_name(f"._{target_path.name}.tmp")
+        with Image.open(image_path) as image:
+            if image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA" if "transparency" in image.info or image.mode in ("LA", "PA") else "RGB")
+            image.save(temp_path, format=pillow_format, quality=quality)
+        if temp_path.stat().st_size >= original_size:
+            temp_path.unlink()
+            return image_path, original_size, original_size
+        os.replace(temp_path, target_path)
+
+    if originals_directory is None:
+        image_path.unlink()
+    else:
+        originals_directory.mkdir(parents=True, exist_ok=True)
+        os.replace(image_path, originals_directory / image_path.name)
+    return target_path, original_size, target_path.stat().st_size
+
+
+def transcode_episode(
+    episode_directory: Path | str,
+    image_format: str = "webp",
+    quality: int = 80,
+    *,
+    keep_originals: bool = False,
+) -> tuple[int, int]:
+    """에피소드 디렉토리의 이미지들을 변환하고 (원본 크기 합, 결과 크기 합)을 반환합니다.
+
+    keep_originals가 True라면 원본은 웹툰 디렉토리의 `_originals/에피소드 이름/`으로 옮겨집니다.
+    `_`로 시작하는 디렉토리는 파일로 취급되기 때문에 웹툰 디렉토리는 그대로 인식됩니다.
+    """
+    episode_directory = Path(episode_directory)
+    originals_directory = episode_directory.parent / ORIGINALS_DIRECTORY_NAME / episode_directory.name if keep_originals else None
+    total_before = total_after = 0
+    for image_path in episode_images(episode_directory):
+        if image_path.suffix[1:].lower() not in TRANSCODABLE_EXTENSIONS:
+            continue
+        _, before, after = transcode_image(image_path, image_format, quality, originals_directory=originals_directory)
+        total_before += before
+        total_after += after
+    return total_before, total_after
+
+
+def check_transcode_format(image_format: str) -> None:
+    if image_format not in TRANSCODE_FORMATS:
+        raise ValueError(f"Unsupported image format to transcode: {image_format!r}. Supported formats: {', '.join(TRANSCODE_FORMATS)}")
+    if not features.check(image_format):
+        raise ValueError(f"Installed Pillow does not support {image_format!r}. Please upgrade Pillow with {image_format} support.")
+
+
+def transcode_webtoon(
+    webtoon_directory: Path | str,
+    image_format: str = "webp",
+    quality: int = 80,
+    *,
+    keep_originals: bool = False,
+    max_workers: int | None = None,
+) -> tuple[int, int]:
+    """웹툰 디렉토리의 모든 에피소드를 프로세스 풀에서 병렬로 변환하고 (원본 크기 합, 결과 크기 합)을 반환합니다."""
+    check_transcode_format(image_format)
+    function = functools.partial(transcode_episode, keep_originals=keep_originals)
+    jobs = [
+        (episode_directory, function, (episode_directory, image_format, quality))
+        for episode_directory in _directories_and_files_of(Path(webtoon_directory))[0]
+    ]
+    total_before = total_after = 0
+    for episode_directory, (before, after) in _run_episode_jobs(jobs, max_workers, "transcode"):
+        logger.debug(f"{episode_directory.name!r} transcoded ({format_saving(before, after)})")
+        total_before += before
+        total_after += after
+    return total_before, total_after
+
+
+def format_saving(before: int, after: int) -> str:
+    if not before:
+        return "nothing to transcode"
+    return f"{before / 1_000_000:.1f}MB -> {after / 1_000_000:.1f}MB, {(1 - after / before) * 100:.0f}% saved"
+
+
+class EpisodeProcessor(ABC):
+    """에피소드가 다운로드될 때마다 후처리 작업을 프로세스 풀에 넘기는 훅의 기반 클래스입니다.
+
+    `register`로 스크래퍼에 등록하면 `download_completed` 콜백에서 작업을 제출하기 때문에
+    후처리는 다음 에피소드가 다운로드되는 동안 다른 프로세스에서 실행됩니다.
+    다운로드가 끝나면(`download_ended`) 남은 작업을 모두 기다린 뒤 풀을 종료합니다.
+    서브클래스는 `process`를 구현해야 합니다.
+
+    대기 중인 작업이 max_pending개를 넘으면 작업 하나가 끝날 때까지 다음 에피소드로 넘어가지 않습니다.
+    기본값은 프로세스 개수의 두 배로, 후처리가 다운로드를 따라가는 동안에는 다운로드를 늦추지 않지만
+    후처리가 계속 밀리는 경우에는 처리되지 않은 에피소드가 끝없이 쌓이는 것을 막습니다.
+
+    `dependencies`에 다른 처리기를 추가하면 그 처리기들의 같은 에피소드에 대한 작업이 모두 끝난 뒤에 작업을 시작합니다.
+    에피소드 디렉토리를 지우는 처리기가 변환 등 같은 디렉토리를 읽고 쓰는 작업과 겹치지 않게 할 때 사용합니다.
+    의존하는 처리기가 먼저 등록되어 있어야 합니다.
+    """
+
+    def __init__(self, max_workers: int | None = None, max_pending: int | None = None) -> None:
+        self.max_workers = max_workers
+        self.max_pending = max_pending or 2 * (max_workers or os.cpu_count() or 1)
+        self.dependencies: list[EpisodeProcessor] = []
+        self._executor: Executor | None = None
+        self._pending: dict[asyncio.Future, str] = {}
+
+    def register(self, scraper: Scraper) -> None:
+        scraper.callbacks.register_async("download_completed", self.episode_downloaded)
+        scraper.callbacks.register_async("download_ended", self.download_ended)
+
+    def unregister(self, scraper: Scraper) -> None:
+        scraper.callbacks.remove("download_completed", self.episode_downloaded)
+        scraper.callbacks.remove("download_ended", self.download_ended)
+
+    @abstractmethod
+    def process(self, scraper: Scraper, episode_no: int, episode_directory: Path) -> tuple[Callable, tuple] | None:
+        """다른 프로세스에서 실행할 함수와 인자를 반환합니다. 함수와 인자는 모두 pickle될 수 있어야 합니다.
+
+        None을 반환하면 해당 에피소드를 처리하지 않습니다.
+        """
+        raise NotImplementedError
+
+    def _create_executor(self) -> Executor:
+        return ProcessPoolExecutor(self.max_workers)
+
+    async def episode_downloaded(self, scraper: Scraper, episode_no: int, **context) -> None:
+        directory_name = scraper.episode_dir_names[episode_no]
+        if directory_name is None:
+            return
+        episode_directory = scraper.directory_manager.webtoon_directory / directory_name
+        job = self.process(scraper, episode_no, episode_directory)
+        if job is None:
+            return
+
+        if len(self._pending) >= self.max_pending:
+            await asyncio.wait(list(self._pending), return_when=asyncio.FIRST_COMPLETED)
+
+        if self._executor is None:
+            self._executor = self._create_executor()
+        function, args = job
+        waiting_for = [
+            future
+            for processor in self.dependencies
+            for future, pending_name in processor._pending.items()
+            if pending_name == directory_name
+        ]
+        if waiting_for:
+            future = asyncio.ensure_future(self._run_after(waiting_for, function, args))
+        else:
+            future = asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+        self._pending[future] = directory_name
+        future.add_done_callback(self._job_done)
+
+    async def _run_after(self, waiting_for: list[asyncio.Future], function: Callable, args: tuple) -> Any:
+        # 앞선 작업이 실패하더라도 에피소드 디렉토리는 남아 있으니 그대로 진행함
+        await asyncio.wait(waiting_for)
+        assert self._executor is not None
+        return await asyncio.get_running_loop().run_in_executor(self._executor, function, *args)
+
+    def _job_done(self, future: asyncio.Future) -> None:
+        directory_name = self._pending.pop(future)
+        if future.cancelled():
+            return
+        if (exc := future.exception()) is not None:
+            logger.error(f"Failed to post-process {directory_name!r} with {type(self).__name__}. {type(exc).__name__}: {exc}")
+        else:
+            logger.debug(f"{directory_name!r} post-processed by {type(self).__name__}.")
+
+    async def download_ended(self, scraper: Scraper, finishing: bool, is_successful: bool = True, **context) -> None:
+        if not finishing:
+            return
+
+        if not is_successful:
+            for future in list(self._pending):
+                future.cancel()
+        elif self._pending:
+            await asyncio.wait(list(self._pending))
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=is_successful, cancel_futures=not is_successful)
+            self._executor = None
+
+
+class ImageConcatenator(EpisodeProcessor):
+    """다운로드된 에피소드를 `제목(id, concatenated)` 디렉토리에 이어붙여 저장하는 훅입니다.
+
+    Example:
+        ```python
+        scraper = NaverWebtoonScraper(819217)
+        ImageConcatenator(page_height=1600).register(scraper)
+        scraper.download_webtoon()
+        ```
+    """
+
+    def __init__(
+        self,
+        page_height: int | None = None,
+        *,
+        max_workers: int | None = None,
+        image_format: str = "jpg",
+        quality: int = 90,
+    ) -> None:
+        super().__init__(max_workers)
+        self.page_height = page_height
+        self.image_format = image_format
+        self.quality = quality
+
+    def process(self, scraper: Scraper, episode_no: int, episode_directory: Path) -> tuple[Callable, tuple] | None:
+        target_directory = derived_webtoon_directory(episode_directory.parent, "concatenated")
+        function = functools.partial(concat_episode, image_format=self.image_format, quality=self.quality)
+        return function, (episode_directory, target_directory / episode_directory.name, self.page_height)
+
+    async def download_ended(self, scraper: Scraper, finishing: bool, is_successful: bool = True, **context) -> None:
+        await super().download_ended(scraper, finishing, is_successful, **context)
+        if finishing:
+            webtoon_directory = scraper.directory_manager.webtoon_directory
+            target_directory = derived_webtoon_directory(webtoon_directory, "concatenated")
+            if target_directory.is_dir():
+                _copy_webtoon_metadata(webtoon_directory, target_directory)
+
+
+class ImageTranscoder(EpisodeProcessor):
+    """다운로드된 에피소드의 이미지를 WebP나 AVIF로 변환하는 훅입니다.
+
+    Example:
+        ```python
+        scraper = NaverWebtoonScraper(819217)
+        ImageTranscoder("webp", quality=80).register(scraper)
+        scraper.download_webtoon()
+        ```
+    """
+
+    def __init__(
+        self,
+        image_format: str = "webp",
+        quality: int = 80,
+        *,
+        keep_originals: bool = False,
+        max_workers: int | None = None,
+        max_pending: int | None = None,
+    ) -> None:
+        check_transcode_format(image_format)
+        super().__init__(max_workers, max_pending)
+        self.image_format = image_format
+        self.quality = quality
+        self.keep_originals = keep_originals
+
+    def process(self, scraper: Scraper, episode_no: int, episode_directory: Path) -> tuple[Callable, tuple] | None:
+        function = functools.partial(transcode_episode, keep_originals=self.keep_originals)
+        return function, (episode_directory, self.image_format, self.quality)
+
+
+def iter_webtoon_directories(paths: Iterable[Path]) -> Iterable[Path]:
+    """주어진 경로가 웹툰 디렉토리라면 그대로, 웹툰 디렉토리들을 담은 디렉토리라면 그 안의 웹툰 디렉토리들을 내보냅니다."""
+    for path in paths:
+        match check_container_state(path):
+            case DirectoryState.WebtoonDirectoryContainer():
+                yield from _directories_and_files_of(path)[0]
+            case _:
+                yield path
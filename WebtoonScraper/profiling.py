@@ -0,0 +1,126 @@
+"""다운로드가 어디에서 시간을 쓰는지 측정합니다.
+
+* PhaseTimer: 스크래퍼의 각 단계(정보 불러오기, 다운로드 간격, 에피소드 페이지 요청, 파싱, 이미지 전송, 파일 쓰기 등)에 걸린 시간을 모읍니다.
+    `scraper.phase_timer`에 설정하면 `download_ended` 콜백의 `phases`로도 받을 수 있습니다.
+* StackSampler: 주기적으로 스레드의 콜 스택을 수집해 flamegraph.pl이나 speedscope가 읽을 수 있는 collapsed stack 형식으로 저장합니다.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from rich.table import Table
+
+from .base import console
+
+__all__ = ["PhaseTimer", "StackSampler"]
+
+
+class PhaseTimer:
+    """단계별로 걸린 시간을 누적합니다.
+
+    여러 에피소드나 이미지가 동시에 진행되면 각 단계의 시간은 겹쳐서 더해지기 때문에
+    단계별 합계는 실제로 흐른 시간(wall time)보다 클 수 있습니다.
+    """
+
+    def __init__(self) -> None:
+        self.started_at = time.perf_counter()
+        self.totals: defaultdict[str, float] = defaultdict(float)
+        self.counts: defaultdict[str, int] = defaultdict(int)
+        self.maximums: defaultdict[str, float] = defaultdict(float)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.totals[name] += elapsed
+            self.counts[name] += 1
+            if elapsed > self.maximums[name]:
+                self.maximums[name] = elapsed
+
+    @property
+    def wall_time(self) -> float:
+        return time.perf_counter() - self.started_at
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        return {
+            name: dict(
+                total=round(total, 6),
+                count=self.counts[name],
+                average=round(total / self.counts[name], 6),
+                max=round(self.maximums[name], 6),
+            )
+            for name, total in sorted(self.totals.items(), key=lambda item: -item[1])
+        }
+
+    def print_table(self, title: str | None = None) -> None:
+        wall_time = self.wall_time
+        table = Table(title=title or f"Phase breakdown (wall time {wall_time:.2f}s)", header_style="bold blue", box=None)
+        table.add_column("Phase", style="bold")
+        table.add_column("Total", justify="right")
+        table.add_column("% of wall", justify="right")
+        table.add_column("Count", justify="right")
+        table.add_column("Average", justify="right")
+        table.add_column("Max", justify="right")
+        for name, stats in self.summary().items():
+            table.add_row(
+                name,
+                f"{stats['total']:.3f}s",
+                f"{stats['total'] / wall_time:.1%}" if wall_time else "-",
+                str(stats["count"]),
+                f"{stats['average'] * 1000:.1f}ms",
+                f"{stats['max'] * 1000:.1f}ms",
+            )
+        console.print(table)
+
+
+class StackSampler:
+    """스레드의 콜 스택을 주기적으로 수집합니다.
+
+    cProfile과 달리 asyncio 코루틴의 await 지점까지 포함한 전체 스택이 기록되며,
+    수집 주기만큼의 정확도를 가지는 대신 부하가 적습니다.
+    """
+
+    def __init__(self, interval: float = 0.005, thread_id: int | None = None) -> None:
+        self.interval = interval
+        self.thread_id = threading.get_ident() if thread_id is None else thread_id
+        self.stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="WebtoonScraperStackSampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{code.co_qualname} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+                frame = frame.f_back
+            self.stacks[";".join(reversed(names))] += 1
+
+    def write_collapsed(self, path: Path | str) -> None:
+        with open(path, "w", encoding="utf-8") as file:
+            for stack, count in self.stacks.most_common():
+                file.write(f"{stack} {count}\n")
@@ -0,0 +1,173 @@
+"""스크래퍼가 주고받은 HTTP 요청과 응답을 기록하고 재생합니다.
+
+* HTTPRecorder: 스크래퍼의 클라이언트를 거치는 모든 요청과 응답을 zip 아카이브에 기록합니다.
+* HTTPReplayer: 기록된 아카이브로 응답하며, 네트워크에는 전혀 접속하지 않습니다.
+
+둘 다 httpx의 transport 단계에서 동작하기 때문에 모든 스크래퍼에 사용할 수 있습니다.
+아카이브에는 요청마다 메타데이터(`NNNNNN.json`)와 응답 본문(`NNNNNN.body`)이 저장되며,
+본문은 content-encoding이 풀리지 않은 원래의 바이트 그대로 저장됩니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+import zipfile
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import httpx
+
+if TYPE_CHECKING:
+    from .scrapers import Scraper
+
+__all__ = ["CREDENTIAL_HEADERS", "HTTPRecorder", "HTTPReplayer", "ReplayMissError"]
+
+CREDENTIAL_HEADERS = frozenset({"cookie", "set-cookie", "authorization", "proxy-authorization"})
+# 이미 압축된 형식은 다시 압축해도 크기가 거의 줄지 않음
+_STORED_CONTENT_TYPES = ("image/", "audio/", "video/", "application/zip", "application/gzip")
+
+
+class ReplayMissError(httpx.TransportError):
+    """아카이브에 기록되지 않은 요청을 보냈을 때 발생합니다."""
+
+
+def _request_key(method: str, url: str) -> tuple[str, str]:
+    return method.upper(), url
+
+
+class _RecordingTransport(httpx.AsyncBaseTransport):
+    def __init__(self, transport: httpx.AsyncBaseTransport, recorder: HTTPRecorder) -> None:
+        self.transport = transport
+        self.recorder = recorder
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        start = time.perf_counter()
+        response = await self.transport.handle_async_request(request)
+        try:
+            # response.aiter_raw()는 transport가 이미 읽은 응답(MockTransport 등)에는 사용할 수 없어 stream을 직접 읽음
+            body = b"".join([chunk async for chunk in response.stream])  # type: ignore
+        finally:
+            await response.aclose()
+        self.recorder.record(request, response, body, time.perf_counter() - start)
+        return httpx.Response(
+            response.status_code,
+            headers=response.headers,
+            stream=httpx.ByteStream(body),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class _ReplayTransport(httpx.AsyncBaseTransport):
+    def __init__(self, replayer: HTTPReplayer) -> None:
+        self.replayer = replayer
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        entry, body = self.replayer.lookup(request)
+        if self.replayer.simulate_latency:
+            await asyncio.sleep(entry["elapsed"])
+        return httpx.Response(
+            entry["status_code"],
+            headers=entry["response_headers"],
+            stream=httpx.ByteStream(body),
+            extensions=dict(http_version=entry["http_version"].encode(), reason_phrase=entry["reason_phrase"].encode()),
+        )
+
+
+def _replace_transports(scraper: Scraper, replace) -> None:
+    # httpx는 생성된 클라이언트의 transport를 바꾸는 공개 API를 제공하지 않음.
+    # 클라이언트를 새로 만들면 스크래퍼들이 이후에 설정한 쿠키나 재시도 설정 등을 옮겨야 하기 때문에 transport만 바꿔 끼운다.
+    client = scraper.client
+    client._transport = replace(client._transport)
+    client._mounts = {pattern: transport and replace(transport) for pattern, transport in client._mounts.items()}
+
+
+class HTTPRecorder:
+    """스크래퍼의 HTTP 요청과 응답을 zip 아카이브에 기록합니다.
+
+    여러 스크래퍼에 등록할 수 있으며, 모두 같은 아카이브에 기록됩니다.
+    `strip_credentials`가 True라면 쿠키와 인증 헤더는 기록되지 않습니다.
+    """
+
+    def __init__(self, path: Path | str, strip_credentials: bool = True) -> None:
+        self.path = Path(path)
+        self.strip_credentials = strip_credentials
+        self._archive: zipfile.ZipFile | None = None
+        self._count = 0
+
+    def register(self, scraper: Scraper) -> None:
+        if self._archive is None:
+            self._archive = zipfile.ZipFile(self.path, "w", zipfile.ZIP_DEFLATED)
+        _replace_transports(scraper, lambda transport: _RecordingTransport(transport, self))
+
+    def unregister(self, scraper: Scraper) -> None:
+        _replace_transports(scraper, lambda transport: transport.transport if isinstance(transport, _RecordingTransport) else transport)
+
+    def close(self) -> None:
+        if self._archive is not None:
+            self._archive.close()
+            self._archive = None
+
+    def _headers(self, headers: httpx.Headers) -> list[tuple[str, str]]:
+        return [
+            (key, value)
+            for key, value in headers.multi_items()
+            if not (self.strip_credentials and key.lower() in CREDENTIAL_HEADERS)
+        ]
+
+    def record(self, request: httpx.Request, response: httpx.Response, body: bytes, elapsed: float) -> None:
+        if self._archive is None:
+            return
+        self._count += 1
+        name = f"{self._count:06d}"
+        entry = dict(
+            method=request.method,
+            url=str(request.url),
+            request_headers=self._headers(request.headers),
+            status_code=response.status_code,
+            http_version=response.http_version,
+            reason_phrase=response.reason_phrase,
+            response_headers=self._headers(response.headers),
+            elapsed=round(elapsed, 6),
+        )
+        content_type = response.headers.get("content-type", "")
+        compression = zipfile.ZIP_STORED if content_type.startswith(_STORED_CONTENT_TYPES) else zipfile.ZIP_DEFLATED
+        self._archive.writestr(f"{name}.json", json.dumps(entry, ensure_ascii=False))
+        self._archive.writestr(f"{name}.body", body, compress_type=compression)
+
+
+class HTTPReplayer:
+    """HTTPRecorder로 기록한 아카이브로 스크래퍼의 요청에 응답합니다.
+
+    같은 요청이 여러 번 기록되었다면 기록된 순서대로 응답하고, 마지막 응답은 이후에도 계속 사용합니다.
+    기록되지 않은 요청에는 ReplayMissError가 발생합니다.
+    `simulate_latency`가 True라면 기록될 때 걸렸던 만큼 기다린 후 응답합니다.
+    """
+
+    def __init__(self, path: Path | str, simulate_latency: bool = False) -> None:
+        self.path = Path(path)
+        self.simulate_latency = simulate_latency
+        self._archive = zipfile.ZipFile(self.path)
+        self._entries: defaultdict[tuple[str, str], deque[tuple[dict, str]]] = defaultdict(deque)
+        for name in sorted(self._archive.namelist()):
+            if name.endswith(".json"):
+                entry = json.loads(self._archive.read(name))
+                self._entries[_request_key(entry["method"], entry["url"])].append((entry, name.removesuffix(".json") + ".body"))
+
+    def register(self, scraper: Scraper) -> None:
+        _replace_transports(scraper, lambda _: _ReplayTransport(self))
+
+    def close(self) -> None:
+        self._archive.close()
+
+    def lookup(self, request: httpx.Request) -> tuple[dict, bytes]:
+        entries = self._entries.get(_request_key(request.method, str(request.url)))
+        if not entries:
+            raise ReplayMissError(f"No recorded response for {request.method} {request.url} in {self.path}", request=request)
+        entry, body_name = entries.popleft() if len(entries) > 1 else entries[0]
+        return entry, self._archive.read(body_name)
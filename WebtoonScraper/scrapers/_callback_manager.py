@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import logging
 import typing
 from collections import defaultdict
 from collections.abc import Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from typing import (
     Any,
@@ -17,6 +19,7 @@ from ..base import logger
 
 CallableT = TypeVar("CallableT", bound=Callable)
 LogLevel = typing.Literal["debug", "info", "warning", "error", "critical"] | int
+CallbackMode = typing.Literal["inline", "thread", "queue"]
 
 
 class Callback(NamedTuple):
@@ -25,15 +28,36 @@ class Callback(NamedTuple):
     replace_default: bool
     # must_execute: bool = True  # 미래에 모든 콜백이 종료되는 기능이 생기면 추가할 것.
     use_task: bool | None = None
+    use_thread: bool = False
 
 
 class CallbackManager:
-    """콜백을 관리합니다."""
+    """콜백을 관리합니다.
+
+    콜백은 등록될 때 실행 방식을 정할 수 있습니다.
+    * inline: 콜백이 호출된 자리에서 실행되며 끝날 때까지 다운로드가 멈춥니다. 기본값입니다.
+    * thread: (동기 콜백만 가능) 스레드 풀에서 실행됩니다.
+    * queue: (비동기 콜백만 가능) 별도의 task로 실행됩니다.
+
+    thread나 queue로 실행되는 콜백은 최대 `max_pending`개까지만 동시에 대기할 수 있으며,
+    이를 넘으면 자리가 생길 때까지 콜백을 호출한 쪽이 기다립니다.
+    대기 중인 콜백은 `drain()`으로 모두 완료하거나 취소할 수 있고, 스크래퍼는 `download_ended`에서 이를 호출합니다.
+    """
 
     def __init__(self, default_context: dict | None = None):
         self.disable_default_callbacks = False
+        self.max_pending: int = 16
+        self.thread_workers: int = 4
+        self._pending: set[asyncio.Future] = set()
+        self._slots: asyncio.Semaphore | None = None
+        self._executor: ThreadPoolExecutor | None = None
         self.callbacks: defaultdict[str, list[Callback]] = defaultdict(list)
         self.default_context = default_context or {}
+        # 콜백은 대부분 다운로드 전에 등록되고 다운로드 중에는 에피소드마다 여러 번 호출되기 때문에
+        # 트리거별로 실행할 콜백 목록과 기본 콜백을 대체하는지 여부를 미리 계산해 둔다.
+        # self.callbacks를 변경하는 메서드는 반드시 _invalidate()를 호출해야 한다.
+        self._compiled: dict[str, tuple[tuple[Callback, ...], bool]] = {}
+        self._created: dict[tuple, Callback] = {}
 
     def create(
         self,
@@ -47,8 +71,31 @@ class CallbackManager:
         is_async: bool = False,
         use_task: bool = False,
     ) -> Callback:
-        """기본 콜백을 생성합니다."""
+        """기본 콜백을 생성합니다.
 
+        `extra_context`가 없다면 같은 인자로 생성된 콜백은 재사용됩니다.
+        """
+        if extra_context is None:
+            key = (message, func, level, progress_update, log_with_progress, is_async, use_task)
+            try:
+                return self._created[key]
+            except KeyError:
+                callback = self._created[key] = self._create(message, None, func=func, level=level, progress_update=progress_update, log_with_progress=log_with_progress, is_async=is_async, use_task=use_task)
+                return callback
+        return self._create(message, extra_context, func=func, level=level, progress_update=progress_update, log_with_progress=log_with_progress, is_async=is_async, use_task=use_task)
+
+    def _create(
+        self,
+        message: str | Callable | None,
+        extra_context: dict | None,
+        *,
+        func: Callable | None,
+        level: LogLevel,
+        progress_update: str | Callable | None,
+        log_with_progress: bool,
+        is_async: bool,
+        use_task: bool,
+    ) -> Callback:
         if func is not None:
             return Callback(
                 func,
@@ -66,17 +113,17 @@ class CallbackManager:
                 extra_context = extra_context or {}
 
                 self = context["scraper"]
-                if self.use_progress_bar and progress_update is not None:
+                if self.use_progress_bar and progress_update is not None and self.progress_task_id is not None:
                     if isinstance(progress_update, str):
-                        log = progress_update.format(**context, **extra_context)
+                        # 실제 포맷은 진행 표시줄이 다시 그려질 때 이루어짐
+                        self.progress.update_description(self.progress_task_id, progress_update, context, extra_context)
                     else:
-                        log = await progress_update(**context, **extra_context)
-                    self.progress.update(self.progress_task_id, description=log)
+                        self.progress.update(self.progress_task_id, description=await progress_update(**context, **extra_context))
                     updated = True
                 else:
                     updated = False
 
-                if message is not None and (not updated or updated and log_with_progress):
+                if message is not None and (not updated or updated and log_with_progress) and logger.isEnabledFor(level):
                     if isinstance(message, str):
                         log = message.format(**context, **extra_context)
                     else:
@@ -88,17 +135,17 @@ class CallbackManager:
                 extra_context = extra_context or {}
 
                 self = context["scraper"]
-                if self.use_progress_bar and progress_update is not None:
+                if self.use_progress_bar and progress_update is not None and self.progress_task_id is not None:
                     if isinstance(progress_update, str):
-                        log = progress_update.format(**context, **extra_context)
+                        # 실제 포맷은 진행 표시줄이 다시 그려질 때 이루어짐
+                        self.progress.update_description(self.progress_task_id, progress_update, context, extra_context)
                     else:
-                        log = progress_update(**context, **extra_context)
-                    self.progress.update(self.progress_task_id, description=log)
+                        self.progress.update(self.progress_task_id, description=progress_update(**context, **extra_context))
                     updated = True
                 else:
                     updated = False
 
-                if message is not None and (not updated or updated and log_with_progress):
+                if message is not None and (not updated or updated and log_with_progress) and logger.isEnabledFor(level):
                     if isinstance(message, str):
                         log = message.format(**context, **extra_context)
                     else:
@@ -113,36 +160,63 @@ class CallbackManager:
         )
 
     @overload
-    def register_async(self, trigger: str, func: CallableT, *, replace_default: bool = False, blocking: bool = True) -> CallableT: ...
+    def register_async(self, trigger: str, func: CallableT, *, replace_default: bool = False, blocking: bool = True, mode: CallbackMode | None = None) -> CallableT: ...
 
     @overload
-    def register_async(self, trigger: str, *, replace_default: bool = False, blocking: bool = True) -> Callable[[CallableT], CallableT]: ...
+    def register_async(self, trigger: str, *, replace_default: bool = False, blocking: bool = True, mode: CallbackMode | None = None) -> Callable[[CallableT], CallableT]: ...
+
+    def register_async(
+        self,
+        trigger: str,
+        func: Callable[..., Coroutine] | None = None,
+        *,
+        replace_default: bool = False,
+        blocking: bool = True,
+        mode: CallbackMode | None = None,
+    ) -> Any:
+        """특정 callback 트리거가 발생했을 때 실행할 비동기 콜백을 등록합니다.
 
-    def register_async(self, trigger: str, func: Callable[..., Coroutine] | None = None, *, replace_default: bool = False, blocking: bool = True) -> Any:
-        """특정 callback 트리거가 발생했을 때 실행할 비동기 콜백을 등록합니다."""
+        `blocking=False`는 `mode="queue"`와 같습니다.
+        queue로 실행되는 콜백의 task는 `async_callback`의 반환값으로 받을 수 있습니다.
+        """
         if func is None:
-            return lambda func: self.register_async(trigger, func, replace_default=replace_default, blocking=blocking)
+            return lambda func: self.register_async(trigger, func, replace_default=replace_default, blocking=blocking, mode=mode)
 
         # blocking으로 할지 말지를 callback을 등록할 때 해야 할까, 아님 부를 때 결정해야 할까?
         # 실례를 한번 봐야 할 것 같은데 아직은 잘 모르겠다.
         # 일단 지금은 callback을 등록할 때 결정하는 것으로 한다.
-        self.callbacks[trigger].append(Callback(func, is_async=True, replace_default=replace_default, use_task=not blocking))
+        if mode is None:
+            mode = "inline" if blocking else "queue"
+        if mode == "thread":
+            raise ValueError("Async callbacks can't be run in a thread. Use mode='queue' instead.")
+        self.callbacks[trigger].append(Callback(func, is_async=True, replace_default=replace_default, use_task=mode == "queue"))
+        self._invalidate(trigger)
         return func
 
     def remove(self, trigger: str, func_or_callback: Callable | Callback) -> None:
         if isinstance(func_or_callback, Callback):
             self.callbacks[trigger].remove(func_or_callback)
         else:
-            self.callbacks[trigger][:] = (callback for callback in self.callbacks[trigger] if callback.function is not func_or_callback)
+            # 메서드는 접근할 때마다 새 객체가 만들어지니 is 대신 ==로 비교함
+            self.callbacks[trigger][:] = (callback for callback in self.callbacks[trigger] if callback.function != func_or_callback)
+        self._invalidate(trigger)
+
+    def _invalidate(self, trigger: str) -> None:
+        self._compiled.pop(trigger, None)
+
+    def _compile(self, trigger: str) -> tuple[tuple[Callback, ...], bool]:
+        callbacks = tuple(self.callbacks.get(trigger, ()))
+        compiled = self._compiled[trigger] = callbacks, any(callback.replace_default for callback in callbacks)
+        return compiled
 
     @overload
-    def register(self, trigger: str, func: CallableT, *, replace_default: bool = False) -> CallableT: ...
+    def register(self, trigger: str, func: CallableT, *, replace_default: bool = False, mode: CallbackMode = "inline") -> CallableT: ...
 
     @overload
     def register(self, trigger: str, *, log_format: str, log_level: typing.Literal["info", "warning", "error", "critical"] | int = "info", replace_default: bool = False) -> None: ...
 
     @overload
-    def register(self, trigger: str, *, replace_default: bool = False) -> Callable[[CallableT], CallableT]: ...
+    def register(self, trigger: str, *, replace_default: bool = False, mode: CallbackMode = "inline") -> Callable[[CallableT], CallableT]: ...
 
     def register(
         self,
@@ -152,6 +226,7 @@ class CallbackManager:
         log_format: str | None = None,
         log_level: LogLevel = "info",
         replace_default: bool = False,
+        mode: CallbackMode = "inline",
     ):
         """특정 callback 트리거가 발생했을 때 실행할 콜백을 등록합니다.
 
@@ -178,16 +253,21 @@ class CallbackManager:
             trigger (str): callback을 실행할 명령어를 결정합니다.
             func (Callable, optional): 이 인자는 설정되지 않을 수 있으며, 설정되지 않을 경우 데코레이터로서 사용할 수 있습니다.
             replace_default (bool, optional): 기본으로 설정되어 있는 callback을 대체할 것인지 설정합니다. True로 설정할 경우 기존 callback은 실행되지 않습니다.
+            mode ("inline" | "thread", optional): "thread"로 설정하면 콜백이 스레드 풀에서 실행되어 다운로드를 멈추지 않습니다.
+                파일 업로드처럼 오래 걸리는 콜백에 사용하세요. 이 경우 콜백은 스레드 안전해야 합니다.
         """
+        if mode == "queue":
+            raise ValueError("Sync callbacks can't be queued. Use mode='thread' instead.")
         if func is None and log_format is None:
-            return lambda func: self.register(trigger, func, replace_default=replace_default)
+            return lambda func: self.register(trigger, func, replace_default=replace_default, mode=mode)
 
         if log_format is not None:
             if isinstance(log_level, str):
                 log_level = logging._nameToLevel[log_level.upper()]
             func = lambda scraper, **context: logger.log(log_level, log_format.format(context))  # noqa: E731
 
-        self.callbacks[trigger].append(Callback(func, is_async=False, replace_default=replace_default))  # type: ignore
+        self.callbacks[trigger].append(Callback(func, is_async=False, replace_default=replace_default, use_thread=mode == "thread"))  # type: ignore
+        self._invalidate(trigger)
         return func
 
     async def async_callback(
@@ -195,37 +275,46 @@ class CallbackManager:
         situation: str,
         default_callback: Callback | None = None,
         **context,
-    ) -> list[asyncio.Task] | None:
+    ) -> list[asyncio.Future] | None:
         # async_callback이 callback을 부르지 않으니 둘 다 수정하도록 할 것
         # async_callback이 더 상위 개념이고 async_callback이
         # callback도 부를 수 있으니 async_callback을 사용할 수 있는 순간에는
         # 무조건 async_callback을 사용할 것.
-        skip_default = False
+        try:
+            callbacks, skip_default = self._compiled[situation]
+        except KeyError:
+            callbacks, skip_default = self._compile(situation)
+        if skip_default or self.disable_default_callbacks:
+            default_callback = None
+
         tasks = []
-        if callbacks := self.callbacks.get(situation):
+        if callbacks or default_callback is not None:
+            full_context = self.default_context | context
             for callback in callbacks:
                 if callback.is_async:
                     if callback.use_task:
-                        # task가 제대로 종료되는지 확인하는 것은 caller의 몫
-                        task = asyncio.create_task(callback.function(**self.default_context, **context))
-                        tasks.append(task)
+                        tasks.append(await self._submit(lambda: asyncio.create_task(callback.function(**full_context))))
                     else:
-                        await callback.function(**self.default_context, **context)
+                        await callback.function(**full_context)
+                elif callback.use_thread:
+                    loop = asyncio.get_running_loop()
+                    function = functools.partial(callback.function, **full_context)
+                    tasks.append(await self._submit(lambda: loop.run_in_executor(self._get_executor(), function)))
                 else:
-                    callback.function(**self.default_context, **context)
-                if callback.replace_default:
-                    skip_default = True
+                    callback.function(**full_context)
 
-        if not self.disable_default_callbacks and not skip_default and default_callback is not None:
-            if default_callback.is_async:
-                await default_callback.function(**self.default_context, **context)
-            else:
-                default_callback.function(**self.default_context, **context)
+            if default_callback is not None:
+                if default_callback.is_async:
+                    await default_callback.function(**full_context)
+                else:
+                    default_callback.function(**full_context)
 
-        if context:
-            logger.debug(f"{situation}: {context}")
-        else:
-            logger.debug(f"{situation}:")
+        # context에는 스크래퍼 등 repr이 무거운 값들이 들어 있을 수 있으니 로그가 출력될 때만 포매팅함
+        if logger.isEnabledFor(logging.DEBUG):
+            if context:
+                logger.debug("%s: %s", situation, context)
+            else:
+                logger.debug("%s:", situation)
 
         return tasks or None
 
@@ -242,6 +331,9 @@ class CallbackManager:
                 if callback.is_async:
                     logger.error("An registered async callback is ignored. This callback does not support async callbacks.")
                     continue  # callback이 실행되지 않을 경우 skip_callback을 enable하지 않음
+                elif callback.use_thread:
+                    # 동기 함수에서는 자리가 날 때까지 기다릴 수 없으니 대기열 크기 제한 없이 실행함
+                    self._get_executor().submit(callback.function, **self.default_context, **context)
                 else:
                     callback.function(**self.default_context, **context)
                 if callback.replace_default:
@@ -253,10 +345,63 @@ class CallbackManager:
             else:
                 default_callback.function(**self.default_context, **context)
 
-        if context:
-            logger.debug(f"{situation}: {context}")
-        else:
-            logger.debug(f"{situation}:")
+        if logger.isEnabledFor(logging.DEBUG):
+            if context:
+                logger.debug("%s: %s", situation, context)
+            else:
+                logger.debug("%s:", situation)
+
+    @property
+    def pending_count(self) -> int:
+        """thread나 queue에서 대기하거나 실행 중인 콜백의 수입니다."""
+        return len(self._pending)
+
+    async def drain(self, *, cancel: bool = False) -> int:
+        """thread나 queue로 실행되고 있는 콜백이 모두 끝날 때까지 기다립니다.
+
+        cancel이 True라면 아직 끝나지 않은 콜백들을 취소합니다. 이미 스레드에서 실행 중인 콜백은 취소될 수 없으니 끝날 때까지 기다립니다.
+        실패한 콜백은 로그로 남기며, 취소된 콜백의 개수를 반환합니다.
+        """
+        canceled = 0
+        # 콜백이 실행되는 중에 다른 콜백을 부를 수 있으니 빌 때까지 반복함
+        while self._pending:
+            pending = list(self._pending)
+            if cancel:
+                canceled += sum(future.cancel() for future in pending)
+            for result in await asyncio.gather(*pending, return_exceptions=True):
+                if isinstance(result, Exception):
+                    logger.error(f"A callback running in background failed. {type(result).__name__}: {result}")
+
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.get_running_loop().run_in_executor(None, executor.shutdown)
+        # 다음 다운로드는 다른 이벤트 루프에서 실행될 수 있음
+        self._slots = None
+        return canceled
+
+    async def _submit(self, start: Callable[[], asyncio.Future]) -> asyncio.Future:
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+        slots = self._slots
+        await slots.acquire()
+        try:
+            future = start()
+        except BaseException:
+            slots.release()
+            raise
+
+        def done(future: asyncio.Future) -> None:
+            self._pending.discard(future)
+            slots.release()
+
+        self._pending.add(future)
+        future.add_done_callback(done)
+        return future
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(self.thread_workers, thread_name_prefix="WebtoonScraperCallback")
+        return self._executor
 
     # TODO: 실제로 유용하게 사용될 수 있는지 분석하기
     @asynccontextmanager
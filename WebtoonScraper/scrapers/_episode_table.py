@@ -0,0 +1,266 @@
+"""스크래퍼가 다루는 에피소드들의 정보를 열(column) 단위로 모아 두는 표입니다.
+
+* 에피소드 ID, 제목, 디렉토리 이름, 유료 여부는 리스트로, 다운로드 상태는 `bytearray`에 `EpisodeStatus` 코드로 저장합니다.
+* 다운로드를 건너뛸 에피소드는 집합(`SkipSet`)으로 관리해 에피소드마다 O(1)로 확인합니다.
+* `information.json`에는 이전과 같은 형식(문자열 상태의 리스트 등)으로 저장되고 불러와집니다.
+
+스크래퍼의 `episode_ids`, `episode_titles`, `download_status`, `episode_dir_names`, `skip_download` 등의 속성은
+모두 이 표를 가리키기 때문에 기존처럼 리스트나 인덱스로 접근해도 됩니다.
+"""
+
+from __future__ import annotations
+
+import enum
+import typing
+from collections.abc import Iterable, Mapping, Sequence
+
+from ..base import logger
+
+__all__ = ["DownloadStatus", "Episode", "EpisodeStatus", "EpisodeTable", "SkipSet", "StatusView"]
+
+DownloadStatus = typing.Literal["failed", "downloaded", "already_exist", "skipped_by_snapshot", "not_downloadable", "skipped_by_skip_download", "skipped_by_range", "skipped_by_lease"]
+
+
+class EpisodeStatus(enum.IntEnum):
+    """에피소드의 다운로드 상태 코드입니다. `label`은 `information.json`에 저장되는 문자열입니다."""
+
+    PENDING = 0
+    """아직 처리되지 않았습니다. `information.json`에는 null로 저장됩니다."""
+    FAILED = 1
+    DOWNLOADED = 2
+    ALREADY_EXIST = 3
+    SKIPPED_BY_SNAPSHOT = 4
+    NOT_DOWNLOADABLE = 5
+    SKIPPED_BY_SKIP_DOWNLOAD = 6
+    SKIPPED_BY_RANGE = 7
+    SKIPPED_BY_LEASE = 8
+    """다른 작업자가 다운로드하고 있어 건너뛰었습니다."""
+
+    @property
+    def label(self) -> DownloadStatus | None:
+        return _LABELS[self]
+
+    @classmethod
+    def of(cls, label: DownloadStatus | EpisodeStatus | None) -> EpisodeStatus:
+        """문자열 상태를 상태 코드로 바꿉니다. 알 수 없는 상태라면 ValueError가 발생합니다."""
+        if isinstance(label, EpisodeStatus):
+            return label
+        try:
+            return _CODES[label]
+        except KeyError:
+            raise ValueError(f"Unknown download status: {label!r}") from None
+
+
+_LABELS: tuple[DownloadStatus | None, ...] = tuple(
+    None if status is EpisodeStatus.PENDING else typing.cast(DownloadStatus, status.name.lower()) for status in EpisodeStatus
+)
+_CODES: dict[DownloadStatus | None, EpisodeStatus] = {label: EpisodeStatus(code) for code, label in enumerate(_LABELS)}
+
+
+class SkipSet(set[int]):
+    """다운로드를 건너뛸 에피소드 번호(0부터 시작)의 집합입니다.
+
+    예전에는 리스트였기 때문에 `extend()`와 `append()`도 사용할 수 있습니다.
+    """
+
+    __slots__ = ()
+
+    def extend(self, episodes: Iterable[int]) -> None:
+        self.update(episodes)
+
+    def append(self, episode_no: int) -> None:
+        self.add(episode_no)
+
+
+class StatusView(Sequence["DownloadStatus | None"]):
+    """상태 코드 배열을 문자열 상태의 리스트처럼 보여줍니다. 값을 대입하면 표에 바로 반영됩니다."""
+
+    __slots__ = ("_statuses",)
+
+    def __init__(self, statuses: bytearray) -> None:
+        self._statuses = statuses
+
+    @typing.overload
+    def __getitem__(self, index: int) -> DownloadStatus | None: ...
+    @typing.overload
+    def __getitem__(self, index: slice) -> list[DownloadStatus | None]: ...
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [_LABELS[code] for code in self._statuses[index]]
+        return _LABELS[self._statuses[index]]
+
+    def __setitem__(self, index: int | slice, value) -> None:
+        if isinstance(index, slice):
+            self._statuses[index] = bytes(EpisodeStatus.of(label) for label in value)
+        else:
+            self._statuses[index] = EpisodeStatus.of(value)
+
+    def __len__(self) -> int:
+        return len(self._statuses)
+
+    def __iter__(self) -> typing.Iterator[DownloadStatus | None]:
+        return map(_LABELS.__getitem__, self._statuses)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, StatusView):
+            return self._statuses == other._statuses
+        if isinstance(other, list | tuple):
+            return self.tolist() == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.tolist()!r})"
+
+    def tolist(self) -> list[DownloadStatus | None]:
+        return list(self)
+
+
+class Episode(typing.NamedTuple):
+    """표의 한 행입니다. `no`는 0부터 시작하는 에피소드 번호이며, 다운로드할 수 없는 에피소드는 `id`와 `title`이 None입니다."""
+
+    no: int
+    id: typing.Any
+    title: str | None
+    charged: bool | None = None
+
+
+class EpisodeTable:
+    """에피소드 정보를 열 단위로 저장하는 표입니다. 에피소드 번호는 0부터 시작합니다.
+
+    `ids`와 `titles`는 스크래퍼가 에피소드 정보를 불러오기 전까지, `statuses`와 `dir_names`는 다운로드를 시작하기 전까지 None입니다.
+    """
+
+    __slots__ = "ids", "titles", "charged", "dir_names", "_statuses", "skipped"
+
+    def __init__(self, ids: Sequence | None = None, titles: Sequence[str | None] | None = None) -> None:
+        self.ids: list | None = None if ids is None else list(ids)
+        self.titles: list[str | None] | None = None if titles is None else list(titles)
+        self.charged: list[bool | None] | None = None
+        self.dir_names: list[str | None] | None = None
+        self._statuses: bytearray | None = None
+        self.skipped = SkipSet()
+
+    def __len__(self) -> int:
+        return len(self.ids or ())
+
+    def reset_download_state(self) -> None:
+        """다운로드를 시작하기 전에 상태와 디렉토리 이름을 에피소드 수에 맞게 초기화합니다."""
+        total = len(self)
+        self._statuses = bytearray(total)
+        self.dir_names = [None] * total
+
+    # 에피소드 목록
+
+    def episode(self, episode_no: int) -> Episode:
+        charged = self.charged[episode_no] if self.charged is not None and episode_no < len(self.charged) else None
+        return Episode(episode_no, self.ids[episode_no], self.titles[episode_no], charged)  # type: ignore
+
+    def begin_listing(self) -> None:
+        """에피소드 목록을 처음부터 다시 채우기 위해 비웁니다. 다운로드 상태가 초기화되어 있다면 함께 비웁니다."""
+        self.ids = []
+        self.titles = []
+        self.charged = []
+        if self._statuses is not None:
+            self._statuses = bytearray()
+            self.dir_names = []
+
+    def append(self, episode_id, title: str | None, charged: bool | None = None) -> Episode:
+        """에피소드를 목록의 끝에 추가합니다. 다운로드 도중이라면 다운로드 상태와 디렉토리 이름도 늘어납니다."""
+        if self.ids is None or self.titles is None:
+            self.begin_listing()
+        episode_no = len(self.ids)  # type: ignore
+        self.ids.append(episode_id)  # type: ignore
+        self.titles.append(title)  # type: ignore
+        if self.charged is not None:
+            self.charged.append(charged)
+        if self._statuses is not None:
+            self._statuses.append(EpisodeStatus.PENDING)
+            self.dir_names.append(None)  # type: ignore
+        return Episode(episode_no, episode_id, title, charged)
+
+    # 다운로드 상태
+
+    @property
+    def statuses(self) -> StatusView | None:
+        return None if self._statuses is None else StatusView(self._statuses)
+
+    @statuses.setter
+    def statuses(self, labels: Iterable[DownloadStatus | EpisodeStatus | None] | None) -> None:
+        self._statuses = None if labels is None else bytearray(EpisodeStatus.of(label) for label in labels)
+
+    def status_of(self, episode_no: int) -> EpisodeStatus:
+        return EpisodeStatus(self._require_statuses()[episode_no])
+
+    def set_status(self, episodes: int | range, status: DownloadStatus | EpisodeStatus | None) -> None:
+        """에피소드 하나나 연속된 에피소드들(step이 1인 range)의 상태를 한 번에 바꿉니다."""
+        statuses = self._require_statuses()
+        code = EpisodeStatus.of(status)
+        if isinstance(episodes, range):
+            statuses[episodes.start : episodes.stop] = bytes((code,)) * len(episodes)
+        else:
+            statuses[episodes] = code
+
+    def count(self, *statuses: DownloadStatus | EpisodeStatus | None) -> int:
+        """주어진 상태들 중 하나를 가진 에피소드의 수입니다."""
+        table = self._require_statuses()
+        return sum(table.count(EpisodeStatus.of(status)) for status in set(statuses))
+
+    def where(self, *statuses: DownloadStatus | EpisodeStatus | None) -> list[int]:
+        """주어진 상태들 중 하나를 가진 에피소드 번호들입니다."""
+        codes = bytes(EpisodeStatus.of(status) for status in statuses)
+        return [episode_no for episode_no, code in enumerate(self._require_statuses()) if code in codes]
+
+    def status_counts(self) -> dict[EpisodeStatus, int]:
+        """상태별 에피소드 수입니다. 에피소드가 없는 상태는 포함되지 않습니다."""
+        statuses = self._require_statuses()
+        return {status: count for status in EpisodeStatus if (count := statuses.count(status))}
+
+    def _require_statuses(self) -> bytearray:
+        if self._statuses is None:
+            raise ValueError("Download statuses are not initialized. Call reset_download_state() first.")
+        return self._statuses
+
+    # information.json
+
+    def to_information(self) -> dict[str, list]:
+        """`information.json`에 저장되는 형식으로 바꿉니다. 아직 값이 없는 열은 포함되지 않습니다."""
+        columns = dict(episode_ids=self.ids, episode_titles=self.titles, download_status=self.statuses, episode_dir_names=self.dir_names)
+        return {name: list(column) for name, column in columns.items() if column is not None}
+
+    @classmethod
+    def from_information(cls, information: Mapping, *, strict: bool = True) -> EpisodeTable:
+        """`information.json`의 내용으로 표를 만듭니다.
+
+        strict가 True라면 열의 길이가 서로 다르거나 알 수 없는 상태가 있을 때 ValueError가 발생합니다.
+        False라면 이전 버전이나 손으로 고친 파일도 읽을 수 있도록 ID와 다운로드 상태만 사용하며,
+        알 수 없는 상태는 경고를 남기고 PENDING으로 취급합니다.
+        """
+        if not strict:
+            ids, labels = information.get("episode_ids"), information.get("download_status")
+            if ids is None or labels is None:
+                return cls(ids)
+            if len(ids) != len(labels):
+                logger.warning(f"information.json has {len(ids)} episode ID(s) but {len(labels)} download status(es). Extra entries are ignored.")
+            length = min(len(ids), len(labels))
+            table = cls(ids[:length])
+            statuses = bytearray()
+            unknown = set()
+            for label in labels[:length]:
+                code = _CODES.get(label)
+                if code is None:
+                    unknown.add(label)
+                    code = EpisodeStatus.PENDING
+                statuses.append(code)
+            if unknown:
+                logger.warning(f"Unknown download status {sorted(map(repr, unknown))} in information.json is treated as pending.")
+            table._statuses = statuses
+            return table
+
+        table = cls(information.get("episode_ids"), information.get("episode_titles"))
+        if (dir_names := information.get("episode_dir_names")) is not None:
+            table.dir_names = list(dir_names)
+        table.statuses = information.get("download_status")
+        lengths = {len(column) for column in (table.ids, table.titles, table.dir_names, table._statuses) if column is not None}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns of the episode table have different lengths: {sorted(lengths)}")
+        return table
@@ -2,10 +2,14 @@ from __future__ import annotations
 
 import asyncio
 import functools
-import json
-from collections.abc import Container, Iterable
+import math
+import os
+import tempfile
+from array import array
+from bisect import bisect_right
+from collections.abc import Container, Iterable, Iterator, Sequence
 from pathlib import Path
-from typing import TYPE_CHECKING, Self
+from typing import TYPE_CHECKING, Literal, Self
 
 from WebtoonScraper.exceptions import AuthenticationError
 import filetype
@@ -14,12 +18,17 @@ from filetype.types import IMAGE
 if TYPE_CHECKING:
     from WebtoonScraper.scrapers._scraper import Scraper
 
+from .. import json_codec
 from ..base import __version__ as version
+from ..directory_state import INFORMATION_NAME, SIDECAR_CATEGORIES, save_information_json
 
 
 class ExtraInfoScraper:
     """이미지 이외의 정보(댓글, 작가의 말, 별점 등)와 기타 프로세싱을 사용할 때 사용되는 추가적인 스크래퍼입니다."""
     FEATURES = ["basic"]
+    SIDECAR_CATEGORIES: tuple[str, ...] = SIDECAR_CATEGORIES
+    """information.json과 따로 저장할 카테고리들입니다. 빈 튜플이면 모든 정보를 information.json에 저장합니다."""
+    compress_sidecars = True
 
     def register(self, scraper: Scraper) -> None:
         # self.scraper = scraper
@@ -59,27 +68,140 @@ class ExtraInfoScraper:
         else:
             raise ValueError(f"Invalid webtoon id type to parse: {type(scraper.webtoon_id).__name__}")
 
-        information = scraper._get_information()
-        information.update(
-            webtoon_id=webtoon_id,
-            thumbnail_name=thumbnail_name,
-            information_name="information.json",
-            original_webtoon_directory_name=webtoon_directory.name,
-            contents=["thumbnail", "information"],
-        )
-        with open(webtoon_directory / "information.json", "w", encoding="utf-8") as f:
+        with scraper._phase("information_json"):
+            information = scraper._get_information()
+            information.update(
+                webtoon_id=webtoon_id,
+                thumbnail_name=thumbnail_name,
+                information_name=INFORMATION_NAME,
+                original_webtoon_directory_name=webtoon_directory.name,
+                contents=["thumbnail", "information"],
+            )
             # 버전은 맨 위에 오는 것이 가장 보기 좋음
-            json.dump(dict(agent="python", features=self.FEATURES, version=version) | information, f, ensure_ascii=False)
+            information = dict(agent="python", features=self.FEATURES, version=version) | information
+            save_information_json(webtoon_directory, information, self.SIDECAR_CATEGORIES, self.compress_sidecars)
+
+
+# 간격이 1이 아닌 범위는 이 크기까지만 집합으로 펼쳐서 구간으로 바꿈
+_MAX_EXPANDED_RANGE = 100_000
+type _Intervals = list[tuple[float, float]]
+
+
+def _union(intervals: _Intervals, other: _Intervals) -> _Intervals:
+    merged: _Intervals = []
+    for start, stop in sorted(intervals + other):
+        if merged and start <= merged[-1][1]:
+            if stop > merged[-1][1]:
+                merged[-1] = merged[-1][0], stop
+        else:
+            merged.append((start, stop))
+    return merged
+
+
+def _difference(intervals: _Intervals, other: _Intervals) -> _Intervals:
+    result: _Intervals = []
+    first = 0
+    for start, stop in intervals:
+        while first < len(other) and other[first][1] <= start:
+            first += 1
+        for other_start, other_stop in other[first:]:
+            if other_start >= stop or start >= stop:
+                break
+            if other_start > start:
+                result.append((start, other_start))
+            start = max(start, other_stop)
+        if start < stop:
+            result.append((start, stop))
+    return result
+
+
+def _expand(range_: range) -> _Intervals | None:
+    if len(range_) > _MAX_EXPANDED_RANGE:
+        return None
+    return _union([], [(index, index + 1) for index in range_])
+
+
+def _intervals_of(container) -> _Intervals | None:
+    """범위를 겹치지 않는 반개구간들로 나타냅니다. 구간으로 나타낼 수 없다면 None을 반환합니다.
+
+    slice의 해석은 `EpisodeRange._contains_slow`와 같아야 합니다.
+    """
+    match container:
+        case set(container):
+            if not all(type(index) is int for index in container):
+                return None
+            return _union([], [(index, index + 1) for index in container])
+
+        case slice(start=None, stop=None, step=None):
+            return [(-math.inf, math.inf)]
+
+        case slice(start=None, stop=int(stop), step=int() | None as step):
+            return ([(1, stop)] if stop > 1 else []) if step in (1, None) else _expand(range(1, stop, step))
+
+        case slice(start=int(start), stop=None, step=int() | None as step):
+            return [(start, math.inf)] if step in (1, None) else None
+
+        case slice(start=int(start), stop=int(stop), step=int() | None as step):
+            return ([(start, stop)] if stop > start else []) if step in (1, None) else _expand(range(start, stop, step))
+
+        case range() if container.step == 1:
+            return [(container.start, container.stop)] if container.stop > container.start else []
+
+        case range():
+            return _expand(container)
+
+        case _:
+            # 잘못된 slice나 opaque container
+            return None
 
 
 class EpisodeRange:
     def __init__(self):
         """range 인스턴스는 기본적으로 체크되지 않으며 나중에 오류가 발현될 수 있습니다."""
         self._ranges: list = []
+        self._compiled = False
+        self._starts: list[float] | None = None
+        self._stops: list[float] = []
+
+    def _compile(self) -> None:
+        """범위들을 겹치지 않는 구간들로 정리해 O(log n)으로 포함 여부를 확인할 수 있도록 합니다.
+
+        범위들은 뒤에 추가된 것이 우선하므로 앞에서부터 차례로 합집합(add)과 차집합(add_not)을 적용하면 됩니다.
+        구간으로 나타낼 수 없는 범위(opaque container 등)가 있다면 매번 모든 범위를 확인하는 방식을 사용합니다.
+        """
+        self._compiled = True
+        self._starts = None
+        intervals: _Intervals = []
+        for not_invert, container in self._ranges:
+            container_intervals = _intervals_of(container)
+            if container_intervals is None:
+                return
+            intervals = _union(intervals, container_intervals) if not_invert else _difference(intervals, container_intervals)
+        self._starts = [start for start, _ in intervals]
+        self._stops = [stop for _, stop in intervals]
 
     def __contains__(self, index: int):
         """잘못된 값을 지니는 slice 인스턴스를 가지고 있더라도 순서에 따라 오류 없이 값을 내보낼 수도 있습니다."""
+        if not self._compiled:
+            self._compile()
+        if self._starts is None or type(index) is not int:
+            return self._contains_slow(index)
+        position = bisect_right(self._starts, index) - 1
+        return position >= 0 and index < self._stops[position]
+
+    def iter_selected(self, total: int) -> Iterator[int]:
+        """1부터 total까지의 번호 중 범위에 포함된 번호들을 순서대로 반환합니다."""
+        if not self._compiled:
+            self._compile()
+        if self._starts is None:
+            yield from (index for index in range(1, total + 1) if self._contains_slow(index))
+            return
+        for start, stop in zip(self._starts, self._stops):
+            if start > total:
+                return
+            yield from range(max(start, 1), min(stop, total + 1))  # type: ignore
 
+    def _contains_slow(self, index: int):
         for range_ in reversed(self._ranges):
             not_invert, container = range_
             invert = not not_invert
@@ -129,6 +251,7 @@ class EpisodeRange:
             return set(item)
 
     def _add(self, item, not_invert: bool) -> None:
+        self._compiled = False
         if not self._ranges:
             normalized_item = self._normalize_item(item)
             self._ranges.append((not_invert, normalized_item))
@@ -147,10 +270,12 @@ class EpisodeRange:
                 self._ranges.append((not_invert, normalized_item))
 
     def add_opaque_container(self, item: Container[int]):
+        self._compiled = False
         self._ranges.append((True, item))
 
     def add_not_opaque_container(self, item: Container[int]):
-        self._ranges.append((True, item))
+        self._compiled = False
+        self._ranges.append((False, item))
 
     def add(self, item: slice | range | Iterable[int] | int):
         self._add(item, not_invert=True)
@@ -229,6 +354,24 @@ class BearerMixin:
             self.json_headers.update({"Authorization": value})  # type: ignore
 
 
+class CountingSemaphore(asyncio.Semaphore):
+    """슬롯을 차지하고 있는 작업의 수(`in_flight`)와 한도(`limit`)를 알려주는 `asyncio.Semaphore`입니다."""
+
+    def __init__(self, value: int = 1) -> None:
+        super().__init__(value)
+        self.limit = value
+        self.in_flight = 0
+
+    async def acquire(self) -> Literal[True]:
+        await super().acquire()
+        self.in_flight += 1
+        return True
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        super().release()
+
+
 # code from https://discuss.python.org/t/boundedtaskgroup-to-control-parallelism/27171, with small variation
 class BoundedTaskGroup(asyncio.TaskGroup):
     def __init__(self, max_task: int) -> None:
@@ -263,6 +406,64 @@ def async_reload_manager(f):
     return wrapper
 
 
+def is_reload_cached(instance, method) -> bool:
+    """async_reload_manager로 감싼 메서드가 이미 실행되어 결과가 캐싱되었는지 확인합니다."""
+    return method.__wrapped__ in getattr(instance, "_cache", {})
+
+
+def set_reload_cache(instance, method, result=None) -> None:
+    """async_reload_manager로 감싼 메서드를 다른 방법으로 대신 실행했을 때 실행된 것으로 기록합니다."""
+    if not hasattr(instance, "_cache"):
+        instance._cache = {}
+    instance._cache[method.__wrapped__] = result
+
+
+class SpilledList(Sequence):
+    """값들을 임시 파일에 JSON Lines로 저장하는 리스트입니다. 메모리에는 각 값이 저장된 위치만 남습니다.
+
+    값을 추가할 수만 있고 바꿀 수는 없습니다. 임시 파일은 닫히거나 객체가 사라질 때 삭제됩니다.
+    """
+
+    def __init__(self, items: Iterable = ()) -> None:
+        self._file = tempfile.TemporaryFile()
+        self._offsets = array("q")
+        self.extend(items)
+
+    def append(self, item) -> None:
+        self._file.seek(0, os.SEEK_END)
+        self._offsets.append(self._file.tell())
+        self._file.write(json_codec.dumpb(item) + b"\n")
+
+    def extend(self, items: Iterable) -> None:
+        for item in items:
+            self.append(item)
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        self._file.seek(self._offsets[index])
+        return json_codec.loads(self._file.readline())
+
+    def __iter__(self) -> Iterator:
+        # 순회하는 도중에 값이 추가되더라도 순회를 시작할 때의 값들만 반환함
+        count = len(self)
+        position = 0
+        for _ in range(count):
+            self._file.seek(position)
+            line = self._file.readline()
+            position = self._file.tell()
+            yield json_codec.loads(line)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} of {len(self)} items>"
+
+    def close(self) -> None:
+        self._file.close()
+
+
 def shorten(string: str, width: int = 30, *, ellipsis: str = "...", quote: bool = False):
     if quote:
         width -= 2
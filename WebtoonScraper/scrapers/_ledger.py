@@ -0,0 +1,73 @@
+"""에피소드별 다운로드 성능을 기록합니다.
+
+에피소드를 다운로드하는 동안 `current_ledger`에 해당 에피소드의 EpisodeLedger가 설정되며,
+그 안에서 생성된 task들도 같은 ledger를 공유합니다.
+요청 수, 재시도 횟수, 지연 시간은 httpx의 event hook으로, 다운로드한 바이트 수는 다운로드하는 쪽에서 기록합니다.
+"""
+
+from __future__ import annotations
+
+import time
+from contextvars import ContextVar
+
+import httpx
+
+current_ledger: ContextVar[EpisodeLedger | None] = ContextVar("current_ledger", default=None)
+STARTED_AT = "webtoon_scraper.started_at"
+ATTEMPTS = "webtoon_scraper.attempts"
+
+
+class EpisodeLedger:
+    __slots__ = "started_at", "requests", "retries", "errors", "bytes", "files", "latencies"
+
+    def __init__(self) -> None:
+        self.started_at = time.perf_counter()
+        self.requests = 0
+        self.retries = 0
+        self.errors = 0
+        self.bytes = 0
+        self.files = 0
+        self.latencies: list[float] = []
+
+    def add_file(self, size: int) -> None:
+        self.files += 1
+        self.bytes += size
+
+    def summary(self) -> dict:
+        latencies = self.latencies
+        return dict(
+            duration=round(time.perf_counter() - self.started_at, 3),
+            bytes=self.bytes,
+            files=self.files,
+            requests=self.requests,
+            retries=self.retries,
+            errors=self.errors,
+            latency_avg=round(sum(latencies) / len(latencies), 3) if latencies else None,
+            latency_max=round(max(latencies), 3) if latencies else None,
+        )
+
+
+def add_downloaded_file(size: int) -> None:
+    if (ledger := current_ledger.get()) is not None:
+        ledger.add_file(size)
+
+
+async def record_request(request: httpx.Request) -> None:
+    # httpc는 재시도할 때 같은 Request 객체를 다시 전송하기 때문에 몇 번째 시도인지 기록해 둘 수 있음
+    # 이후에 등록된 hook들은 request.extensions[ATTEMPTS]와 request.extensions[STARTED_AT]을 사용할 수 있음
+    attempts = request.extensions[ATTEMPTS] = request.extensions.get(ATTEMPTS, 0) + 1
+    request.extensions[STARTED_AT] = time.perf_counter()
+    if (ledger := current_ledger.get()) is not None:
+        ledger.requests += 1
+        if attempts > 1:
+            ledger.retries += 1
+
+
+async def record_response(response: httpx.Response) -> None:
+    ledger = current_ledger.get()
+    if ledger is None:
+        return
+    if (started_at := response.request.extensions.get(STARTED_AT)) is not None:
+        ledger.latencies.append(time.perf_counter() - started_at)
+    if response.is_error:
+        ledger.errors += 1
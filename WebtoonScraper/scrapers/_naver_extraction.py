@@ -0,0 +1,61 @@
+"""네이버 웹툰 에피소드 페이지에서 필요한 정보를 한 번에 추출합니다.
+
+이벤트 루프를 막지 않도록 스레드나 프로세스 풀에서 실행되기 때문에
+이 모듈의 함수들은 모두 pickle될 수 있는 값만 주고받아야 합니다.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import NamedTuple
+
+from httpc import ParseTool
+
+_decoder = json.JSONDecoder()
+# 앞에 `\b` 등을 붙이면 문자열 검색 최적화가 적용되지 않아 긴 스크립트에서 크게 느려짐
+_ARTICLE_START = re.compile(r"article: *{")
+# JSON으로 해석하지 못하는 경우를 위해 남겨둔 예전 방식의 정규식
+_AUTHOR_WORDS_FALLBACK = re.compile(r'article: *{"no":\d*,"subtitle":".+?","authorWords":(?P<author_comments_raw>.+?)},\s*currentIndex: *\d*,')
+_EXCLUDED_IMAGE_KEYWORDS = ("agerate", "ctguide")  # cspell: ignore agerate ctguide
+
+
+class NaverEpisodePage(NamedTuple):
+    image_urls: list[str]
+    audio_url: str | None
+    author_comment: object
+
+
+def extract_episode_page(html: str, image_selector: str) -> NaverEpisodePage:
+    """에피소드 페이지를 한 번만 파싱해 이미지 URL들, 배경음악 URL, 작가의 말을 추출합니다."""
+    tree = ParseTool(html).parse()
+
+    image_urls: list[str] = []
+    for element in tree.css(image_selector):
+        image_url = element.attrs.get("src")
+        assert image_url is not None
+        if any(keyword in image_url for keyword in _EXCLUDED_IMAGE_KEYWORDS):
+            continue
+        image_urls.append(image_url)
+
+    audio = tree.css_first("audio#bgmPlayer > source")
+    audio_url = audio.attrs.get("src") if audio is not None else None
+
+    script = tree.css_first("body > script")
+    assert script is not None
+    return NaverEpisodePage(image_urls, audio_url or None, _extract_author_comment(script.text()))
+
+
+def _extract_author_comment(script: str) -> object:
+    # 스크립트 전체에 정규식을 돌리는 대신 `article:`의 위치만 찾고 그 뒤의 객체를 JSON으로 해석한다.
+    if start := _ARTICLE_START.search(script):
+        try:
+            article, _ = _decoder.raw_decode(script, start.end() - 1)
+        except json.JSONDecodeError:
+            pass
+        else:
+            return article["authorWords"]
+
+    search_result = _AUTHOR_WORDS_FALLBACK.search(script)
+    assert search_result is not None
+    return json.loads(search_result.group("author_comments_raw"))
@@ -2,8 +2,11 @@
 
 from __future__ import annotations
 
-import json
-import re
+import asyncio
+import os
+from collections import deque
+from collections.abc import AsyncIterator
+from concurrent.futures import Executor
 from itertools import count
 from json.decoder import JSONDecodeError
 from pathlib import Path
@@ -13,11 +16,16 @@ import httpc
 from httpx import HTTPStatusError
 from yarl import URL
 
+from .. import json_codec
+from ..base import logger
 from ..exceptions import (
     RatingError,
     URLError,
     WebtoonIdError,
 )
+from ._episode_table import Episode
+from ._helpers import SpilledList
+from ._naver_extraction import extract_episode_page
 from ._scraper import Scraper, async_reload_manager
 
 
@@ -29,20 +37,34 @@ class NaverWebtoonScraper(Scraper[int]):
     information_vars = (
         Scraper.information_vars
         | Scraper._build_information_dict("raw_articles", "raw_webtoon_info", "episode_audio_urls", subcategory="extra")
-        | Scraper._build_information_dict("webtoon_type", "authors", "author_comments", "download_audio", "audio_names", "description")
+        | Scraper._build_information_dict("webtoon_type", "authors", "author_comments", "download_audio", "audio_names", "description", "comment_counts")
     )
-    comment_counts: dict
-    comments: dict
+    COMMENTS_DIRECTORY_NAME = "_comments"
+    COMMENT_API_URL = "https://comic.naver.com/comment/api/community/v2/posts"
+    COMMENT_PAGE_SIZE = 15
+    comment_counts: dict[int, int]
+    """에피소드별 전체 댓글 수입니다."""
+    comments: dict[int, Path]
+    """에피소드별 댓글이 저장된 파일의 경로입니다."""
     comment_headers: dict
 
     def __init__(self, webtoon_id: int) -> None:
         self.download_comments_option: Literal["best", "new"] | None = None
         self.always_refresh_comments = False
+        self.refresh_skipped_comments = False
+        """이미 다운로드되어 건너뛴 에피소드의 댓글도 새로 받을지 결정합니다. 건너뛴 에피소드들의 댓글은 한 번에 하나씩 받습니다."""
         self.comment_download_limit: int | None = None
         self.download_audio = True
         self.episode_audio_urls: dict[int, str] = {}
         self.audio_names: dict[int, str] = {}
+        self.comment_counts = {}
+        self.extraction_executor: Executor | None = None
+        """에피소드 페이지를 파싱할 때 사용할 executor입니다. None이면 기본 스레드 풀을 사용합니다."""
+        self.comments = {}
+        self._skipped_comment_episodes: deque[int] = deque()
+        self._skipped_comment_task: asyncio.Task | None = None
         super().__init__(webtoon_id)
+        self.callbacks.register("download_skipped", self._refresh_skipped_comments)
         self.client.retry = 6
         self.headers.update({"Referer": "https://comic.naver.com/webtoon/"})
         self.json_headers.update({"Referer": "https://comic.naver.com/webtoon/"})
@@ -70,7 +92,7 @@ class NaverWebtoonScraper(Scraper[int]):
         with WebtoonIdError.redirect_error(self, error_type=(JSONDecodeError, HTTPStatusError)):
             url = f"https://comic.naver.com/api/article/list/info?titleId={self.webtoon_id}"
             res = await self.client.get(url, headers=self.json_headers)
-            webtoon_json_info: dict = res.json()
+            webtoon_json_info: dict = json_codec.loads(res.content)
 
         # 정보 저장
         self.webtoon_thumbnail_url = webtoon_json_info["sharedThumbnailUrl"]
@@ -89,12 +111,21 @@ class NaverWebtoonScraper(Scraper[int]):
 
     @async_reload_manager
     async def fetch_episode_information(self, *, reload: bool = False) -> None:
-        articles = []
+        async for _ in self._stream_episode_information():
+            pass
+
+    async def _stream_episode_information(self) -> AsyncIterator[Episode]:
+        table = self.episode_table
+        table.begin_listing()
+        # low_memory 모드에서는 원본 응답을 임시 파일에 저장함
+        self.raw_articles = raw_articles = SpilledList() if self.low_memory else []
+        self.author_comments = {}
+        charged_episodes = []
         previous_articles = []
         for i in count(1):
             url = f"https://comic.naver.com/api/article/list?titleId={self.webtoon_id}&page={i}&sort=ASC"
             try:
-                data = (await self.client.get(url)).json()
+                data = json_codec.loads((await self.client.get(url)).content)
             except JSONDecodeError:
                 # fetch_webtoon_information은 지원하지 않는 rating일 때 오류를 낸다.
                 # 만약 fetch_webtoon_information보다 fetch_episode_information가 먼저
@@ -107,34 +138,36 @@ class NaverWebtoonScraper(Scraper[int]):
             current_articles = data["articleList"]
             if previous_articles == current_articles:
                 break
-            articles += current_articles
+            raw_articles.extend(current_articles)
             previous_articles = current_articles
 
-        episode_data = {article["no"]: article for article in articles if not article.get("blindInspection")}
-
-        episode_ids = []
-        episode_titles = []
-        is_episode_charged_list = []
-        for zero_index in range(max(episode_data) if episode_data else 0):
-            index = zero_index + 1
-            # 1. 인덱스가 있는지 확인, 2. subtitle이 존재하는지 확인
-            # 만약 에피소스당 데이터가 2개 이상이 되어 튜플을 사용하는 경우
-            # 이 코드도 subtitle이 존재하는지를 확인하는 코드로 재정의되어야 함!
-            if episode_data.get(index):
-                episode_ids.append(index)
-                episode_titles.append(episode_data[index]["subtitle"])
-                is_episode_charged_list.append(episode_data[index]["charge"])
-            else:
-                episode_ids.append(None)
-                episode_titles.append(None)
-                is_episode_charged_list.append(None)
-        self.episode_titles = episode_titles
-        self.episode_ids = episode_ids
-        self.raw_articles = articles
-        self.author_comments = {}
-        self.is_episode_charged_list = is_episode_charged_list
-        charged_episodes = [no for no, is_charged in enumerate(is_episode_charged_list) if is_charged]
-        self.skip_download.extend(charged_episodes)
+            # 페이지 안에서 순서가 뒤바뀌더라도 빈 자리로 채우지 않도록 페이지를 모두 살펴본 뒤에 번호 순서대로 추가함
+            arrived: dict[int, dict] = {}
+            for article in current_articles:
+                if article.get("blindInspection"):
+                    continue
+                index = article["no"] - 1
+                if index >= len(table):
+                    arrived[index] = article
+                elif table.ids[index] is None:
+                    # 이전 페이지를 처리할 때 빈 자리로 채워진 에피소드가 뒤늦게 도착한 경우
+                    table.ids[index], table.titles[index], table.charged[index] = article["no"], article["subtitle"], article["charge"]  # type: ignore
+                    if article["charge"]:
+                        charged_episodes.append(index)
+                        self.skip_download.add(index)
+
+            for index in sorted(arrived):
+                # 에피소드 번호가 비어 있는 곳은 다운로드할 수 없는 에피소드로 채움
+                while len(table) < index:
+                    yield table.append(None, None, None)
+                article = arrived[index]
+                episode = table.append(article["no"], article["subtitle"], article["charge"])
+                if episode.charged:
+                    charged_episodes.append(episode.no)
+                    self.skip_download.add(episode.no)
+                yield episode
+
+        charged_episodes.sort()
         if (charged_count := len(charged_episodes)) and (
             skipping_episodes := [episode for episode in charged_episodes if episode + 1 in self.download_range]
         ):
@@ -156,26 +189,16 @@ class NaverWebtoonScraper(Scraper[int]):
         except HTTPStatusError:
             return None
 
-        self._gather_author_comment(episode_no, response)
-
-        try:
-            audio_url = response.single("audio#bgmPlayer > source", remain_ok=True).attrs["src"]
-            assert audio_url
-        except (ValueError, KeyError):
-            pass
-        else:
-            self.episode_audio_urls[episode_no] = audio_url
-
-        episode_image_urls: list[str] = []
-        for element in response.match(self.image_selector):
-            image_url = element.attrs.get("src")
-            assert image_url is not None
-            if "agerate" in image_url or "ctguide" in image_url:  # cspell: ignore agerate ctguide
-                continue
-            episode_image_urls.append(image_url)
+        # 페이지 파싱은 CPU를 많이 사용하기 때문에 이벤트 루프 밖에서 실행한다.
+        loop = asyncio.get_running_loop()
+        with self._phase("parse_episode_page"):
+            page = await loop.run_in_executor(self.extraction_executor, extract_episode_page, response.text, self.image_selector)
+        self.author_comments[episode_no] = page.author_comment
+        if page.audio_url:
+            self.episode_audio_urls[episode_no] = page.audio_url
 
         await self.callbacks.async_callback("image_loaded", None, episode_no=episode_no)
-        return episode_image_urls
+        return page.image_urls
 
     @classmethod
     def from_url(cls, url: str) -> Self:
@@ -193,23 +216,127 @@ class NaverWebtoonScraper(Scraper[int]):
         self._set_webtoon_type(webtoon_type)  # camelCase 웹툰 타입
         return self
 
+    async def download_episode_comments(self, episode_no: int) -> Path | None:
+        """에피소드의 댓글을 다운로드해 `_comments/<에피소드 ID>.json`에 저장합니다.
+
+        이미 저장된 댓글이 있다면 가장 최근에 저장된 댓글이 나올 때까지만 새로운 댓글을 받아옵니다.
+        `always_refresh_comments`가 설정되어 있거나 베스트 댓글을 받는 경우에는 전체 댓글을 새로 받습니다.
+        """
+        order = self.download_comments_option
+        if order is None:
+            return None
+
+        episode_id = self.episode_ids[episode_no]
+        comments_path = self.directory_manager.webtoon_directory / self.COMMENTS_DIRECTORY_NAME / f"{episode_id}.json"
+        stored: list[dict] = []
+        if order == "new" and not self.always_refresh_comments:
+            try:
+                stored_data = json_codec.loads(comments_path.read_bytes())
+            except (FileNotFoundError, JSONDecodeError):
+                pass
+            else:
+                if stored_data.get("order") == order:
+                    stored = stored_data["comments"]
+        known_ids = {comment.get("id") for comment in stored}
+        limit = self.comment_download_limit
+
+        posts, total_pages, total_count = await self._fetch_comment_page(episode_id, 1, order)
+        new_comments: list[dict] = []
+        seen_ids: set = set()
+
+        def add_posts(posts: list[dict]) -> bool:
+            """새 댓글을 추가하고, 더 이상 페이지를 받을 필요가 없다면 True를 반환합니다."""
+            for post in posts:
+                post_id = post.get("id")
+                if post_id in known_ids:
+                    return True
+                # 페이지를 받는 동안 새 댓글이 작성되면 같은 댓글이 다음 페이지에 다시 나타날 수 있음
+                if post_id in seen_ids:
+                    continue
+                seen_ids.add(post_id)
+                new_comments.append(post)
+            return limit is not None and len(new_comments) >= limit
+
+        # 첫 페이지를 받은 뒤에야 전체 페이지 수를 알 수 있기 때문에 나머지 페이지는 묶음으로 동시에 받는다.
+        page = 2
+        finished = add_posts(posts)
+        while not finished and page <= total_pages:
+            pages = range(page, min(total_pages, page + self.max_concurrent_requests - 1) + 1)
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(self._fetch_comment_page(episode_id, page_no, order)) for page_no in pages]
+            for task in tasks:
+                if finished := add_posts(task.result()[0]):
+                    break
+            page = pages.stop
+
+        comments = new_comments + stored
+        if limit is not None:
+            comments = comments[:limit]
+
+        comments_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = comments_path.with_name(f"._{comments_path.name}.tmp")
+        data = dict(episode_id=episode_id, order=order, total_count=total_count, comments=comments)
+        temp_path.write_bytes(json_codec.dumpb(data))
+        os.replace(temp_path, comments_path)
+
+        self.comment_counts[episode_no] = total_count
+        self.comments[episode_no] = comments_path
+        await self.callbacks.async_callback("comments_downloaded", None, episode_no=episode_no, new_comments=len(new_comments), path=comments_path)
+        return comments_path
+
+    async def _fetch_comment_page(self, episode_id: int, page: int, order: Literal["best", "new"]) -> tuple[list[dict], int, int]:
+        """댓글 한 페이지를 받아 `(댓글들, 전체 페이지 수, 전체 댓글 수)`를 반환합니다."""
+        params = dict(
+            objectId=f"{self.webtoon_id}_{episode_id}",
+            categoryId="",
+            pageSize=self.COMMENT_PAGE_SIZE,
+            page=page,
+            orderType="BEST" if order == "best" else "NEW",
+        )
+        headers = self.comment_headers | {"Referer": f"{self.base_url}/detail?titleId={self.webtoon_id}&no={episode_id}"}
+        async with self.request_limiter:
+            res = await self.client.get(self.COMMENT_API_URL, params=params, headers=headers)
+        result = json_codec.loads(res.content)["result"]
+        posts = result.get("posts") or []
+        page_info = result.get("pageInfo") or {}
+        return posts, page_info.get("totalPages") or page, page_info.get("totalElements") or len(posts)
+
+    async def _download_comments_in_background(self, episode_no: int) -> None:
+        try:
+            await self.download_episode_comments(episode_no)
+        except Exception as exc:
+            # 댓글을 받지 못했다고 에피소드 다운로드를 실패로 처리하지는 않음
+            logger.warning(f"Failed to download comments of episode #{episode_no + 1}. {type(exc).__name__}: {exc}")
+
+    def _refresh_skipped_comments(self, reason: str, episode_no: int, **context) -> None:
+        if not self.refresh_skipped_comments or self.download_comments_option is None:
+            return
+        if reason not in ("already_exist", "skipped_by_snapshot"):
+            return
+        # 건너뛴 에피소드가 많을 때 에피소드마다 작업을 만들지 않고 작업 하나가 차례대로 처리함
+        if self._skipped_comment_task is None or self._skipped_comment_task.done():
+            self._skipped_comment_episodes.clear()
+            self._skipped_comment_task = self._create_background_task(self._download_skipped_comments())
+        self._skipped_comment_episodes.append(episode_no)
+
+    async def _download_skipped_comments(self) -> None:
+        episodes = self._skipped_comment_episodes
+        while episodes:
+            await self._download_comments_in_background(episodes.popleft())
+
+    def _get_episode_side_assets(self, episode_no: int, image_urls: list[str], episode_directory: Path) -> dict[str, str]:
+        side_assets = super()._get_episode_side_assets(episode_no, image_urls, episode_directory)
+        if self.download_audio and (audio_url := self.episode_audio_urls.get(episode_no)):
+            side_assets[f"{len(image_urls) + 1:03d}.mp3"] = audio_url
+        return side_assets
+
     async def _download_episode_images(self, episode_no: int, image_urls: list[str], episode_directory: Path) -> None:
-        if self.download_audio:
-            audio_url = self.episode_audio_urls.get(episode_no)
-            audio_name = f"{len(image_urls) + 1:03d}.mp3"
-            audio_path = episode_directory / audio_name
-            if audio_url and not audio_path.exists() and self.directory_manager._snapshot_contents_info(audio_path) is None:
-                try:
-                    res = await self.client.get(audio_url)
-                    with audio_path.open("wb") as f:
-                        async for data in res.aiter_bytes():
-                            f.write(data)
-                except Exception as exc:
-                    exc.add_note("Failed to download audio file.")
-                    raise
-                else:
-                    self.audio_names[episode_no] = audio_name
-        return await super()._download_episode_images(episode_no, image_urls, episode_directory)
+        if self.download_comments_option is not None:
+            self._create_background_task(self._download_comments_in_background(episode_no))
+        await super()._download_episode_images(episode_no, image_urls, episode_directory)
+        audio_name = f"{len(image_urls) + 1:03d}.mp3"
+        if self.download_audio and episode_no in self.episode_audio_urls and (episode_directory / audio_name).exists():
+            self.audio_names[episode_no] = audio_name
 
     @classmethod
     def _extract_webtoon_id(cls, url) -> tuple[str, int] | tuple[None, None]:
@@ -248,16 +375,6 @@ class NaverWebtoonScraper(Scraper[int]):
         self.json_headers.update({"Cookie": value, "X-Xsrf-Token": token})
         self.comment_headers.update({"Cookie": value})  # comment에서는 X-Xsrf-Token을 사용하지 않는 것 같음
 
-    def _gather_author_comment(self, episode_no: int, response: httpc.Response):
-        script = response.single("body > script", remain_ok=True)
-        information_script = script.text()
-        search_result = re.search(
-            r'article: *{"no":\d*,"subtitle":".+?","authorWords":(?P<author_comments_raw>.+?)},\s*currentIndex: *\d*,',
-            information_script,
-        )
-        assert search_result is not None
-        self.author_comments[episode_no] = json.loads(search_result.group("author_comments_raw"))
-
     def _apply_option(self, option: str, value: str) -> None:
         match option:
             case "download-comment" | "download-comments":
@@ -272,6 +389,8 @@ class NaverWebtoonScraper(Scraper[int]):
                         raise ValueError(f"Invalid value for download-comment option. A value must be among 'false', 'best', or 'new'. Value: {other!r}")
             case "always-refresh-comments":
                 self.always_refresh_comments = self._as_boolean(value)
+            case "refresh-skipped-comments":
+                self.refresh_skipped_comments = self._as_boolean(value)
             case "comment-download-limit":
                 self.comment_download_limit = int(value) if value else None
             case "download-audio" | "download-audios":
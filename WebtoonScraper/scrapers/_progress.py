@@ -0,0 +1,126 @@
+"""스크래퍼들이 함께 사용하는 진행 표시줄입니다.
+
+* 진행 표시줄은 모든 스크래퍼가 하나를 공유하며, 각 스크래퍼는 자신의 task를 가집니다.
+    마지막으로 사용하던 스크래퍼가 반환하면 진행 표시줄이 종료됩니다.
+* 에피소드마다 바뀌는 설명은 바로 포맷하지 않고 화면을 다시 그릴 때 가장 최근의 것만 포맷합니다.
+    따라서 이벤트가 아무리 많이 발생해도 포맷과 렌더링은 `REFRESH_PER_SECOND`번만 일어납니다.
+* 이미지를 받는 동안 전송된 바이트 수와 전송 중인 요청 수를 함께 표시합니다.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+from rich import progress
+from rich.text import Text
+
+from ..base import console
+
+__all__ = ["REFRESH_PER_SECOND", "DownloadProgress"]
+
+REFRESH_PER_SECOND = 10
+_RATE_WINDOW = 1.0  # 전송 속도를 다시 계산하는 간격(초)
+
+
+class _LazyDescription:
+    """포맷이 필요해질 때까지 포맷을 미루는 설명입니다."""
+
+    __slots__ = "template", "context", "extra_context", "_formatted"
+
+    def __init__(self, template: str, context: dict, extra_context: dict) -> None:
+        self.template = template
+        self.context = context
+        self.extra_context = extra_context
+        self._formatted: str | None = None
+
+    def __str__(self) -> str:
+        if self._formatted is None:
+            try:
+                self._formatted = self.template.format(**self.context, **self.extra_context)
+            except Exception:
+                # 렌더링 스레드에서 예외가 발생하면 진행 표시줄 전체가 멈추기 때문에 템플릿을 그대로 보여줌
+                self._formatted = self.template
+            self.context = self.extra_context = {}
+        return self._formatted
+
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
+
+
+class TransferColumn(progress.ProgressColumn):
+    """task의 전송량, 전송 속도, 전송 중인 요청 수를 표시합니다."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._samples: dict[progress.TaskID, tuple[float, int, float]] = {}
+
+    def render(self, task: progress.Task) -> Text:
+        transferred = task.fields.get("transferred", 0)
+        now = time.monotonic()
+        sampled_at, sampled_bytes, rate = self._samples.get(task.id, (now, transferred, 0.0))
+        if now - sampled_at >= _RATE_WINDOW:
+            rate = (transferred - sampled_bytes) / (now - sampled_at)
+            sampled_at, sampled_bytes = now, transferred
+        self._samples[task.id] = sampled_at, sampled_bytes, rate
+
+        text = f"{progress.filesize.decimal(transferred)} {progress.filesize.decimal(int(rate))}/s"
+        if in_flight := task.fields.get("in_flight"):
+            text += f" ({in_flight} in flight)"
+        return Text(text, style="progress.data.speed")
+
+
+class DownloadProgress(progress.Progress):
+    """여러 스크래퍼가 공유하는 진행 표시줄입니다. `acquire()`로 얻고 `release()`로 반환하세요."""
+
+    _shared: DownloadProgress | None = None
+    _users = 0
+    _lock = threading.Lock()
+
+    def __init__(self) -> None:
+        super().__init__(
+            progress.SpinnerColumn(spinner_name="aesthetic"),
+            progress.TextColumn("[progress.description]{task.description}"),
+            progress.BarColumn(bar_width=None),
+            progress.TaskProgressColumn(),
+            TransferColumn(),
+            progress.TimeRemainingColumn(),
+            progress.TextColumn("[progress.remaining]ETA"),
+            progress.TimeElapsedColumn(),
+            console=console,
+            transient=False,
+            expand=True,
+            refresh_per_second=REFRESH_PER_SECOND,
+        )
+
+    @classmethod
+    def acquire(cls) -> DownloadProgress:
+        with cls._lock:
+            if cls._shared is None:
+                cls._shared = cls()
+                cls._shared.start()
+            cls._users += 1
+            return cls._shared
+
+    @classmethod
+    def release(cls) -> None:
+        with cls._lock:
+            cls._users -= 1
+            if cls._users <= 0 and cls._shared is not None:
+                cls._shared.stop()
+                cls._shared = None
+                cls._users = 0
+
+    def update_description(self, task_id: progress.TaskID, template: str, context: dict, extra_context: dict) -> None:
+        """task의 설명을 바꿉니다. 포맷은 화면에 그려질 때 이루어집니다."""
+        if (task := self._tasks.get(task_id)) is not None:
+            task.description = _LazyDescription(template, context, extra_context)  # type: ignore
+
+    def add_transfer(self, task_id: progress.TaskID, transferred: int = 0, in_flight: int = 0) -> None:
+        """task의 전송량과 전송 중인 요청 수를 갱신합니다. 존재하지 않는 task라면 무시합니다."""
+        if (task := self._tasks.get(task_id)) is not None:
+            fields = task.fields
+            if transferred:
+                fields["transferred"] = fields.get("transferred", 0) + transferred
+            if in_flight:
+                fields["in_flight"] = fields.get("in_flight", 0) + in_flight
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import html
 import json
 import os
@@ -11,7 +12,7 @@ import typing
 import warnings
 from abc import abstractmethod
 from collections.abc import Callable, Container, Mapping
-from contextlib import suppress
+from contextlib import nullcontext, suppress
 from datetime import datetime
 from http.cookies import SimpleCookie
 from pathlib import Path
@@ -22,15 +23,16 @@ import certifi
 import httpc
 import httpx
 import pyfilename as pf
-from rich import progress
 from yarl import URL
 
-from ..base import console, logger, platforms
+from .. import json_codec
+from ..base import logger, platforms
 from ..directory_state import (
     DirectoryState,
     load_information_json,
 )
 from ..exceptions import (
+    LeaseHeldError,
     Unreachable,
     URLError,
     UseFetchEpisode,
@@ -39,18 +41,40 @@ from ._callback_manager import (
     CallbackManager,
     LogLevel,
 )
+from ._episode_table import DownloadStatus, Episode, EpisodeTable, SkipSet, StatusView
 from ._helpers import (
+    BoundedTaskGroup,
+    CountingSemaphore,
     EpisodeRange,
     ExtraInfoScraper,
+    SpilledList,
     async_reload_manager,
     infer_filetype,
+    is_reload_cached,
+    set_reload_cache,
 )
 from ._helpers import shorten as _shorten
+from ._ledger import EpisodeLedger, add_downloaded_file, current_ledger, record_request, record_response
+from ._progress import DownloadProgress
+
+if typing.TYPE_CHECKING:
+    from ..adaptive import AdaptiveController, AdaptiveLimiter
+    from ..bandwidth import BandwidthLimiter
+    from ..hedging import HedgePolicy
+    from ..leases import Lease, LeaseManager
+    from ..profiling import PhaseTimer
 
 WebtoonId = typing.TypeVar("WebtoonId")
+_NO_PHASE = nullcontext()
+WEBTOON_LEASE_NAME = ".webtoon.lease"
 CallableT = typing.TypeVar("CallableT", bound=Callable)
 RangeType = EpisodeRange | Container[WebtoonId] | None
-DownloadStatus = typing.Literal["failed", "downloaded", "already_exist", "skipped_by_snapshot", "not_downloadable", "skipped_by_skip_download", "skipped_by_range"]
+
+
+@functools.cache
+def _ssl_context() -> ssl.SSLContext:
+    # 인증서를 불러오는 데에 시간이 걸리기 때문에 모든 스크래퍼가 하나의 SSL context를 공유함
+    return ssl.create_default_context(cafile=certifi.where())  # cspell: ignore cafile
 
 
 class Scraper[WebtoonId]:  # MARK: SCRAPER
@@ -88,6 +112,41 @@ class Scraper[WebtoonId]:  # MARK: SCRAPER
             썸네일을 다운로드하지 않습니다.
             썸네일이 다운로드되어있는 것을 확신하거나 썸네일 다운로드가 필요 없을 경우 사용합니다.
 
+        max_concurrent_requests (int, 10):
+            이미지, 오디오, 댓글 등을 다운로드할 때 동시에 보낼 수 있는 요청의 최대 개수입니다.
+            스크래퍼의 모든 작업이 `request_limiter`를 공유하기 때문에 이 값을 넘는 요청이 동시에 전송되지 않습니다.
+            다운로드가 시작된 뒤에 값을 변경하면 적용되지 않습니다.
+
+        phase_timer (PhaseTimer | None, None):
+            `WebtoonScraper.profiling.PhaseTimer`를 설정하면 정보 불러오기, 다운로드 간격, 에피소드 페이지 요청, 이미지 전송, 파일 쓰기,
+            information.json 생성 등 단계별로 걸린 시간을 기록합니다. 기록된 값은 `download_ended` 콜백의 `phases`로도 전달됩니다.
+
+        bandwidth_limiter (BandwidthLimiter | None, None):
+            `WebtoonScraper.bandwidth.BandwidthLimiter`를 설정하면 이미지와 부속 파일을 받는 속도를 제한합니다.
+            클래스 변수이기 때문에 `Scraper.bandwidth_limiter`에 설정하면 프로세스의 모든 스크래퍼가 하나의 제한을 공유합니다.
+
+        hedge_policy (HedgePolicy | None, None):
+            `WebtoonScraper.hedging.HedgePolicy`를 설정하면 첫 바이트가 늦어지는 이미지 요청을 한 번 더 보내고 먼저 끝난 쪽을 사용합니다.
+            클래스 변수이기 때문에 `Scraper.hedge_policy`에 설정하면 프로세스의 모든 스크래퍼가 하나의 예산을 공유합니다.
+
+        lease_manager (LeaseManager | None, None):
+            `WebtoonScraper.leases.LeaseManager`를 설정하면 웹툰 디렉토리와 에피소드 디렉토리에 lease를 얻은 뒤에 다운로드합니다.
+            다른 작업자가 웹툰 디렉토리의 lease를 가지고 있다면 LeaseHeldError가 발생하고,
+            에피소드 디렉토리의 lease를 가지고 있다면 해당 에피소드를 `skipped_by_lease`로 건너뜁니다.
+
+        concurrency_controller (AdaptiveController | None, None):
+            `WebtoonScraper.adaptive.AdaptiveController`를 등록하면 설정됩니다.
+            동시 요청 수를 응답 지연 시간과 오류에 따라 1부터 `max_concurrent_requests` 사이에서 조절하고, 호스트별 타임아웃을 조절합니다.
+
+        stream_listing (bool, False):
+            에피소드 목록을 모두 불러오기 전에 다운로드를 시작합니다. 목록은 백그라운드에서 계속 불러와지며, 불러온 에피소드부터 차례로 다운로드됩니다.
+            회차가 아주 많은 웹툰에서 첫 에피소드가 다운로드되기까지의 시간을 줄입니다. 진행 표시줄의 전체 에피소드 수는 목록을 불러오는 동안 늘어납니다.
+            목록을 나누어 불러올 수 없는 플랫폼에서는 목록을 모두 불러온 뒤에 다운로드합니다.
+
+        low_memory (bool, False):
+            에피소드 목록 API의 원본 응답(`raw_articles` 등)을 메모리에 두는 대신 임시 파일에 저장합니다.
+            저장된 값은 information.json을 만들 때만 다시 읽힙니다.
+
         이 아래는 데이터 속성들입니다. 기본값이 설정되어 있으나 사용자가 선호에 따라 변경될 수 있도록 디자인되어 있습니다.
 
         base_directory (Path | str, Path.cwd()):
@@ -161,6 +220,8 @@ class Scraper[WebtoonId]:  # MARK: SCRAPER
     EXTRA_INFO_SCRAPER_FACTORY: type[ExtraInfoScraper] = ExtraInfoScraper
     LOGIN_URL: str
     download_interval: int | float = 0.5
+    bandwidth_limiter: BandwidthLimiter | None = None
+    hedge_policy: HedgePolicy | None = None
     information_vars: dict[str, None | str | Path | Callable] = dict(
         title=None,
         platform="PLATFORM",
@@ -169,6 +230,7 @@ class Scraper[WebtoonId]:  # MARK: SCRAPER
         episode_titles=None,
         author=None,
         download_status="download_status",
+        download_stats=None,
         webtoon_dir_name="webtoon_dir_format",
         episode_dir_name="episode_dir_format",
         episode_dir_names=None,
@@ -195,7 +257,8 @@ class Scraper[WebtoonId]:  # MARK: SCRAPER
             # 아주 드문 경우 certifi를 사용하지 않을 때 ssl 관련 오류가 보고되는 경우가 있어
             # 문제를 피하기 위해 certifi를 사용. 그러나 이를 사용하지 않아도 99%의 경우는 상관 없고,
             # 실제로 제거해도 문제 없음.
-            verify=ssl.create_default_context(cafile=certifi.where()),  # cspell: ignore cafile
+            verify=_ssl_context(),
+            event_hooks=dict(request=[record_request], response=[record_response]),
         )
         self.json_headers = httpc.HEADERS | {
             "accept": "application/json, text/plain, */*",
@@ -209,23 +272,34 @@ class Scraper[WebtoonId]:  # MARK: SCRAPER
         self.ignore_snapshot: bool = False
         self.skip_thumbnail_download: bool = False
         self.previous_status_to_skip: list[DownloadStatus] = []
+        self.max_concurrent_requests: int = 10
+        self.phase_timer: PhaseTimer | None = None
+        self.lease_manager: LeaseManager | None = None
+        self.concurrency_controller: AdaptiveController | None = None
+        self.stream_listing: bool = False
+        self.low_memory: bool = False
+        self.progress_task_id = None
+        self._progress: DownloadProgress | None = None
 
         # data attributes
         self.author: str | None = None  # 스크래퍼들이 모두 author 필드를 구현하면 제거하기
         self.webtoon_id: WebtoonId = webtoon_id
         self.base_directory: Path | str = Path.cwd()
-        self.skip_download: list[int] = []
+        self.episode_table = EpisodeTable()
+        """에피소드 ID, 제목, 다운로드 상태 등을 담는 표입니다. `episode_ids`, `download_status` 등은 모두 이 표를 가리킵니다."""
         self.callbacks = CallbackManager(dict(scraper=self))
         # initialize extra info scraper
         self.extra_info_scraper
 
         # private data attributes
-        """0-based index를 사용해 다운로드를 생략할 웹툰을 결정합니다."""
         self._download_status: typing.Literal["downloading", "nothing", "canceling"] = "nothing"
         self._tasks: asyncio.Queue[asyncio.Future] = asyncio.Queue()
         """_tasks에 값을 등록해 두면 스크래퍼가 종료될 때 해당 task들을 완료하거나 취소합니다."""
+        self._unfinished_background_tasks = 0
         self._cookie_set = False
         """쿠키가 사용자에 의해 변경되었는지를 검사합니다."""
+        self._webtoon_lease: Lease | None = None
+        self._episode_leases: dict[int, Lease] = {}
         self.webtoon_dir_format: str = "{title}({identifier})"
         self.episode_dir_format: str = "{no:04d}. {episode_title}"
 
@@ -296,6 +370,16 @@ class Scraper[WebtoonId]:  # MARK: SCRAPER
 
     # MARK: OVERRIDABLE PRIVATE METHODS
 
+    async def _stream_episode_information(self) -> typing.AsyncIterator[Episode]:
+        """에피소드 목록을 불러오며 `episode_table`에 추가된 에피소드를 차례로 반환합니다.
+
+        목록을 나누어 불러올 수 있는 스크래퍼는 이 메서드를 구현하고 `fetch_episode_information()`에서 이를 끝까지 순회하도록 하세요.
+        기본 구현은 목록을 모두 불러온 뒤에 반환합니다.
+        """
+        await self.fetch_episode_information()
+        for episode_no in range(len(self.episode_table)):
+            yield self.episode_table.episode(episode_no)
+
     @classmethod
     def _from_string(cls, string: str, /, **kwargs):
         """webtoon_id가 int가 아니라면 반드시 구현해야 합니다."""
@@ -351,55 +435,76 @@ class Scraper[WebtoonId]:  # MARK: SCRAPER
             logger.debug("Cookie is not set")
         if not getattr(self, "bearer", True):  # bearer가 있는데 None인 경우
             logger.debug("Bearer is not set")
+        # download_webtoon()은 호출될 때마다 새 이벤트 루프를 사용하니 이전 루프에 묶인 limiter를 재사용하지 않음
+        self._request_limiter = self._create_request_limiter()
 
+        listing: typing.AsyncIterator[Episode] | None = None
         async with self.callbacks.context("setup", start_default=self.callbacks.create("Gathering data...")):
-            await self.fetch_all()
+            with self._phase("fetch_all"):
+                if self.stream_listing and not is_reload_cached(self, type(self).fetch_episode_information):
+                    try:
+                        await self.fetch_webtoon_information()
+                    except UseFetchEpisode:
+                        await self.fetch_episode_information()
+                    else:
+                        listing = self.aiter_episodes()
+                else:
+                    await self.fetch_all()
 
         webtoon_directory = self._prepare_directory()
-        self.directory_manager = WebtoonDirectory(webtoon_directory, ignore_snapshot=self.ignore_snapshot)
-        self.directory_manager.load()
-        await self.callbacks.async_callback("download_started")
-        thumbnail_task = await self._download_thumbnail()
-
-        self._apply_skip_previously_failed()
-
         try:
-            if self._download_status != "nothing":
-                logger.warning(f"Program status is not usual: {self._download_status!r}")
-            self._download_status = "downloading"
-            async with self.callbacks.context("download_episode", end_default=self.callbacks.create("The webtoon {scraper.title} download ended.")):
-                await self._download_episodes()
-
-        except BaseException as exc:
-            async with self.callbacks.context("download_ended") as context:
-                # cancelling all tasks
-                canceled_tasks = 0
-                tasks = self._tasks
-                while not tasks.empty():
-                    task = tasks.get_nowait()
-                    canceled_tasks += task.cancel()
-
-                extras: dict = dict()
-                if thumbnail_task:
-                    if isinstance(thumbnail_task, Path):
-                        extras["thumbnail_path"] = thumbnail_task
-                    elif not self.skip_thumbnail_download and not thumbnail_task.cancel():
-                        extras["thumbnail_path"] = await thumbnail_task
-                self._download_status = "nothing"
-                context.update(exc=exc, extras=extras, canceled=canceled_tasks, is_successful=False)
-            raise
+            self.directory_manager = WebtoonDirectory(webtoon_directory, ignore_snapshot=self.ignore_snapshot)
+            self.directory_manager.load()
+            await self.callbacks.async_callback("download_started")
+            thumbnail_task = await self._download_thumbnail()
+
+            if listing is None:
+                self._apply_skip_previously_failed()
+
+            try:
+                if self._download_status != "nothing":
+                    logger.warning(f"Program status is not usual: {self._download_status!r}")
+                self._download_status = "downloading"
+                async with self.callbacks.context("download_episode", end_default=self.callbacks.create("The webtoon {scraper.title} download ended.")):
+                    await self._download_episodes(listing)
+
+            except BaseException as exc:
+                async with self.callbacks.context("download_ended") as context:
+                    # cancelling all tasks
+                    canceled_tasks = 0
+                    tasks = self._tasks
+                    while not tasks.empty():
+                        task = tasks.get_nowait()
+                        canceled_tasks += task.cancel()
+                    canceled_tasks += await self.callbacks.drain(cancel=True)
+
+                    extras: dict = dict()
+                    if thumbnail_task:
+                        if isinstance(thumbnail_task, Path):
+                            extras["thumbnail_path"] = thumbnail_task
+                        elif not self.skip_thumbnail_download and not thumbnail_task.cancel():
+                            extras["thumbnail_path"] = await thumbnail_task
+                    self._download_status = "nothing"
+                    context.update(exc=exc, extras=extras, canceled=canceled_tasks, is_successful=False, phases=self.phase_timer)
+                # download_ended 콜백이 새로 실행한 콜백들
+                await self.callbacks.drain(cancel=True)
+                raise
 
-        else:
-            async with self.callbacks.context("download_ended") as context:
-                await self._tasks.join()
-                self._download_status = "nothing"
-                extras: dict = dict()
-                if thumbnail_task:
-                    if isinstance(thumbnail_task, Path):
-                        extras["thumbnail_path"] = thumbnail_task
-                    elif not self.skip_thumbnail_download:
-                        extras["thumbnail_path"] = await thumbnail_task
-                context.update(exc=None, extras=extras)
+            else:
+                async with self.callbacks.context("download_ended") as context:
+                    await self._tasks.join()
+                    await self.callbacks.drain()
+                    self._download_status = "nothing"
+                    extras: dict = dict()
+                    if thumbnail_task:
+                        if isinstance(thumbnail_task, Path):
+                            extras["thumbnail_path"] = thumbnail_task
+                        elif not self.skip_thumbnail_download:
+                            extras["thumbnail_path"] = await thumbnail_task
+                    context.update(exc=None, extras=extras, phases=self.phase_timer)
+                await self.callbacks.drain()
+        finally:
+            self._release_webtoon_lease()
 
     async def fetch_all(self, reload: bool = False) -> None:
         """웹툰과 에피소드에 대한 정보를 모두 불러옵니다.
@@ -414,6 +519,29 @@ class Scraper[WebtoonId]:  # MARK: SCRAPER
             await self.fetch_webtoon_information(reload=reload)
         await self.fetch_episode_information(reload=reload)
 
+    async def aiter_episodes(self) -> typing.AsyncIterator[Episode]:
+        """에피소드 목록을 불러오며 불러온 에피소드를 하나씩 반환합니다.
+
+        목록을 여러 페이지에 걸쳐 불러오는 플랫폼에서는 페이지가 도착하는 대로 반환하므로 목록을 모두 불러올 때까지 기다리지 않아도 됩니다.
+        반환된 에피소드는 `episode_ids` 등에도 곧바로 추가되며, 끝까지 순회하면 `fetch_episode_information()`을 실행한 것과 같습니다.
+        이미 에피소드 목록을 불러왔다면 불러온 목록을 반환합니다.
+
+        Example:
+            ```python
+            async for episode in scraper.aiter_episodes():
+                print(episode.no + 1, episode.title)
+            ```
+        """
+        fetch_episode_information = type(self).fetch_episode_information
+        if is_reload_cached(self, fetch_episode_information):
+            for episode_no in range(len(self.episode_table)):
+                yield self.episode_table.episode(episode_no)
+            return
+
+        async for episode in self._stream_episode_information():
+            yield episode
+        set_reload_cache(self, fetch_episode_information)
+
     @classmethod
     def from_url(cls, url: str) -> typing.Self:
         # NaverWebtoonScraper와 KakaoWebtoonScraper에 복사된 코드가 있음.
@@ -453,13 +581,8 @@ class Scraper[WebtoonId]:  # MARK: SCRAPER
     async def aclose(self) -> None:
         """스크래퍼를 닫습니다. `Scraper.stop()` 메서드를 사용하기에 상당히 불안정합니다."""
         self.stop()
-        if self.use_progress_bar:
-            self.progress.stop()
+        self._release_progress()
         await self.client.aclose()
-        if getattr(self, "_progress", None):
-            self._progress.stop()
-            if not typing.TYPE_CHECKING:
-                self._progress = None
 
     def stop(self) -> None:
         """웹툰의 에피소드 다운로드를 '정중하게' 종료합니다.
@@ -478,24 +601,48 @@ class Scraper[WebtoonId]:  # MARK: SCRAPER
     # MARK: PROPERTIES
 
     @property
-    def progress(self) -> progress.Progress:
-        if getattr(self, "_progress", None):
-            return self._progress
-        self._progress = progress.Progress(
-            progress.SpinnerColumn(spinner_name="aesthetic"),
-            progress.TextColumn("[progress.description]{task.description}"),
-            progress.BarColumn(bar_width=None),
-            progress.TaskProgressColumn(),
-            progress.TimeRemainingColumn(),
-            progress.TextColumn("[progress.remaining]ETA"),
-            progress.TimeElapsedColumn(),
-            console=console,
-            transient=False,
-            expand=True,
-        )
-        self._progress.start()
+    def progress(self) -> DownloadProgress:
+        """모든 스크래퍼가 공유하는 진행 표시줄입니다. 처음 접근할 때 얻고, 다운로드가 끝나면 반환합니다."""
+        if self._progress is None:
+            self._progress = DownloadProgress.acquire()
         return self._progress
 
+    def _release_progress(self) -> None:
+        if self._progress is not None:
+            self._progress = None
+            DownloadProgress.release()
+
+    @property
+    def request_limiter(self) -> CountingSemaphore | AdaptiveLimiter:
+        """스크래퍼의 모든 동시 요청이 공유하는 limiter입니다."""
+        try:
+            return self._request_limiter
+        except AttributeError:
+            self._request_limiter = self._create_request_limiter()
+            return self._request_limiter
+
+    def _create_request_limiter(self) -> CountingSemaphore | AdaptiveLimiter:
+        if self.concurrency_controller is not None:
+            return self.concurrency_controller.create_limiter(self)
+        return CountingSemaphore(self.max_concurrent_requests)
+
+    @property
+    def request_limit(self) -> int:
+        """현재 동시에 보낼 수 있는 요청의 수입니다. 동시 요청 수가 조절되고 있다면 조절된 값을 반환합니다."""
+        limiter = getattr(self, "_request_limiter", None)
+        return self.max_concurrent_requests if limiter is None else limiter.limit
+
+    @property
+    def requests_in_flight(self) -> int:
+        """request_limiter의 슬롯을 차지하고 있는 요청의 수입니다."""
+        limiter = getattr(self, "_request_limiter", None)
+        return 0 if limiter is None else limiter.in_flight
+
+    @property
+    def background_tasks(self) -> int:
+        """댓글 다운로드 등 다운로드와 동시에 진행되고 있는 작업 중 끝나지 않은 작업의 수입니다."""
+        return self._unfinished_background_tasks
+
     @property
     def cookie(self) -> str | None:
         headers = self.headers
@@ -573,52 +720,167 @@ class Scraper[WebtoonId]:  # MARK: SCRAPER
             capsuled_download_range.add_opaque_container(download_range)
             self._download_range = capsuled_download_range
 
+    # 아래의 속성들은 episode_table의 열을 가리킴.
+    # 아직 값이 정해지지 않은 열은 AttributeError를 일으켜 속성이 없었던 때처럼 동작함(information_vars 등).
+
+    @property
+    def episode_ids(self) -> list:
+        return self._episode_column("ids")
+
+    @episode_ids.setter
+    def episode_ids(self, value: typing.Iterable) -> None:
+        self.episode_table.ids = list(value)
+
+    @property
+    def episode_titles(self) -> list[str | None]:
+        return self._episode_column("titles")
+
+    @episode_titles.setter
+    def episode_titles(self, value: typing.Iterable[str | None]) -> None:
+        self.episode_table.titles = list(value)
+
+    @property
+    def is_episode_charged_list(self) -> list[bool | None]:
+        return self._episode_column("charged")
+
+    @is_episode_charged_list.setter
+    def is_episode_charged_list(self, value: typing.Iterable[bool | None]) -> None:
+        self.episode_table.charged = list(value)
+
+    @property
+    def episode_dir_names(self) -> list[str | None]:
+        return self._episode_column("dir_names")
+
+    @episode_dir_names.setter
+    def episode_dir_names(self, value: typing.Iterable[str | None]) -> None:
+        self.episode_table.dir_names = list(value)
+
+    @property
+    def download_status(self) -> StatusView:
+        """에피소드들의 다운로드 상태입니다. 리스트처럼 읽고 대입할 수 있습니다."""
+        return self._episode_column("statuses")
+
+    @download_status.setter
+    def download_status(self, value: typing.Iterable[DownloadStatus | None]) -> None:
+        self.episode_table.statuses = value
+
+    @property
+    def skip_download(self) -> SkipSet:
+        """0-based index를 사용해 다운로드를 생략할 에피소드를 결정합니다."""
+        return self.episode_table.skipped
+
+    @skip_download.setter
+    def skip_download(self, value: typing.Iterable[int]) -> None:
+        self.episode_table.skipped = SkipSet(value)
+
+    def _episode_column(self, name: str):
+        if (column := getattr(self.episode_table, name)) is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r} yet")
+        return column
+
     # MARK: PRIVATE METHODS
 
-    async def _download_episodes(self) -> None:
-        total_episodes = len(self.episode_ids)
-        self.download_status: list[DownloadStatus | None] = [None] * total_episodes
-        self.episode_dir_names: list[str | None] = [None] * total_episodes
+    async def _download_episodes(self, listing: typing.AsyncIterator[Episode] | None = None) -> None:
+        """에피소드들을 차례로 다운로드합니다. listing이 주어지면 에피소드 목록을 불러오는 동시에 불러온 에피소드부터 다운로드합니다."""
+        total_episodes = 0 if listing is not None else len(self.episode_ids)
+        self.episode_table.reset_download_state()
+        self.download_stats: dict[int, dict] = {}
+        """다운로드를 시도한 에피소드의 소요 시간, 바이트 수, 요청 및 재시도 횟수 등입니다."""
         if self.use_progress_bar:
             task = self.progress.add_task("Setting up...", total=total_episodes)
             self.progress_task_id = task
 
         try:
-            for episode_no in range(total_episodes):
-                if self._download_status == "canceling":
-                    raise KeyboardInterrupt
+            if listing is not None:
+                await self._download_listed_episodes(listing)
+                return
 
+            # download_range는 1-based indexing이니 조정이 필요함
+            selected_episodes = [episode_no1 - 1 for episode_no1 in self.download_range.iter_selected(total_episodes)]
+            # 범위 밖의 에피소드들은 에피소드마다 콜백을 부르는 대신 한꺼번에 건너뜀
+            skipped_ranges: list[range] = []
+            next_episode_no = 0
+            for episode_no in selected_episodes:
+                if episode_no > next_episode_no:
+                    skipped_ranges.append(range(next_episode_no, episode_no))
+                next_episode_no = episode_no + 1
+            if next_episode_no < total_episodes:
+                skipped_ranges.append(range(next_episode_no, total_episodes))
+            await self._episodes_skipped_by_range(skipped_ranges)
+
+            for episode_no in selected_episodes:
+                await self._process_selected_episode(episode_no)
+        finally:
+            if self.use_progress_bar:
+                self.progress.remove_task(task)
+                self.progress_task_id = None
+                self._release_progress()
+
+    async def _download_listed_episodes(self, listing: typing.AsyncIterator[Episode]) -> None:
+        # 에피소드를 다운로드하는 동안에도 목록을 계속 불러오도록 별도의 task에서 순회함
+        queue: asyncio.Queue[Episode | None] = asyncio.Queue()
+
+        async def produce() -> None:
+            try:
+                async for episode in listing:
+                    queue.put_nowait(episode)
+            finally:
+                queue.put_nowait(None)
+
+        producer = asyncio.create_task(produce())
+        ids_to_skip = self._ids_to_skip()
+        skipped_since: int | None = None
+        try:
+            while (episode := await queue.get()) is not None:
                 if self.use_progress_bar:
-                    self.progress.advance(task)
+                    self.progress.update(self.progress_task_id, total=len(self.episode_table))  # type: ignore
+                if episode.no + 1 not in self.download_range:
+                    if skipped_since is None:
+                        skipped_since = episode.no
+                    continue
+                if skipped_since is not None:
+                    await self._episodes_skipped_by_range([range(skipped_since, episode.no)])
+                    skipped_since = None
+                if episode.id in ids_to_skip:
+                    self.skip_download.add(episode.no)
+                await self._process_selected_episode(episode.no)
+
+            # 목록을 불러오다 발생한 예외를 전달함
+            await producer
+            if skipped_since is not None:
+                await self._episodes_skipped_by_range([range(skipped_since, len(self.episode_table))])
+        finally:
+            if not producer.done():
+                producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
 
-                episode_title = self.episode_titles[episode_no]
-                context: dict = dict(episode_no=episode_no, episode_no1=episode_no + 1, short_ep_title=episode_title and _shorten(episode_title), total_ep=len(self.episode_ids))
+    async def _process_selected_episode(self, episode_no: int) -> None:
+        if self._download_status == "canceling":
+            raise KeyboardInterrupt
 
-                skip_download = episode_no in self.skip_download
-                # download_range는 1-based indexing이니 조정이 필요함
-                skip_range = episode_no + 1 not in self.download_range
+        if self.use_progress_bar:
+            self.progress.advance(self.progress_task_id)  # type: ignore
 
-                await self.callbacks.async_callback("episode_download_before_skipping", skip_download=skip_download, skip_range=skip_range, **context)
+        episode_title = self.episode_titles[episode_no]
+        context: dict = dict(episode_no=episode_no, episode_no1=episode_no + 1, short_ep_title=episode_title and _shorten(episode_title), total_ep=len(self.episode_ids))
 
-                if skip_download:
-                    reason = "skipped_by_skip_download"
-                    description = "because the episode is included in skip_download"
-                    await self._episode_skipped(reason, description, level="debug", **context)
-                    continue
-                if skip_range:
-                    reason = "skipped_by_range"
-                    description = "because of the set range"
-                    await self._episode_skipped(reason, description, level="debug", **context)
-                    continue
+        skip_download = episode_no in self.skip_download
+
+        await self.callbacks.async_callback("episode_download_before_skipping", skip_download=skip_download, skip_range=False, **context)
 
-                await self._download_episode(episode_no, context)
+        if skip_download:
+            reason = "skipped_by_skip_download"
+            description = "because the episode is included in skip_download"
+            await self._episode_skipped(reason, description, level="debug", **context)
+            return
+
+        context["ledger"] = ledger = EpisodeLedger()
+        token = current_ledger.set(ledger)
+        try:
+            await self._download_episode(episode_no, context)
         finally:
-            if self.use_progress_bar:
-                self.progress.remove_task(task)
-                if self.progress.tasks:
-                    logger.warning("Can't stop progress since it's in use.")
-                else:
-                    self.progress.stop()
+            current_ledger.reset(token)
+            self._release_episode_lease(episode_no)
 
     async def _download_episode(self, episode_no: int, context: dict) -> None:
         await self.callbacks.async_callback("check_episode_download", None, episode_no=episode_no)
@@ -669,6 +931,7 @@ class Scraper[WebtoonId]:  # MARK: SCRAPER
             else:
                 logger.error(f"download failed when download images of {episode_no + 1}. {episode_title!r}. {type(exc).__name__}: {exc}")
             self.download_status[episode_no] = "failed"
+            self._record_episode_stats(episode_no, context)
             shutil.rmtree(episode_directory)
             await self.callbacks.async_callback(
                 "download_failed",
@@ -692,10 +955,19 @@ class Scraper[WebtoonId]:  # MARK: SCRAPER
         else:
             # send done callback message
             self.download_status[episode_no] = "downloaded"
+            self._record_episode_stats(episode_no, context)
             await self.callbacks.async_callback("download_completed", self.callbacks.create("[{episode_no1}/{total_ep}] {short_ep_title!r} downloaded", progress_update="{short_ep_title} downloaded"), **context)
 
+    def _get_episode_side_assets(self, episode_no: int, image_urls: list[str], episode_directory: Path) -> dict[str, str]:
+        """이미지와 함께 다운로드할 에피소드의 부속 파일(배경음악 등)을 `{파일 이름: URL}`의 형태로 반환합니다."""
+        return {}
+
     async def _download_episode_images(self, episode_no: int, image_urls: list[str], episode_directory: Path) -> None:
-        async with asyncio.TaskGroup() as group:
+        side_assets = self._get_episode_side_assets(episode_no, image_urls, episode_directory)
+        async with BoundedTaskGroup(self.max_concurrent_requests) as group:
+            # 부속 파일은 대체로 이미지보다 크기 때문에 먼저 시작함
+            for name, url in side_assets.items():
+                group.create_task(self._download_side_asset(url, episode_directory / name, episode_no=episode_no))
             for index, url in enumerate(image_urls, 1):
                 download_task = self._download_image(
                     url,
@@ -705,6 +977,10 @@ class Scraper[WebtoonId]:  # MARK: SCRAPER
                 )
                 group.create_task(download_task)
 
+    def _record_episode_stats(self, episode_no: int, context: dict) -> None:
+        if (ledger := context.get("ledger")) is not None:
+            self.download_stats[episode_no] = context["stats"] = ledger.summary()
+
     def _get_information(self):
         """information.json에 탑재할 정보를 갈무리합니다.
 
@@ -787,7 +1063,7 @@ class Scraper[WebtoonId]:  # MARK: SCRAPER
             case Mapping() as mapping:
                 return {str(key): self._normalize_information(value) for key, value in mapping.items()}
 
-            case list(seq):
+            case list() | tuple() | StatusView() | SpilledList() as seq:
                 return [self._normalize_information(item) for item in seq]
 
             case Path() as path:
@@ -803,11 +1079,18 @@ class Scraper[WebtoonId]:  # MARK: SCRAPER
                 self._apply_option(option.strip().lower().replace("_", "-"), value)
 
     def _apply_skip_previously_failed(self) -> None:
-        if to_skip := self.previous_status_to_skip:
-            prev_episode_ids = self.directory_manager._old_information.get("episode_ids", [])
-            download_status = self.directory_manager._old_information.get("download_status", [])
-            id_status = dict(zip(prev_episode_ids, download_status, strict=True))
-            self.skip_download.extend(i for i, episode_id in enumerate(self.episode_ids) if id_status.get(episode_id) in to_skip)
+        if ids_to_skip := self._ids_to_skip():
+            self.skip_download.update(i for i, episode_id in enumerate(self.episode_ids) if episode_id in ids_to_skip)
+
+    def _ids_to_skip(self) -> set:
+        """이전 다운로드에서 `previous_status_to_skip`에 해당하는 상태였던 에피소드들의 ID입니다."""
+        if not (to_skip := self.previous_status_to_skip):
+            return set()
+        # 이전 information.json은 예전 버전에서 저장되었거나 직접 수정되었을 수 있으니 ID와 상태만 느슨하게 읽음
+        previous = EpisodeTable.from_information(self.directory_manager._old_information, strict=False)
+        if previous.ids is None or previous.statuses is None:
+            return set()
+        return {previous.ids[episode_no] for episode_no in previous.where(*to_skip)}
 
     @staticmethod
     def _as_boolean(value: str) -> bool:
@@ -821,6 +1104,49 @@ class Scraper[WebtoonId]:  # MARK: SCRAPER
             case other:
                 raise ValueError(f"{other!r} can't be represented as boolean.")
 
+    def _phase(self, name: str) -> typing.ContextManager:
+        """phase_timer가 설정되어 있다면 해당 단계에 걸린 시간을 기록합니다."""
+        if self.phase_timer is None:
+            return _NO_PHASE
+        return self.phase_timer.phase(name)
+
+    def _create_background_task(self, coro: typing.Coroutine) -> asyncio.Task:
+        """다운로드와 동시에 진행되는 작업을 생성합니다.
+
+        생성된 작업은 웹툰 다운로드가 정상적으로 끝날 때 완료될 때까지 기다려지며, 예외로 끝날 때는 취소됩니다.
+        """
+        task = asyncio.create_task(coro)
+        self._tasks.put_nowait(task)
+        self._unfinished_background_tasks += 1
+        task.add_done_callback(self._background_task_done)
+        return task
+
+    def _background_task_done(self, task: asyncio.Task) -> None:
+        self._unfinished_background_tasks -= 1
+        self._tasks.task_done()
+
+    async def _episodes_skipped_by_range(self, skipped_ranges: list[range]) -> None:
+        """다운로드 범위에 포함되지 않은 에피소드들을 건너뜁니다.
+
+        에피소드마다 `download_skipped`를 부르는 대신 `download_skipped_by_range`를 한 번만 부릅니다.
+        `skipped_ranges`는 건너뛴 에피소드 번호(0부터 시작)들의 range입니다.
+        """
+        skipped_count = sum(map(len, skipped_ranges))
+        if not skipped_count:
+            return
+        for skipped in skipped_ranges:
+            self.episode_table.set_status(skipped, "skipped_by_range")
+        if self.use_progress_bar:
+            self.progress.advance(self.progress_task_id, skipped_count)  # type: ignore
+        await self.callbacks.async_callback(
+            "download_skipped_by_range",
+            self.callbacks.create("{skipped_count} episode(s) are skipped because of the set range", level="debug"),
+            reason="skipped_by_range",
+            skipped_ranges=skipped_ranges,
+            skipped_count=skipped_count,
+            total_ep=len(self.episode_ids),
+        )
+
     async def _episode_skipped(self, reason: DownloadStatus, description: str, *, no_progress: bool = False, episode_no, level: LogLevel = "info", **context):
         """에피소드 다운로드를 건너뛸 때 사용하는 콜백입니다."""
         if (ep_title := self.episode_titles[episode_no]) is None:
@@ -863,32 +1189,165 @@ class Scraper[WebtoonId]:  # MARK: SCRAPER
                 **context,
             )
 
+    async def _fetch_content(self, url: str, on_first_byte: Callable[[], None] | None = None) -> tuple[httpx.Headers, bytes]:
+        """URL의 내용을 스트리밍으로 받으며, 받는 동안의 전송량을 진행 표시줄과 대역폭 제한에 반영합니다.
+
+        on_first_byte는 응답 헤더를 받았을 때 호출됩니다.
+        스트리밍으로 받을 때도 5xx 응답이나 본문을 받는 도중의 오류는 클라이언트의 `retry`만큼 재시도됩니다.
+        """
+        progress = self._progress if self.use_progress_bar else None
+        task_id = self.progress_task_id
+        if progress is None or task_id is None:
+            progress = None
+        limiter = self.bandwidth_limiter
+        if progress is None and limiter is None and on_first_byte is None:
+            response = await self.client.get(url)
+            return response.headers, response.content
+
+        if progress is not None:
+            progress.add_transfer(task_id, in_flight=1)  # type: ignore
+        try:
+            # client.stream()은 응답 헤더까지만 재시도하니 본문을 읽다 실패한 경우에도 재시도되도록 직접 재시도함.
+            # httpc와 마찬가지로 같은 요청 객체를 다시 보내기 때문에 hook들이 재시도를 구분할 수 있음.
+            request = self.client.build_request("GET", url)
+            attempts = self.client.retry or 1
+            exceptions: list[Exception] = []
+            for _ in range(attempts):
+                try:
+                    return await self._read_streamed(request, progress, task_id, limiter, on_first_byte)
+                except httpx.HTTPStatusError as exc:
+                    if not 500 <= exc.response.status_code < 600:
+                        raise
+                    exceptions.append(exc)
+                    reason = f"status code {exc.response.status_code}"
+                except (httpx.RequestError, httpx.StreamError) as exc:
+                    exceptions.append(exc)
+                    reason = type(exc).__name__
+                if len(exceptions) < attempts:
+                    logger.warning(f"Attempting fetch again ({reason})...")
+            if len(exceptions) == 1:
+                raise exceptions[0]
+            raise ExceptionGroup("Request failed after multiple attempts", exceptions)
+        finally:
+            if progress is not None:
+                progress.add_transfer(task_id, in_flight=-1)  # type: ignore
+
+    async def _read_streamed(
+        self,
+        request: httpx.Request,
+        progress: DownloadProgress | None,
+        task_id,
+        limiter: BandwidthLimiter | None,
+        on_first_byte: Callable[[], None] | None,
+    ) -> tuple[httpx.Headers, bytes]:
+        try:
+            response = await self.client.send(request, stream=True, retry=1)
+        except httpx.HTTPStatusError as exc:
+            # 스트리밍 응답은 닫지 않으면 연결이 반환되지 않음
+            await exc.response.aclose()
+            raise
+        try:
+            if on_first_byte is not None:
+                on_first_byte()
+            chunks = []
+            metered = 0
+            async for chunk in response.aiter_bytes():
+                chunks.append(chunk)
+                if progress is not None:
+                    progress.add_transfer(task_id, len(chunk))  # type: ignore
+                if limiter is not None:
+                    # 압축이 풀린 크기가 아니라 실제로 전송된 크기를 기준으로 제한함.
+                    # 이미 읽힌 응답(MockTransport 등)은 전송된 크기를 알 수 없으니 청크의 크기를 사용함.
+                    if downloaded := response.num_bytes_downloaded:
+                        await limiter.consume(downloaded - metered)
+                        metered = downloaded
+                    else:
+                        await limiter.consume(len(chunk))
+            return response.headers, b"".join(chunks)
+        finally:
+            await response.aclose()
+
+    async def _fetch_image(self, url: str) -> tuple[httpx.Headers, bytes]:
+        """이미지를 받습니다. hedge_policy가 설정되어 있다면 첫 바이트가 늦어질 때 요청을 한 번 더 보냅니다."""
+        if self.hedge_policy is None:
+            return await self._fetch_content(url)
+        return await self.hedge_policy.fetch(functools.partial(self._fetch_content, url), description=url)
+
     async def _download_image(self, url: str, directory: Path, name: str, episode_no: int | None = None) -> Path | None:
         try:
-            response = await self.client.get(url)
-            # if not response.is_success:
-            #     msg = f"Failed to fetch an image {name!r}. The image won't be downloaded. (HTTP {response.status_code}): {url}"
-            #     raise HTTPStatusError(msg, request=None, response=response)  # type: ignore
-            image_raw: bytes = response.content
-            file_extension = infer_filetype(response.headers.get("content-type"), image_raw)
+            async with self.request_limiter:
+                with self._phase("image_transfer"):
+                    headers, image_raw = await self._fetch_image(url)
+            file_extension = infer_filetype(headers.get("content-type"), image_raw)
             # 이 내용은 다른 내가 손으로 옮긴 코드에는 없음!!
             # image_raw가 null로만 채워져 있을 경우 재시작
             if image_raw.startswith(b"\0" * min(100, len(image_raw))) and not image_raw.lstrip(b'\0'):
                 logger.warning("received emtpy bytes. retrying...")
                 return await self._download_image(url, directory, name, episode_no)
             image_path = directory / self._safe_name(f"{name}.{file_extension}")
-            image_path.write_bytes(image_raw)
+            with self._phase("disk_write"):
+                image_path.write_bytes(image_raw)
+            add_downloaded_file(len(image_raw))
             return image_path
         except Exception as exc:
             exc.add_note(f"Exception occurred when downloading image from {url!r}")
             raise
 
+    async def _download_side_asset(self, url: str, path: Path, episode_no: int) -> Path | None:
+        """에피소드의 부속 파일을 다운로드합니다.
+
+        부속 파일의 다운로드가 실패하더라도 에피소드 다운로드는 실패로 처리되지 않으며, 실패한 경우 None을 반환합니다.
+        """
+        if path.exists() or self.directory_manager._snapshot_contents_info(path) is not None:
+            return path
+        temp_path = path.with_name(f"._{path.name}.tmp")
+        try:
+            async with self.request_limiter:
+                with self._phase("side_asset_transfer"):
+                    _, content = await self._fetch_content(url)
+            with self._phase("disk_write"):
+                temp_path.write_bytes(content)
+                os.replace(temp_path, path)
+            add_downloaded_file(len(content))
+        except Exception as exc:
+            temp_path.unlink(missing_ok=True)
+            await self.callbacks.async_callback(
+                "side_asset_failed",
+                self.callbacks.create(
+                    "[{episode_no1}/{total_ep}] Failed to download {asset_name!r}. The episode will be downloaded without it. {exc_name}: {exc}",
+                    level="warning",
+                ),
+                episode_no=episode_no,
+                episode_no1=episode_no + 1,
+                total_ep=len(self.episode_ids),
+                asset_name=path.name,
+                url=url,
+                exc_name=type(exc).__name__,
+                exc=str(exc),
+            )
+            return None
+        return path
+
     def _prepare_directory(self) -> Path:
         webtoon_directory_name = self.get_webtoon_directory_name()
         webtoon_directory = Path(self.base_directory, webtoon_directory_name)
         webtoon_directory.mkdir(parents=True, exist_ok=True)
+        if self.lease_manager is not None:
+            lease_path = webtoon_directory / WEBTOON_LEASE_NAME
+            if (lease := self.lease_manager.try_acquire(lease_path)) is None:
+                raise LeaseHeldError.from_lease(lease_path)
+            self._webtoon_lease = lease
         return webtoon_directory
 
+    def _release_webtoon_lease(self) -> None:
+        if self._webtoon_lease is not None and self.lease_manager is not None:
+            self.lease_manager.release(self._webtoon_lease)
+        self._webtoon_lease = None
+
+    def _release_episode_lease(self, episode_no: int) -> None:
+        if (lease := self._episode_leases.pop(episode_no, None)) is not None and self.lease_manager is not None:
+            self.lease_manager.release(lease)
+
     def _post_process_directory(self, webtoon_directory: Path) -> Path:
         """모아서 보기나 information.json, webtoon.html 등이 위치할 디렉토리를 재안내합니다.
 
@@ -951,6 +1410,9 @@ class WebtoonDirectory:
     이 클래스는 웹툰 디렉토리의 생성, 정보 불러오기, 스냅샷 관리 등을 담당합니다.
     """
 
+    ARCHIVE_EXTENSIONS: typing.ClassVar[tuple[str, ...]] = ("cbz", "epub")
+    """에피소드 디렉토리 대신 `에피소드 디렉토리 이름.cbz`와 같은 아카이브가 있다면 이미 다운로드된 것으로 간주합니다."""
+
     def __init__(self, webtoon_directory: Path, ignore_snapshot: bool = False) -> None:
         self.webtoon_directory = webtoon_directory
         self.ignore_snapshot = ignore_snapshot
@@ -1002,7 +1464,7 @@ class WebtoonDirectory:
 
         snapshot_path = webtoon_directory.parent / f"{webtoon_directory.name}.snapshots"
         try:
-            self._snapshot_data = json.loads(snapshot_path.read_text("utf-8"))
+            self._snapshot_data = json_codec.loads(snapshot_path.read_bytes())
         except Exception:
             self._snapshot_data = {}
 
@@ -1067,6 +1529,21 @@ class WebtoonDirectory:
         elif is_file_exists_in_snapshot:
             return await scraper._episode_skipped("skipped_by_snapshot", "because of existing file in the snapshot", **context)
 
+        # 다운로드 도중 아카이브로 내보내진 에피소드인지 확인
+        for extension in self.ARCHIVE_EXTENSIONS:
+            archive = episode_directory.with_name(f"{directory_name}.{extension}")
+            if archive.is_file():
+                return await scraper._episode_skipped("already_exist", "because of existing archive", **context)
+            if self._snapshot_contents_info(archive) == "file":
+                return await scraper._episode_skipped("skipped_by_snapshot", "because of existing archive in the snapshot", **context)
+
+        # 다른 작업자가 같은 디렉토리에 동시에 다운로드하지 않도록 디렉토리를 확인하기 전에 lease를 얻음
+        if scraper.lease_manager is not None:
+            lease = scraper.lease_manager.try_acquire(self.webtoon_directory / f".{directory_name}.lease")
+            if lease is None:
+                return await scraper._episode_skipped("skipped_by_lease", "because another worker is downloading it", **context)
+            scraper._episode_leases[episode_no] = lease
+
         # 디렉토리가 존재하고 비어있지 않는지 확인
         if episode_at_snapshot == "directory" and self._get_snapshot_contents(episode_directory):
             if scraper.existing_episode_policy == "raise":
@@ -1089,9 +1566,13 @@ class WebtoonDirectory:
         await scraper.callbacks.async_callback("downloading", scraper.callbacks.create(progress_update="downloading {short_ep_title}"), **context)
 
         # fetch image urls
-        time.sleep(scraper.download_interval)  # 실질적인 외부 요청을 보내기 직전에만 interval을 넣음.
+        # 실질적인 외부 요청을 보내기 직전에만 interval을 넣음.
+        # 다운로드와 동시에 진행되는 작업들이 멈추지 않도록 time.sleep 대신 asyncio.sleep을 사용함.
+        with scraper._phase("download_interval"):
+            await asyncio.sleep(scraper.download_interval)
         try:
-            image_urls = await scraper.get_episode_image_urls(episode_no)
+            with scraper._phase("episode_page"):
+                image_urls = await scraper.get_episode_image_urls(episode_no)
         # 기본적으로 get_episode_image_urls는 실패해서는 안 된다.
         # 그런 상황이 있을 경우 warning을 내부적으로 내보내며 None을 리턴해야 한다.
         # 따라서 다른 경우들과 달리 raise를 하는 것이다.
@@ -1105,6 +1586,7 @@ class WebtoonDirectory:
             with suppress(Exception):
                 episode_directory.rmdir()
             scraper.download_status[episode_no] = "failed"
+            scraper._record_episode_stats(episode_no, context)
             await scraper.callbacks.async_callback(
                 "download_failed",
                 scraper.callbacks.create(
@@ -1131,19 +1613,3 @@ class WebtoonDirectory:
             episode_directory.mkdir()
 
         return episode_directory, image_urls
-
-
-class WebtoonInformation[Episode: EpisodeInformation = EpisodeInformation]:
-    title: str
-    episodes: list[Episode | None]
-    thumbnail: str
-    author: str
-    authors: list[str]
-    schema: int = 0  # schema version
-
-
-class EpisodeInformation:
-    title: str
-    status: str | None
-    # id: Id
-    # urls: list[Url]
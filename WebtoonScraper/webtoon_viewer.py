@@ -0,0 +1,361 @@
+"""웹툰 디렉토리를 브라우저로 볼 수 있도록 정적인 `webtoon.html` 뷰어를 만듭니다.
+
+뷰어는 웹툰 디렉토리의 `webtoon.html`(페이지가 나뉜 에피소드 목록)과
+`_viewer/` 디렉토리(에피소드별 페이지, 썸네일, 매니페스트)로 구성됩니다.
+`_`로 시작하는 디렉토리는 파일로 취급되기 때문에 웹툰 디렉토리는 그대로 인식됩니다.
+
+이미지의 크기는 이미지 헤더만 읽어 구하고 `<img>`의 width와 height로 지정하기 때문에
+이미지가 늦게 불러와지더라도(`loading="lazy"`) 페이지가 다시 배치되지 않습니다.
+뷰어를 다시 만들 때는 매니페스트에 없거나 바뀐 에피소드만 다시 읽고 페이지를 만듭니다.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import html
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
+
+from PIL import Image
+
+from .base import logger
+from .directory_state import DirectoryState, _directories_and_files_of, load_information_json
+from .processing import episode_images
+
+if TYPE_CHECKING:
+    from .scrapers import Scraper
+
+VIEWER_DIRECTORY_NAME = "_viewer"
+MANIFEST_VERSION = 1
+THUMBNAIL_SIZE = (240, 240)
+EPISODES_PER_PAGE = 50
+
+_INDEX_TEMPLATE = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<style>
+body {{ max-width: 960px; margin: 0 auto; padding: 16px; font-family: sans-serif; }}
+ol {{ list-style: none; padding: 0; display: grid; grid-template-columns: repeat(auto-fill, minmax(240px, 1fr)); gap: 12px; }}
+li a {{ display: block; color: inherit; text-decoration: none; }}
+li img {{ display: block; width: 100%; height: auto; background: #eee; }}
+nav {{ display: flex; flex-wrap: wrap; gap: 4px; margin: 16px 0; }}
+nav button[disabled] {{ font-weight: bold; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+<p>{author}</p>
+<nav id="top-pages"></nav>
+<ol id="episodes"></ol>
+<nav id="bottom-pages"></nav>
+<script src="{viewer}/episodes.js"></script>
+<script>
+const PER_PAGE = {per_page};
+function render(page) {{
+  const list = document.getElementById("episodes");
+  list.replaceChildren();
+  for (const episode of EPISODES.slice(page * PER_PAGE, (page + 1) * PER_PAGE)) {{
+    const item = document.createElement("li");
+    const link = document.createElement("a");
+    link.href = "{viewer}/episodes/" + episode.page;
+    if (episode.thumbnail) {{
+      const image = document.createElement("img");
+      image.src = "{viewer}/" + episode.thumbnail;
+      image.width = episode.thumbnail_size[0];
+      image.height = episode.thumbnail_size[1];
+      image.loading = "lazy";
+      image.alt = "";
+      link.append(image);
+    }}
+    link.append(episode.no + ". " + episode.title);
+    item.append(link);
+    list.append(item);
+  }}
+  for (const id of ["top-pages", "bottom-pages"]) {{
+    const nav = document.getElementById(id);
+    nav.replaceChildren();
+    for (let i = 0; i < Math.ceil(EPISODES.length / PER_PAGE); i++) {{
+      const button = document.createElement("button");
+      button.textContent = i + 1;
+      button.disabled = i === page;
+      button.onclick = () => {{ location.hash = i + 1; }};
+      nav.append(button);
+    }}
+  }}
+}}
+const currentPage = () => Math.max(0, (parseInt(location.hash.slice(1)) || 1) - 1);
+window.onhashchange = () => render(currentPage());
+render(currentPage());
+</script>
+</body>
+</html>
+"""
+
+_EPISODE_TEMPLATE = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>{title}</title>
+<style>
+body {{ max-width: {width}px; margin: 0 auto; padding: 0; font-family: sans-serif; }}
+main img {{ display: block; width: 100%; height: auto; }}
+nav {{ display: flex; justify-content: space-between; padding: 16px; }}
+</style>
+</head>
+<body>
+<nav><a class="previous">Previous</a><a href="../../webtoon.html">List</a><a class="next">Next</a></nav>
+<h1>{title}</h1>
+<main>
+{images}
+</main>
+<nav><a class="previous">Previous</a><a href="../../webtoon.html">List</a><a class="next">Next</a></nav>
+<script src="../episodes.js"></script>
+<script>
+const index = EPISODES.findIndex(episode => episode.page === {page});
+for (const [name, offset] of [["previous", -1], ["next", 1]]) {{
+  const episode = EPISODES[index + offset];
+  for (const link of document.getElementsByClassName(name)) {{
+    if (episode) link.href = episode.page; else link.remove();
+  }}
+}}
+</script>
+</body>
+</html>
+"""
+
+
+def read_image_sizes(images: list[Path]) -> list[list]:
+    """이미지 헤더만 읽어 `[이름, 폭, 높이]`의 목록을 반환합니다. 이미지 전체를 디코딩하지 않습니다."""
+    sizes = []
+    for image_path in images:
+        try:
+            with Image.open(image_path) as image:
+                sizes.append([image_path.name, image.width, image.height])
+        except Exception as exc:
+            logger.warning(f"Failed to read size of {image_path}. {type(exc).__name__}: {exc}")
+    return sizes
+
+
+def make_thumbnail(image_path: Path | str, thumbnail_path: Path | str) -> tuple[int, int]:
+    """에피소드의 첫 이미지로 작은 미리보기를 만들고 그 크기를 반환합니다. 프로세스 풀에서 실행됩니다."""
+    thumbnail_path = Path(thumbnail_path)
+    with Image.open(image_path) as image:
+        # JPEG은 draft를 이용해 축소된 상태로 디코딩할 수 있음
+        image.draft("RGB", THUMBNAIL_SIZE)
+        image = image.convert("RGB")
+        # 세로로 긴 이미지는 윗부분만 사용
+        image = image.crop((0, 0, image.width, min(image.height, image.width)))
+        image.thumbnail(THUMBNAIL_SIZE)
+        temp_path = thumbnail_path.with_name(f"._{thumbnail_path.name}.tmp")
+        image.save(temp_path, format="JPEG", quality=80)
+        os.replace(temp_path, thumbnail_path)
+        return image.size
+
+
+def _episode_number_and_title(directory_name: str) -> tuple[int | None, str]:
+    matched = DirectoryState.EpisodeDirectory(is_merged=False).pattern(tolerant=True).match(directory_name)
+    if matched is None:
+        return None, directory_name
+    return int(matched["episode_no"]), matched["episode_name"]
+
+
+def _load_manifest(viewer_directory: Path) -> dict:
+    try:
+        manifest = json.loads((viewer_directory / "manifest.json").read_text("utf-8"))
+    except Exception:
+        return {"version": MANIFEST_VERSION, "episodes": {}}
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {"version": MANIFEST_VERSION, "episodes": {}}
+    return manifest
+
+
+def _write_text_atomic(path: Path, text: str) -> None:
+    temp_path = path.with_name(f"._{path.name}.tmp")
+    temp_path.write_text(text, "utf-8")
+    os.replace(temp_path, path)
+
+
+def build_viewer(
+    webtoon_directory: Path | str,
+    *,
+    thumbnails: bool = True,
+    max_workers: int | None = None,
+    known_sizes: dict[str, list[list]] | None = None,
+    html_directory: Path | str | None = None,
+    rebuild: bool = False,
+) -> Path:
+    """웹툰 디렉토리의 뷰어를 만들거나 갱신하고 `webtoon.html`의 경로를 반환합니다.
+
+    Args:
+        webtoon_directory: 웹툰 디렉토리입니다.
+        thumbnails: 에피소드 목록에 표시할 미리보기를 만들지 결정합니다. 미리보기는 프로세스 풀에서 만들어집니다.
+        max_workers: 미리보기를 만들 때 사용할 프로세스의 개수입니다.
+        known_sizes: 에피소드 디렉토리 이름을 키로 하는 이미지 크기 정보입니다.
+            다운로드하는 동안 미리 구해둔 값이 있고 파일 이름이 현재 이미지와 일치한다면 이미지 헤더를 다시 읽지 않습니다.
+        html_directory: `webtoon.html`과 `_viewer/`가 위치할 디렉토리입니다. 기본값은 웹툰 디렉토리입니다.
+        rebuild: True라면 매니페스트를 무시하고 모든 에피소드를 다시 처리합니다.
+    """
+    webtoon_directory = Path(webtoon_directory)
+    html_directory = Path(html_directory) if html_directory else webtoon_directory
+    viewer_directory = html_directory / VIEWER_DIRECTORY_NAME
+    (viewer_directory / "episodes").mkdir(parents=True, exist_ok=True)
+    if thumbnails:
+        (viewer_directory / "thumbnails").mkdir(exist_ok=True)
+
+    manifest = {"version": MANIFEST_VERSION, "episodes": {}} if rebuild else _load_manifest(viewer_directory)
+    old_entries: dict[str, dict] = manifest["episodes"]
+    information = load_information_json(webtoon_directory) or {}
+    titles = dict(zip(information.get("episode_dir_names") or (), information.get("episode_titles") or (), strict=False))
+    known_sizes = known_sizes or {}
+
+    entries: dict[str, dict] = {}
+    changed: list[str] = []
+    for episode_directory in _directories_and_files_of(webtoon_directory)[0]:
+        name = episode_directory.name
+        mtime = episode_directory.stat().st_mtime_ns
+        old_entry = old_entries.get(name)
+        if old_entry is not None and old_entry["mtime"] == mtime and (old_entry.get("thumbnail") or not thumbnails):
+            entries[name] = old_entry
+            continue
+
+        images = episode_images(episode_directory)
+        if not images:
+            continue
+        sizes = known_sizes.get(name)
+        # 크기를 구한 뒤 이미지가 변환되는 등 파일이 바뀌었다면 다시 읽음
+        if sizes is None or [size[0] for size in sizes] != [image.name for image in images]:
+            sizes = read_image_sizes(images)
+        no, title = _episode_number_and_title(name)
+        no = no if no is not None else len(entries) + 1
+        entries[name] = dict(
+            no=no,
+            title=titles.get(name) or title,
+            mtime=mtime,
+            page=f"{no:04d}.html",
+            images=sizes,
+            thumbnail=None,
+            thumbnail_size=None,
+        )
+        changed.append(name)
+
+    if thumbnails and changed:
+        with ProcessPoolExecutor(max_workers) as executor:
+            futures = {
+                name: executor.submit(
+                    make_thumbnail,
+                    webtoon_directory / name / entries[name]["images"][0][0],
+                    viewer_directory / "thumbnails" / f"{entries[name]['page'].removesuffix('.html')}.jpg",
+                )
+                for name in changed
+                if entries[name]["images"]
+            }
+            for name, future in futures.items():
+                try:
+                    thumbnail_size = future.result()
+                except Exception as exc:
+                    logger.warning(f"Failed to make thumbnail of {name!r}. {type(exc).__name__}: {exc}")
+                else:
+                    entries[name]["thumbnail"] = f"thumbnails/{entries[name]['page'].removesuffix('.html')}.jpg"
+                    entries[name]["thumbnail_size"] = list(thumbnail_size)
+
+    # 사라진 에피소드의 페이지와 미리보기를 정리함
+    for name, old_entry in old_entries.items():
+        if name not in entries:
+            (viewer_directory / "episodes" / old_entry["page"]).unlink(missing_ok=True)
+            if old_entry.get("thumbnail"):
+                (viewer_directory / old_entry["thumbnail"]).unlink(missing_ok=True)
+
+    relative_webtoon_directory = Path(os.path.relpath(webtoon_directory, viewer_directory / "episodes"))
+    for name in changed:
+        entry = entries[name]
+        image_tags = "\n".join(
+            f'<img src="{html.escape(quote((relative_webtoon_directory / name / image_name).as_posix()))}" '
+            f'width="{width}" height="{height}" loading="lazy" decoding="async" alt="">'
+            for image_name, width, height in entry["images"]
+        )
+        _write_text_atomic(
+            viewer_directory / "episodes" / entry["page"],
+            _EPISODE_TEMPLATE.format(
+                title=html.escape(f"{entry['no']}. {entry['title']}"),
+                width=max((width for _, width, _ in entry["images"]), default=960),
+                images=image_tags,
+                page=json.dumps(entry["page"]),
+            ),
+        )
+
+    ordered = sorted(entries.values(), key=lambda entry: entry["no"])
+    episodes = [
+        dict(no=entry["no"], title=entry["title"], page=entry["page"], thumbnail=entry["thumbnail"], thumbnail_size=entry["thumbnail_size"])
+        for entry in ordered
+    ]
+    _write_text_atomic(viewer_directory / "episodes.js", f"const EPISODES = {json.dumps(episodes, ensure_ascii=False)};\n")
+    _write_text_atomic(viewer_directory / "manifest.json", json.dumps(dict(version=MANIFEST_VERSION, episodes=entries), ensure_ascii=False))
+
+    title = information.get("title") or webtoon_directory.name
+    index_path = html_directory / "webtoon.html"
+    _write_text_atomic(
+        index_path,
+        _INDEX_TEMPLATE.format(
+            title=html.escape(title),
+            author=html.escape(information.get("author") or ""),
+            viewer=VIEWER_DIRECTORY_NAME,
+            per_page=EPISODES_PER_PAGE,
+        ),
+    )
+    logger.debug(f"Viewer of {title!r} is built with {len(changed)} new episode(s).")
+    return index_path
+
+
+class WebtoonViewerBuilder:
+    """다운로드하는 동안 이미지 크기를 기록하고 다운로드가 끝나면 뷰어를 갱신하는 훅입니다.
+
+    이미지의 크기는 에피소드가 다운로드될 때마다 이미지 헤더만 읽어 구하므로 뷰어를 만들 때 다시 읽지 않습니다.
+
+    Example:
+        ```python
+        scraper = NaverWebtoonScraper(819217)
+        WebtoonViewerBuilder().register(scraper)
+        scraper.download_webtoon()
+        ```
+    """
+
+    def __init__(self, *, thumbnails: bool = True, max_workers: int | None = None) -> None:
+        self.thumbnails = thumbnails
+        self.max_workers = max_workers
+        self.image_sizes: dict[str, list[list]] = {}
+
+    def register(self, scraper: Scraper) -> None:
+        scraper.callbacks.register("download_completed", self.episode_downloaded)
+        scraper.callbacks.register_async("download_ended", self.download_ended)
+
+    def unregister(self, scraper: Scraper) -> None:
+        scraper.callbacks.remove("download_completed", self.episode_downloaded)
+        scraper.callbacks.remove("download_ended", self.download_ended)
+
+    def episode_downloaded(self, scraper: Scraper, episode_no: int, **context: Any) -> None:
+        directory_name = scraper.episode_dir_names[episode_no]
+        if directory_name is not None:
+            episode_directory = scraper.directory_manager.webtoon_directory / directory_name
+            self.image_sizes[directory_name] = read_image_sizes(episode_images(episode_directory))
+
+    async def download_ended(self, scraper: Scraper, finishing: bool, **context: Any) -> None:
+        if not finishing:
+            return
+        webtoon_directory = scraper.directory_manager.webtoon_directory
+        await asyncio.to_thread(
+            build_viewer,
+            webtoon_directory,
+            thumbnails=self.thumbnails,
+            max_workers=self.max_workers,
+            known_sizes=self.image_sizes,
+            html_directory=scraper._post_process_directory(webtoon_directory),
+        )
+        self.image_sizes = {}
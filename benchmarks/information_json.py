@@ -0,0 +1,98 @@
+"""웹툰 라이브러리 전체의 information.json을 읽고 쓰는 비용을 JSON 백엔드별로 측정하는 벤치마크.
+
+사용법:
+    python benchmarks/information_json.py [--webtoons N] [--episodes N] [--repeat N]
+
+한글 제목과 `raw_articles` 등을 포함한 합성 information.json을 웹툰 수만큼 만든 뒤,
+설치된 백엔드(orjson, msgspec, json)마다 다음을 측정합니다.
+
+* dump: `save_information_json`으로 모든 웹툰의 정보를 저장하는 시간
+* load: `load_information_json`으로 모든 웹툰의 `episode_ids`와 `download_status`를 읽는 시간
+* load legacy: extra가 information.json 안에 함께 들어 있는 예전 형식을 읽는 시간
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from WebtoonScraper import json_codec
+from WebtoonScraper.directory_state import load_information_json, save_information_json
+
+
+def _information(webtoon_id: int, episodes: int) -> dict:
+    articles = [dict(no=no, subtitle=f"{no}화 - 어느 날 갑자기 벌어진 일", charge=no > episodes - 3, starScore=9.9, thumbnailUrl=f"https://example.com/{webtoon_id}/{no}.jpg") for no in range(1, episodes + 1)]
+    return dict(
+        agent="python",
+        version="benchmark",
+        title=f"벤치마크 웹툰 {webtoon_id}",
+        author="작가",
+        platform="naver_webtoon",
+        episode_ids=list(range(1, episodes + 1)),
+        episode_titles=[article["subtitle"] for article in articles],
+        download_status=["downloaded"] * (episodes - 3) + ["skipped_by_skip_download"] * 3,
+        episode_dir_names=[f"{no:04d}. {article['subtitle']}" for no, article in enumerate(articles, 1)],
+        author_comments={str(no): "작가의 말입니다. " * 5 for no in range(1, episodes + 1)},
+        extra=dict(raw_articles=articles, raw_webtoon_info=dict(titleName=f"벤치마크 웹툰 {webtoon_id}", synopsis="줄거리 " * 50)),
+    )
+
+
+def _measure(function, repeat: int) -> float:
+    return min(_timed(function) for _ in range(repeat))
+
+
+def _timed(function) -> float:
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--webtoons", type=int, default=3000)
+    parser.add_argument("--episodes", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temp:
+        root = Path(temp)
+        informations = [_information(webtoon_id, args.episodes) for webtoon_id in range(args.webtoons)]
+        directories = [root / "split" / str(webtoon_id) for webtoon_id in range(args.webtoons)]
+        legacy_directories = [root / "legacy" / str(webtoon_id) for webtoon_id in range(args.webtoons)]
+        for directory, legacy_directory, information in zip(directories, legacy_directories, informations, strict=True):
+            directory.mkdir(parents=True)
+            legacy_directory.mkdir(parents=True)
+            (legacy_directory / "information.json").write_text(json.dumps(information, ensure_ascii=False), "utf-8")
+        size = sum(len((directory / "information.json").read_bytes()) for directory in legacy_directories)
+        print(f"{args.webtoons} webtoons, {args.episodes} episodes each, {size / 1024 / 1024:.1f} MB of legacy information.json")
+
+        def dump() -> None:
+            for directory, information in zip(directories, informations, strict=True):
+                save_information_json(directory, information)
+
+        def load(directories: list[Path]) -> None:
+            for directory in directories:
+                information = load_information_json(directory)
+                assert information is not None
+                information["episode_ids"], information["download_status"]
+
+        for backend in json_codec.BACKENDS:
+            try:
+                json_codec.set_backend(backend)
+            except ImportError:
+                print(f"{backend:>8}: not installed")
+                continue
+            dump_time = _measure(dump, args.repeat)
+            load_time = _measure(lambda: load(directories), args.repeat)
+            legacy_time = _measure(lambda: load(legacy_directories), args.repeat)
+            print(
+                f"{backend:>8}: dump {dump_time:.3f}s, load {load_time:.3f}s ({load_time / args.webtoons * 1e6:.0f} µs/webtoon), "
+                f"load legacy {legacy_time:.3f}s ({legacy_time / args.webtoons * 1e6:.0f} µs/webtoon)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""네이버 웹툰을 흉내내는 로컬 HTTP 서버.
+
+`NaverWebtoonScraper`가 사용하는 엔드포인트들을 합성 데이터로 응답합니다.
+
+* `/api/article/list/info`: 웹툰 정보
+* `/api/article/list`: 에피소드 목록 (페이지당 20개)
+* `/webtoon/detail`: 에피소드 페이지 HTML
+* `/image/...`, `/audio/...`: 이미지와 배경음악
+
+서버는 별도의 프로세스에서 실행되기 때문에 스크래퍼를 측정할 때 서버의 CPU 사용량이나 메모리가 섞이지 않습니다.
+스크래퍼는 `use_mock_server`로 모든 요청을 이 서버로 돌릴 수 있습니다.
+
+단독으로 실행할 수도 있습니다.
+    python benchmarks/mock_naver.py [--port N] [--episodes N] [--images N] [--image-size BYTES] [--latency SECONDS] [--bandwidth BYTES_PER_SECOND]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import random
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import httpc
+import httpx
+
+ARTICLES_PER_PAGE = 20
+_JPEG_HEADER = b"\xff\xd8\xff\xe0\x00\x10JFIF\x00"
+_MP3_HEADER = b"ID3\x04\x00\x00\x00\x00\x00\x00"
+
+
+@dataclass
+class MockNaverConfig:
+    episodes: int = 50
+    """웹툰당 에피소드 수입니다."""
+    images: int = 30
+    """에피소드당 이미지 수입니다."""
+    image_size: int = 200_000
+    """이미지 하나의 크기(바이트)입니다."""
+    audio_size: int = 0
+    """배경음악의 크기(바이트)입니다. 0이면 에피소드에 배경음악이 없습니다."""
+    latency: float = 0.0
+    """응답을 보내기 전에 기다리는 시간(초)입니다."""
+    bandwidth: float | None = None
+    """응답 하나를 보내는 속도(바이트/초)입니다. None이면 제한하지 않습니다."""
+    script_size: int = 100_000
+    """에피소드 페이지에 들어가는 스크립트의 크기입니다. 실제 페이지의 파싱 비용을 흉내냅니다."""
+
+
+def _payload(header: bytes, size: int) -> bytes:
+    # 0으로만 채워진 이미지는 스크래퍼가 다시 받으려 하기 때문에 무작위 바이트를 사용함
+    return (header + random.Random(size).randbytes(max(size - len(header), 0)))[:size]
+
+
+class _MockNaverHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _MockNaverServer
+
+    def do_GET(self) -> None:
+        config = self.server.config
+        url = urlsplit(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        if config.latency:
+            time.sleep(config.latency)
+
+        match url.path.split("/")[1:]:
+            case ["api", "article", "list", "info"]:
+                title_id = int(query["titleId"])
+                self._send_json(dict(
+                    sharedThumbnailUrl=f"https://image-comic.pstatic.net/image/{title_id}/thumbnail.jpg",
+                    titleName=f"mock webtoon {title_id}",
+                    communityArtists=[dict(name="mock author")],
+                    webtoonLevelCode="WEBTOON",
+                    synopsis="synthetic webtoon for benchmarks",
+                    age=dict(type="RATE_12"),
+                ))
+            case ["api", "article", "list"]:
+                # 실제 API처럼 마지막 페이지를 넘어가면 마지막 페이지를 다시 보냄
+                page = int(query["page"])
+                last_page = max((config.episodes - 1) // ARTICLES_PER_PAGE + 1, 1)
+                start = (min(page, last_page) - 1) * ARTICLES_PER_PAGE
+                numbers = range(start + 1, min(start + ARTICLES_PER_PAGE, config.episodes) + 1)
+                self._send_json(dict(articleList=[dict(no=no, subtitle=f"episode {no}", charge=False) for no in numbers]))
+            case [_, "detail"]:
+                self._send(self.server.episode_page(int(query["titleId"]), int(query["no"])), "text/html; charset=utf-8")
+            case ["image", *_]:
+                self._send(self.server.image, "image/jpeg")
+            case ["audio", *_]:
+                self._send(self.server.audio, "audio/mpeg")
+            case _:
+                self._send(b"not found", "text/plain", status=404)
+
+    def _send_json(self, data: dict) -> None:
+        self._send(json.dumps(data, ensure_ascii=False).encode(), "application/json")
+
+    def _send(self, body: bytes, content_type: str, status: int = 200) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        bandwidth = self.server.config.bandwidth
+        if not bandwidth:
+            self.wfile.write(body)
+            return
+        chunk_size = 16 * 1024
+        started_at = time.perf_counter()
+        for sent in range(0, len(body), chunk_size):
+            self.wfile.write(body[sent : sent + chunk_size])
+            # 보낸 양에 맞춰 기다려서 평균 속도를 bandwidth에 맞춤
+            if (delay := started_at + (sent + chunk_size) / bandwidth - time.perf_counter()) > 0:
+                time.sleep(delay)
+
+    def log_message(self, format: str, *args) -> None:
+        pass
+
+
+class _MockNaverServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], config: MockNaverConfig) -> None:
+        super().__init__(address, _MockNaverHandler)
+        self.config = config
+        self.image = _payload(_JPEG_HEADER, config.image_size)
+        self.audio = _payload(_MP3_HEADER, config.audio_size)
+        self.filler = "var data = " + json.dumps(["x" * 64] * (config.script_size // 70)) + ";\n"
+
+    def episode_page(self, title_id: int, no: int) -> bytes:
+        config = self.config
+        image_tags = "\n".join(
+            f'<img src="https://image-comic.pstatic.net/image/{title_id}/{no}/{index}.jpg" alt="comic content">'
+            for index in range(config.images)
+        )
+        audio = f'<audio id="bgmPlayer"><source src="https://comic.pstatic.net/audio/{title_id}/{no}.mp3"></audio>' if config.audio_size else ""
+        article = json.dumps(dict(no=no, subtitle=f"episode {no}", authorWords="작가의 말"), ensure_ascii=False, separators=(",", ":"))
+        return f"""<html><head><title>mock webtoon {title_id}</title></head><body>
+<div id="sectionContWide">{image_tags}</div>
+{audio}
+<script>{self.filler}window.__INITIAL = {{
+    article: {article},
+    currentIndex: 0,
+}};</script>
+</body></html>""".encode()
+
+
+def _serve(config: MockNaverConfig, port: int, connection) -> None:
+    with _MockNaverServer(("127.0.0.1", port), config) as server:
+        connection.send(server.server_port)
+        server.serve_forever()
+
+
+class MockNaverServer:
+    """별도의 프로세스에서 mock 서버를 실행합니다. with 문과 함께 사용하세요."""
+
+    def __init__(self, config: MockNaverConfig | None = None, port: int = 0) -> None:
+        self.config = config or MockNaverConfig()
+        self.port = port
+        self._process: multiprocessing.Process | None = None
+
+    def __enter__(self) -> MockNaverServer:
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        self._process = multiprocessing.Process(target=_serve, args=(self.config, self.port, sender), daemon=True)
+        self._process.start()
+        self.port = receiver.recv()
+        return self
+
+    def __exit__(self, *_) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+            self._process = None
+
+
+class MockNaverTransport(httpx.AsyncHTTPTransport):
+    """모든 요청을 로컬 mock 서버로 보내고, 보낸 요청의 수를 종류별로 셉니다.
+
+    URL만 바꾸고 Host 헤더는 그대로 두기 때문에 스크래퍼 입장에서는 실제 서버와 통신하는 것과 같습니다.
+    """
+
+    def __init__(self, port: int, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.port = port
+        self.request_counts: Counter[str] = Counter()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.startswith("/api/"):
+            kind = path.removeprefix("/api/")
+        elif path.endswith("/detail"):
+            kind = "detail"
+        else:
+            kind = path.split("/")[1]
+        self.request_counts[kind] += 1
+        request.url = request.url.copy_with(scheme="http", host="127.0.0.1", port=self.port)
+        return await super().handle_async_request(request)
+
+
+def use_mock_server(scraper, port: int) -> MockNaverTransport:
+    """스크래퍼의 클라이언트를 mock 서버와 통신하는 클라이언트로 바꿉니다. 요청 수는 반환된 transport에 기록됩니다."""
+    client = scraper.client
+    transport = MockNaverTransport(port)
+    scraper.client = httpc.AsyncClient(
+        transport=transport,
+        retry=client.retry,
+        raise_for_status=client.raise_for_status,
+        timeout=client.timeout,
+        follow_redirects=client.follow_redirects,
+        headers=client.headers,
+        cookies=client.cookies,
+        event_hooks=client.event_hooks,
+    )
+    return transport
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=8000)
+    for name, value in asdict(MockNaverConfig()).items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=type(value) if value is not None else float, default=value)
+    args = parser.parse_args()
+    config = MockNaverConfig(**{name: getattr(args, name) for name in asdict(MockNaverConfig())})
+    with _MockNaverServer(("127.0.0.1", args.port), config) as server:
+        print(f"Serving mock Naver Webtoon on http://127.0.0.1:{server.server_port}")
+        server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""네이버 웹툰 에피소드 페이지 추출 벤치마크.
+
+사용법:
+    python benchmarks/naver_episode_page.py [저장된 에피소드 페이지.html ...] [--repeat N] [--concurrency N]
+
+에피소드 페이지를 지정하지 않으면 실제 페이지와 비슷한 크기의 합성 페이지를 사용합니다.
+실제 페이지는 `https://comic.naver.com/webtoon/detail?titleId=...&no=...`를 브라우저에서 저장하면 됩니다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from httpc import ParseTool
+
+from WebtoonScraper.scrapers._naver_extraction import extract_episode_page
+
+IMAGE_SELECTOR = "#sectionContWide > img"
+
+
+def make_page(images: int = 80, script_size: int = 300_000) -> str:
+    image_tags = "\n".join(f'<img src="https://image-comic.pstatic.net/webtoon/1/1/{index}.jpg" alt="comic content">' for index in range(images))
+    article = json.dumps(dict(no=1, subtitle="제목", authorWords="작가의 말 " * 20), ensure_ascii=False, separators=(",", ":"))
+    filler = "var data = " + json.dumps(["x" * 64] * (script_size // 70)) + ";\n"
+    return f"""<html><head><title>webtoon</title></head><body>
+<div id="sectionContWide">{image_tags}</div>
+<audio id="bgmPlayer"><source src="https://example.com/bgm.mp3"></audio>
+<script>{filler}window.__INITIAL = {{
+    article: {article},
+    currentIndex: 0,
+}};</script>
+</body></html>"""
+
+
+def legacy_extract(html: str, image_selector: str):
+    """예전 `get_episode_image_urls`와 `_gather_author_comment`의 동작을 재현합니다."""
+    response = ParseTool(html)
+    script = response.single("body > script", remain_ok=True).text()
+    search_result = re.search(
+        r'article: *{"no":\d*,"subtitle":".+?","authorWords":(?P<author_comments_raw>.+?)},\s*currentIndex: *\d*,',
+        script,
+    )
+    assert search_result is not None
+    author_comment = json.loads(search_result.group("author_comments_raw"))
+    try:
+        audio_url = response.single("audio#bgmPlayer > source", remain_ok=True).attrs["src"]
+    except (ValueError, KeyError):
+        audio_url = None
+    image_urls = [element.attrs["src"] for element in response.match(image_selector)]
+    return image_urls, audio_url, author_comment
+
+
+def measure(function, pages: list[str], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for page in pages:
+            function(page, IMAGE_SELECTOR)
+    return (time.perf_counter() - start) / (repeat * len(pages))
+
+
+async def measure_loop(pages: list[str], concurrency: int, executor) -> tuple[float, float]:
+    """추출하는 동안 이벤트 루프가 최대 얼마나 멈췄는지와 전체 소요 시간을 측정합니다."""
+    loop = asyncio.get_running_loop()
+    max_lag = 0.0
+    running = True
+
+    async def ticker():
+        nonlocal max_lag
+        while running:
+            before = time.perf_counter()
+            await asyncio.sleep(0.001)
+            max_lag = max(max_lag, time.perf_counter() - before - 0.001)
+
+    async def extract(page: str):
+        if executor == "inline":
+            return extract_episode_page(page, IMAGE_SELECTOR)
+        return await loop.run_in_executor(executor, extract_episode_page, page, IMAGE_SELECTOR)
+
+    ticker_task = asyncio.create_task(ticker())
+    start = time.perf_counter()
+    await asyncio.gather(*(extract(pages[index % len(pages)]) for index in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    running = False
+    await ticker_task
+    return elapsed, max_lag
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("pages", nargs="*", type=Path)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    pages = [path.read_text("utf-8") for path in args.pages] or [make_page()]
+    assert legacy_extract(pages[0], IMAGE_SELECTOR)[2] == extract_episode_page(pages[0], IMAGE_SELECTOR).author_comment
+
+    print(f"pages: {len(pages)}, average size: {sum(map(len, pages)) // len(pages):,} chars")
+    print(f"legacy:    {measure(legacy_extract, pages, args.repeat) * 1000:8.2f} ms/page")
+    print(f"one pass:  {measure(extract_episode_page, pages, args.repeat) * 1000:8.2f} ms/page")
+
+    with ProcessPoolExecutor() as process_pool:
+        for name, executor in (("inline", "inline"), ("thread", None), ("process", process_pool)):
+            elapsed, max_lag = asyncio.run(measure_loop(pages, args.concurrency, executor))
+            print(f"{name:8} x{args.concurrency}: {elapsed * 1000:8.2f} ms total, event loop blocked up to {max_lag * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
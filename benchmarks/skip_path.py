@@ -0,0 +1,75 @@
+"""건너뛰는 에피소드를 처리하는 비용을 측정하는 벤치마크.
+
+사용법:
+    python benchmarks/skip_path.py [--episodes N] [--repeat N] [--progress-bar] [--debug]
+
+에피소드가 매우 많은 웹툰을 좁은 `--range`로 다운로드하는 상황을 재현합니다.
+범위 밖의 에피소드는 모두 skip 콜백을 거치게 되고, 범위 안의 에피소드는 실제로 다운로드하지 않습니다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+
+from WebtoonScraper.base import logger
+from WebtoonScraper.scrapers import EpisodeRange, Scraper
+
+
+class SkipBenchmarkScraper(Scraper[int]):
+    PLATFORM = "benchmark"
+
+    def __init__(self, episodes: int) -> None:
+        super().__init__(0)
+        self.episode_ids = list(range(episodes))
+        self.episode_titles = [f"에피소드 제목 {no}" for no in range(episodes)]
+
+    async def fetch_webtoon_information(self, *, reload: bool = False) -> None:
+        pass
+
+    async def fetch_episode_information(self, *, reload: bool = False) -> None:
+        pass
+
+    async def get_episode_image_urls(self, episode_no: int) -> list[str] | None:
+        return None
+
+    @classmethod
+    def _extract_webtoon_id(cls, url) -> int | None:
+        return None
+
+    async def _download_episode(self, episode_no: int, context: dict) -> None:
+        pass
+
+
+async def measure(episodes: int, repeat: int, progress_bar: bool) -> float:
+    scraper = SkipBenchmarkScraper(episodes)
+    scraper.use_progress_bar = progress_bar
+    scraper.download_range = EpisodeRange.from_string("1~10")  # type: ignore
+    start = time.perf_counter()
+    for _ in range(repeat):
+        await scraper._download_episodes()
+    return (time.perf_counter() - start) / repeat
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--episodes", type=int, default=3000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--progress-bar", action="store_true")
+    parser.add_argument("--debug", action="store_true", help="DEBUG 로그가 켜진 상황을 측정합니다. 출력은 버려집니다.")
+    args = parser.parse_args()
+
+    if args.debug:
+        logger.setLevel(logging.DEBUG)
+        for handler in logger.handlers:
+            logger.removeHandler(handler)
+        logger.addHandler(logging.NullHandler())
+
+    elapsed = asyncio.run(measure(args.episodes, args.repeat, args.progress_bar))
+    print(f"{args.episodes} episodes: {elapsed * 1000:.2f} ms per run, {elapsed / args.episodes * 1e6:.2f} µs per skipped episode")
+
+
+if __name__ == "__main__":
+    main()
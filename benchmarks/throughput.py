@@ -0,0 +1,160 @@
+"""로컬 mock 네이버 웹툰 서버를 상대로 전체 다운로드 처리량을 측정하는 벤치마크.
+
+사용법:
+    python benchmarks/throughput.py [--episodes N] [--images N] [--image-size BYTES] [--latency SECONDS] [--bandwidth BYTES_PER_SECOND]
+                                    [--webtoons N] [--output result.json] [--compare baseline.json]
+
+네트워크에 접속하지 않으며, 다음 두 시나리오를 측정합니다.
+
+* single: 웹툰 하나를 `async_download_webtoon`으로 다운로드합니다.
+* batch: 웹툰 여러 개를 CLI처럼 차례로 다운로드합니다.
+
+각 시나리오는 새 프로세스에서 실행되기 때문에 최대 메모리 사용량(peak RSS)이 시나리오별로 따로 측정됩니다.
+결과를 `--output`으로 저장해 두고 나중에 `--compare`로 비교하면 회귀를 확인할 수 있습니다.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import multiprocessing
+import platform
+import sys
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict
+from pathlib import Path
+
+from mock_naver import MockNaverConfig, MockNaverServer, use_mock_server
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# 값이 클수록 좋은 지표들. 나머지는 작을수록 좋음.
+HIGHER_IS_BETTER = {"episodes_per_second", "megabytes_per_second"}
+COMPARED_METRICS = ("elapsed", "episodes_per_second", "megabytes_per_second", "peak_rss_mb", "requests")
+
+
+def _peak_rss_mb() -> float | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트 단위, 리눅스는 KB 단위
+    return round(peak / 1024 / (1024 if sys.platform == "darwin" else 1), 1)
+
+
+async def _download(webtoon_ids: list[int], port: int, base_directory: Path, max_concurrent_requests: int) -> tuple[int, int, Counter]:
+    from WebtoonScraper.base import logger
+    from WebtoonScraper.scrapers import NaverWebtoonScraper
+
+    logger.setLevel(logging.WARNING)
+    episodes = downloaded_bytes = 0
+    request_counts: Counter[str] = Counter()
+    for webtoon_id in webtoon_ids:
+        scraper = NaverWebtoonScraper(webtoon_id)
+        transport = use_mock_server(scraper, port)
+        scraper.base_directory = base_directory
+        scraper.download_interval = 0
+        scraper.use_progress_bar = False
+        scraper.max_concurrent_requests = max_concurrent_requests
+        await scraper.async_download_webtoon()
+        await scraper.client.aclose()
+        episodes += len(scraper.download_stats)
+        downloaded_bytes += sum(stats["bytes"] for stats in scraper.download_stats.values())
+        request_counts += transport.request_counts
+    return episodes, downloaded_bytes, request_counts
+
+
+def run_scenario(webtoon_ids: list[int], port: int, max_concurrent_requests: int) -> dict:
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        episodes, downloaded_bytes, request_counts = asyncio.run(_download(webtoon_ids, port, Path(directory), max_concurrent_requests))
+        elapsed = time.perf_counter() - start
+    return dict(
+        webtoons=len(webtoon_ids),
+        episodes=episodes,
+        bytes=downloaded_bytes,
+        elapsed=round(elapsed, 3),
+        episodes_per_second=round(episodes / elapsed, 2),
+        megabytes_per_second=round(downloaded_bytes / elapsed / 1024 / 1024, 2),
+        peak_rss_mb=_peak_rss_mb(),
+        requests=sum(request_counts.values()),
+        requests_by_kind=dict(request_counts),
+    )
+
+
+def compare(result: dict, baseline: dict, threshold: float) -> bool:
+    """결과를 기준 결과와 비교해 출력하고, threshold보다 크게 나빠진 지표가 있으면 False를 반환합니다."""
+    passed = True
+    if result["config"] != baseline["config"]:
+        print(f"Warning: configurations differ. baseline: {baseline['config']}")
+    for scenario, metrics in result["results"].items():
+        if (base_metrics := baseline["results"].get(scenario)) is None:
+            continue
+        print(f"[{scenario}]")
+        for metric in COMPARED_METRICS:
+            current, base = metrics.get(metric), base_metrics.get(metric)
+            if not current or not base:
+                continue
+            change = current / base - 1
+            regressed = -change > threshold if metric in HIGHER_IS_BETTER else change > threshold
+            passed &= not regressed
+            print(f"  {metric:>22}: {base:>10} -> {current:>10} ({change:+.1%}){'  REGRESSED' if regressed else ''}")
+    return passed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--episodes", type=int, default=50)
+    parser.add_argument("--images", type=int, default=30)
+    parser.add_argument("--image-size", type=int, default=200_000)
+    parser.add_argument("--audio-size", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--bandwidth", type=float, default=None, help="응답 하나당 전송 속도(바이트/초)")
+    parser.add_argument("--webtoons", type=int, default=5, help="batch 시나리오에서 다운로드할 웹툰 수")
+    parser.add_argument("--max-concurrent-requests", type=int, default=10)
+    parser.add_argument("--output", type=Path, help="결과를 JSON으로 저장할 경로")
+    parser.add_argument("--compare", type=Path, help="비교할 이전 결과 JSON")
+    parser.add_argument("--threshold", type=float, default=0.1, help="회귀로 판단할 변화율 (기본값: 0.1)")
+    args = parser.parse_args()
+
+    config = MockNaverConfig(
+        episodes=args.episodes,
+        images=args.images,
+        image_size=args.image_size,
+        audio_size=args.audio_size,
+        latency=args.latency,
+        bandwidth=args.bandwidth,
+    )
+    scenarios = dict(single=[1], batch=list(range(1, args.webtoons + 1)))
+    results = {}
+    with MockNaverServer(config) as server:
+        for name, webtoon_ids in scenarios.items():
+            # 시나리오마다 새 프로세스를 사용해 peak RSS가 이전 시나리오의 영향을 받지 않도록 함
+            with ProcessPoolExecutor(1, mp_context=multiprocessing.get_context("spawn")) as executor:
+                results[name] = executor.submit(run_scenario, webtoon_ids, server.port, args.max_concurrent_requests).result()
+            print(
+                f"{name}: {results[name]['episodes']} episodes in {results[name]['elapsed']:.2f}s, "
+                f"{results[name]['episodes_per_second']} episodes/s, {results[name]['megabytes_per_second']} MB/s, "
+                f"peak RSS {results[name]['peak_rss_mb']} MB, {results[name]['requests']} requests"
+            )
+
+    result = dict(
+        config=asdict(config) | dict(webtoons=args.webtoons, max_concurrent_requests=args.max_concurrent_requests),
+        environment=dict(python=platform.python_version(), platform=platform.platform(), time=time.strftime("%Y-%m-%dT%H:%M:%S%z")),
+        results=results,
+    )
+    if args.output:
+        args.output.write_text(json.dumps(result, indent=2), "utf-8")
+    if args.compare and not compare(result, json.loads(args.compare.read_text("utf-8")), args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import asyncio
+
+import httpc
+import httpx
+
+from WebtoonScraper.adaptive import AdaptiveController, AdaptiveLimiter
+from WebtoonScraper.scrapers import NaverWebtoonScraper
+
+from .test_scrapers import _naver_site
+
+
+def test_limiter_aimd():
+    limiter = AdaptiveLimiter(4, minimum=1, maximum=6, window=10, cooldown=60)
+
+    # 대략 한도만큼 성공할 때마다 1씩 늘어남
+    adjustments = [limiter.on_success(0.1) for _ in range(5)]
+    assert [adjustment for adjustment in adjustments if adjustment] == [(4, 5, "healthy")]
+
+    # 실패하면 절반으로 줄고, cooldown 안의 실패는 무시됨
+    assert limiter.on_failure("status_429") == (5, 2, "status_429")
+    assert limiter.on_failure("timeout") is None
+    assert limiter.limit == 2
+
+    # 지연 시간이 기준보다 크게 늘어나도 줄어듦
+    limiter = AdaptiveLimiter(6, maximum=6, window=10)
+    for _ in range(10):
+        limiter.on_success(0.1)
+    for _ in range(9):
+        limiter.on_success(0.5)
+    assert limiter.on_success(0.5) == (6, 3, "latency")
+
+
+def test_limiter_gate():
+    async def run() -> int:
+        limiter = AdaptiveLimiter(2, maximum=2)
+        running = peak = 0
+
+        async def request() -> None:
+            nonlocal running, peak
+            async with limiter:
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(request() for _ in range(8)))
+        return peak
+
+    assert asyncio.run(run()) == 2
+
+
+def test_scraper_adaptive(tmp_path):
+    site = _naver_site(episodes=2, images=5)
+    failed_once: set[str] = set()
+    read_timeouts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        if request.url.path.endswith(".png"):
+            read_timeouts.append(request.extensions["timeout"]["read"])
+            if url not in failed_once:
+                failed_once.add(url)
+                return httpx.Response(503)
+        return site(request)
+
+    scraper = NaverWebtoonScraper(805702)
+    scraper.client = httpc.AsyncClient(transport=httpx.MockTransport(handler), retry=3, timeout=10, raise_for_status=True)
+    scraper.base_directory = tmp_path
+    scraper.download_interval = 0
+    scraper.use_progress_bar = False
+    controller = AdaptiveController(maximum=8, cooldown=0, timeout_samples=3)
+    controller.register(scraper)
+    adjustments = []
+    scraper.callbacks.register("concurrency_adjusted", lambda scraper, **context: adjustments.append((context["direction"], context["reason"])))
+
+    asyncio.run(scraper.async_download_webtoon())
+    assert scraper.download_status == ["downloaded", "downloaded"]
+    assert ("decrease", "status_503") in adjustments
+    assert scraper.request_limiter.limit >= 1
+    # 응답이 빠르니 최소 타임아웃이 적용됨
+    assert controller.host_timeouts["image-comic.pstatic.net"] == controller.min_timeout
+    assert read_timeouts[0] == 10 and read_timeouts[-1] == controller.min_timeout
+
+    controller.unregister(scraper)
+    assert scraper.concurrency_controller is None
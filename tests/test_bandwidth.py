@@ -0,0 +1,74 @@
+import asyncio
+import time
+from datetime import time as dt_time
+
+import httpc
+import httpx
+import pytest
+
+from WebtoonScraper.bandwidth import BandwidthLimiter, parse_bandwidth, parse_bandwidth_schedule
+from WebtoonScraper.scrapers import NaverWebtoonScraper
+
+from .test_scrapers import PNG, _naver_site
+
+
+def test_parse_bandwidth():
+    assert parse_bandwidth("500K") == 500_000
+    assert parse_bandwidth("1.5MiB/s") == 1.5 * 1024**2
+    assert parse_bandwidth("unlimited") is None
+    with pytest.raises(ValueError):
+        parse_bandwidth("fast")
+    assert parse_bandwidth_schedule("2M") == (2_000_000, None)
+    assert parse_bandwidth_schedule("22:00-06:00=unlimited,09:00-18:00=500K,1M") == (
+        1_000_000,
+        [(dt_time(22), dt_time(6), None), (dt_time(9), dt_time(18), 500_000)],
+    )
+
+
+def test_limiter_rate():
+    async def transfer(limiter: BandwidthLimiter, total: int) -> None:
+        for _ in range(total // 10_000):
+            await limiter.consume(10_000)
+
+    async def measure(limiter: BandwidthLimiter) -> float:
+        start = time.perf_counter()
+        # 여러 스트림이 하나의 제한을 공유함
+        await asyncio.gather(*(transfer(limiter, 100_000) for _ in range(3)))
+        return time.perf_counter() - start
+
+    limiter = BandwidthLimiter(1_000_000, burst=20_000)
+    assert 0.25 <= asyncio.run(measure(limiter)) < 0.6
+
+    # 제한은 실행 중에도 바꿀 수 있음
+    limiter.rate = None
+    assert asyncio.run(measure(limiter)) < 0.05
+
+
+def test_scraper_bandwidth(tmp_path):
+    scraper = NaverWebtoonScraper(805702)
+    scraper.client = httpc.AsyncClient(transport=httpx.MockTransport(_naver_site(episodes=2, images=3)), raise_for_status=True)
+    scraper.base_directory = tmp_path
+    scraper.download_interval = 0
+    scraper.use_progress_bar = False
+    scraper.bandwidth_limiter = BandwidthLimiter(len(PNG) * 14, burst=len(PNG))
+
+    start = time.perf_counter()
+    asyncio.run(scraper.async_download_webtoon())
+    # 썸네일과 이미지 여섯 개 중 첫 번째는 burst로 바로 받음
+    assert time.perf_counter() - start >= 6 / 14 * 0.9
+    assert scraper.download_status == ["downloaded", "downloaded"]
+
+
+def test_cli_restores_bandwidth_limiter(monkeypatch):
+    from WebtoonScraper import __main__ as cli
+    from WebtoonScraper.scrapers import Scraper
+
+    used = []
+
+    async def download_webtoons(*_) -> None:
+        used.append(Scraper.bandwidth_limiter)
+
+    monkeypatch.setattr(cli, "_download_webtoons", download_webtoons)
+    asyncio.run(cli.parse_download(cli._parse_args(["download", "805702", "--max-bandwidth", "1M"])))
+    assert isinstance(used[0], BandwidthLimiter)
+    assert Scraper.bandwidth_limiter is None
@@ -58,3 +58,23 @@ def test_opaque_container():
     assert 10 in e
     assert 34 in e
     assert 100 not in e
+
+    e.add_not_opaque_container({34})
+    assert 34 not in e
+    assert 36 in e
+
+
+def test_iter_selected():
+    e = EpisodeRange.from_string("~3,7,10~,!12~18,16")
+    assert list(e.iter_selected(20)) == [1, 2, 3, 7, 10, 11, 16, 19, 20]
+    assert list(e.iter_selected(5)) == [1, 2, 3]
+
+    # 범위를 추가하면 다시 계산됨
+    e.add_not(2)
+    e.add(slice(4, 6))
+    assert list(e.iter_selected(8)) == [1, 3, 4, 5, 7]
+
+    # 간격이 있는 slice와 opaque container도 같은 결과를 냄
+    e.add(slice(30, None, 5))
+    assert list(e.iter_selected(40)) == [1, 3, 4, 5, 7, 10, 11, 16, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32, 33, 34, 35, 36, 37, 38, 39, 40]
+    assert list(EpisodeRange.all().iter_selected(3)) == [1, 2, 3]
@@ -0,0 +1,100 @@
+import asyncio
+import io
+import json
+import zipfile
+from pathlib import Path
+
+import httpc
+import httpx
+from PIL import Image
+
+from WebtoonScraper.export import ArchiveExporter, export_episode, export_webtoon
+from WebtoonScraper.processing import ImageTranscoder
+from WebtoonScraper.scrapers import NaverWebtoonScraper
+
+from .test_scrapers import _naver_site
+
+
+def _make_webtoon(webtoon: Path) -> Path:
+    for directory_name in ("0001. first", "0002. second"):
+        episode = webtoon / directory_name
+        episode.mkdir(parents=True)
+        for index in range(1, 3):
+            Image.new("RGB", (10, 10), "red").save(episode / f"{index:03d}.jpg")
+    information = dict(
+        title="title",
+        author="author",
+        episode_titles=["first", "second"],
+        episode_dir_names=["0001. first", "0002. second"],
+    )
+    (webtoon / "information.json").write_text(json.dumps(information), encoding="utf-8")
+    return webtoon
+
+
+def test_export_cbz(tmp_path: Path):
+    webtoon = _make_webtoon(tmp_path / "title(1234)")
+    target = export_webtoon(webtoon, "cbz", max_workers=2)
+    assert target == tmp_path / "title(1234, cbz)"
+
+    with zipfile.ZipFile(target / "0002. second.cbz") as archive:
+        assert archive.namelist() == ["001.jpg", "002.jpg", "ComicInfo.xml"]
+        assert archive.getinfo("001.jpg").compress_type == zipfile.ZIP_STORED
+        comic_info = archive.read("ComicInfo.xml").decode()
+        assert "<Title>second</Title>" in comic_info
+        assert "<Number>2</Number>" in comic_info
+
+
+def test_export_epub(tmp_path: Path):
+    webtoon = _make_webtoon(tmp_path / "title(1234)")
+    target = export_webtoon(webtoon, "epub", single_archive=True)
+
+    with zipfile.ZipFile(target / "title(1234).epub") as archive:
+        first = archive.infolist()[0]
+        assert first.filename == "mimetype"
+        assert first.compress_type == zipfile.ZIP_STORED
+        assert archive.getinfo("OEBPS/images/0002_001.jpg").compress_type == zipfile.ZIP_STORED
+        nav = archive.read("OEBPS/nav.xhtml").decode()
+        assert nav.index("first") < nav.index("second")
+
+
+def test_export_episode_removes_directory(tmp_path: Path):
+    webtoon = _make_webtoon(tmp_path / "title(1234)")
+    episode = webtoon / "0001. first"
+    (episode / "003.mp3").write_bytes(b"audio")
+
+    output = export_episode(episode, webtoon / "0001. first.cbz", episode_title="first", series="title", remove_directory=True)
+    assert not episode.exists()
+    with zipfile.ZipFile(output) as archive:
+        assert "003.mp3" in archive.namelist()
+
+
+def test_archive_exporter_hook(tmp_path: Path):
+    site = _naver_site(episodes=2, images=3)
+    image = io.BytesIO()
+    Image.new("RGB", (10, 10), "red").save(image, "PNG")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith(".png"):
+            return httpx.Response(200, content=image.getvalue(), headers={"content-type": "image/png"})
+        return site(request)
+
+    scraper = NaverWebtoonScraper(805702)
+    scraper.client = httpc.AsyncClient(transport=httpx.MockTransport(handler), raise_for_status=True)
+    scraper.base_directory = tmp_path
+    scraper.download_interval = 0
+    scraper.use_progress_bar = False
+    transcoder = ImageTranscoder("webp", max_workers=1)
+    exporter = ArchiveExporter("cbz", max_workers=1)
+    exporter.dependencies.append(transcoder)
+    transcoder.register(scraper)
+    exporter.register(scraper)
+    asyncio.run(scraper.async_download_webtoon())
+
+    # 변환이 끝난 뒤에 아카이브를 만들고 에피소드 디렉토리를 지움
+    webtoon = scraper.directory_manager.webtoon_directory
+    archives = sorted(webtoon.glob("*.cbz"))
+    assert [archive.stem for archive in archives] == scraper.episode_dir_names
+    assert not any(path.is_dir() for path in webtoon.iterdir())
+    for archive_path in archives:
+        with zipfile.ZipFile(archive_path) as archive:
+            assert archive.namelist() == ["001.webp", "002.webp", "003.webp", "ComicInfo.xml"]
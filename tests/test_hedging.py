@@ -0,0 +1,86 @@
+import asyncio
+import time
+
+import httpc
+import httpx
+
+from WebtoonScraper.hedging import HedgePolicy
+from WebtoonScraper.scrapers import NaverWebtoonScraper
+
+from .test_scrapers import _naver_site
+
+
+def _warmed_up_policy(**kwargs) -> HedgePolicy:
+    policy = HedgePolicy(min_samples=5, **kwargs)
+    for _ in range(5):
+        policy.observe(0.01)
+    return policy
+
+
+def test_hedge_policy():
+    cancelled = []
+
+    async def request(on_first_byte, delays: list[float]) -> str:
+        delay = delays.pop(0)
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            cancelled.append(delay)
+            raise
+        on_first_byte()
+        return f"slept {delay}"
+
+    # 원래 요청이 멈추면 중복 요청의 결과를 사용하고 원래 요청은 취소함
+    policy = _warmed_up_policy(budget_ratio=1)
+    start = time.perf_counter()
+    result = asyncio.run(policy.fetch(lambda on_first_byte, delays=[5, 0.01]: request(on_first_byte, delays)))
+    assert result == "slept 0.01"
+    assert time.perf_counter() - start < 1
+    assert cancelled == [5]
+    assert (policy.hedged, policy.hedge_wins) == (1, 1)
+
+    # 예산이 없다면 원래 요청을 기다림
+    policy = _warmed_up_policy(budget_ratio=0)
+    result = asyncio.run(policy.fetch(lambda on_first_byte, delays=[0.2, 0.01]: request(on_first_byte, delays)))
+    assert result == "slept 0.2"
+    assert (policy.hedged, policy.denied) == (0, 1)
+
+
+def test_scraper_hedging(tmp_path):
+    site = _naver_site(episodes=2, images=5)
+    stalled: set[str] = set()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        # 두 번째 에피소드의 이미지 하나는 처음 요청했을 때 응답하지 않음
+        if request.url.path == "/2/3.png" and not stalled:
+            stalled.add(str(request.url))
+            await asyncio.sleep(30)
+        return site(request)
+
+    scraper = NaverWebtoonScraper(805702)
+    scraper.client = httpc.AsyncClient(transport=httpx.MockTransport(handler), raise_for_status=True)
+    scraper.base_directory = tmp_path
+    scraper.download_interval = 0
+    scraper.use_progress_bar = False
+    scraper.hedge_policy = policy = HedgePolicy(budget_ratio=1, min_samples=3)
+
+    start = time.perf_counter()
+    asyncio.run(scraper.async_download_webtoon())
+    assert time.perf_counter() - start < 5
+    assert scraper.download_status == ["downloaded", "downloaded"]
+    assert stalled and policy.hedge_wins == 1
+
+
+def test_cli_restores_hedge_policy(monkeypatch):
+    from WebtoonScraper import __main__ as cli
+    from WebtoonScraper.scrapers import Scraper
+
+    used = []
+
+    async def download_webtoons(*_) -> None:
+        used.append(Scraper.hedge_policy)
+
+    monkeypatch.setattr(cli, "_download_webtoons", download_webtoons)
+    asyncio.run(cli.parse_download(cli._parse_args(["download", "805702", "--hedge"])))
+    assert isinstance(used[0], HedgePolicy)
+    assert Scraper.hedge_policy is None
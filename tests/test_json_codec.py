@@ -0,0 +1,36 @@
+import json
+
+import pytest
+
+from WebtoonScraper import json_codec
+
+
+def test_stdlib_compatible_output():
+    data = {"title": "웹툰 제목", "ids": [1, None, 3], "nested": {"ok": True, "ratio": 0.5}}
+    expected = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    assert json_codec.dumps(data) == expected
+    assert json_codec.dumpb(data) == expected.encode()
+    assert json_codec.loads(expected) == json_codec.loads(expected.encode()) == data
+    assert json_codec.dumps({"a": object()}, default=lambda _: "x") == '{"a":"x"}'
+
+
+@pytest.mark.parametrize("name", json_codec.BACKENDS)
+def test_backends_agree(name):
+    previous = json_codec.backend()
+    try:
+        json_codec.set_backend(name)
+    except ImportError:
+        pytest.skip(f"{name} is not installed")
+    try:
+        data = {"title": "웹툰", "big": 2**70, "episodes": [{"no": 1, "charge": False}], "1": "int-like key"}
+        assert json_codec.loads(json_codec.dumpb(data)) == data
+        assert json_codec.loads(b'{"value": NaN}')["value"] != 0
+        with pytest.raises(json.JSONDecodeError):
+            json_codec.loads(b"{broken")
+    finally:
+        json_codec.set_backend(previous)
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        json_codec.set_backend("yaml")
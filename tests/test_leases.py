@@ -0,0 +1,111 @@
+import asyncio
+import os
+import time
+
+import httpc
+import httpx
+import pytest
+
+from WebtoonScraper.exceptions import LeaseHeldError
+from WebtoonScraper.leases import Lease, LeaseManager, read_lease
+from WebtoonScraper.scrapers import NaverWebtoonScraper
+
+from .test_scrapers import _naver_site
+
+
+def test_lease(tmp_path):
+    path = tmp_path / "a.lease"
+    first = Lease(path, "first", ttl=10)
+    second = Lease(path, "second", ttl=10)
+    assert first.try_acquire()
+    assert not second.try_acquire()
+    assert read_lease(path)["owner"] == "first"  # type: ignore
+
+    # 갱신되지 않은 lease는 회수됨
+    stale = time.time() - 20
+    os.utime(path, (stale, stale))
+    assert second.try_acquire()
+    assert not first.renew()
+    first.release()
+    assert path.exists()
+    second.release()
+    assert not path.exists()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_concurrent_reclaim(tmp_path, monkeypatch):
+    from WebtoonScraper import leases
+
+    path = tmp_path / "a.lease"
+    assert Lease(path, "dead", ttl=10).try_acquire()
+    stale = time.time() - 20
+    os.utime(path, (stale, stale))
+
+    # late가 만료를 확인한 직후, 이름을 바꾸기 전에 early가 먼저 회수하고 lease를 얻음
+    early, late = Lease(path, "early", ttl=10), Lease(path, "late", ttl=10)
+    original_read_lease = leases.read_lease
+
+    def read_lease_then_race(lease_path):
+        info = original_read_lease(lease_path)
+        if not early.held and lease_path == path:
+            monkeypatch.setattr(leases, "read_lease", original_read_lease)
+            assert early.try_acquire()
+        return info
+
+    monkeypatch.setattr(leases, "read_lease", read_lease_then_race)
+    assert not late.try_acquire()
+    assert early.held and not late.held
+    assert read_lease(path)["owner"] == "early"  # type: ignore
+    assert early.renew()
+    assert [file.name for file in tmp_path.iterdir()] == ["a.lease"]
+
+
+def test_claim(tmp_path):
+    first, second = LeaseManager(ttl=10), LeaseManager(ttl=10)
+    try:
+        claim = first.claim(tmp_path, "naver_webtoon-1")
+        assert claim is not None
+        assert second.claim(tmp_path, "naver_webtoon-1") is None
+        first.complete(claim)
+        assert not claim.path.exists()
+        assert first.claim(tmp_path, "naver_webtoon-1") is None
+        assert second.claim(tmp_path, "naver_webtoon-2") is not None
+    finally:
+        first.close()
+        second.close()
+    assert sorted(path.name for path in tmp_path.iterdir()) == ["naver_webtoon-1.done"]
+
+
+def test_scraper_leases(tmp_path):
+    asyncio.run(async_test_scraper_leases(tmp_path))
+
+
+async def async_test_scraper_leases(tmp_path):
+    other, manager = LeaseManager(), LeaseManager()
+
+    def make_scraper():
+        scraper = NaverWebtoonScraper(805702)
+        scraper.client = httpc.AsyncClient(transport=httpx.MockTransport(_naver_site(episodes=2, images=1)), raise_for_status=True)
+        scraper.base_directory = tmp_path
+        scraper.download_interval = 0
+        scraper.use_progress_bar = False
+        scraper.lease_manager = manager
+        return scraper
+
+    webtoon_directory = tmp_path / "title(805702)"
+    webtoon_directory.mkdir()
+    try:
+        held = other.try_acquire(webtoon_directory / ".webtoon.lease")
+        with pytest.raises(LeaseHeldError):
+            await make_scraper().async_download_webtoon()
+        other.release(held)  # type: ignore
+
+        other.try_acquire(webtoon_directory / ".0002. episode 2.lease")
+        scraper = make_scraper()
+        await scraper.async_download_webtoon()
+        assert scraper.download_status == ["downloaded", "skipped_by_lease"]
+        assert not (webtoon_directory / ".webtoon.lease").exists()
+        assert not (webtoon_directory / ".0001. episode 1.lease").exists()
+    finally:
+        other.close()
+        manager.close()
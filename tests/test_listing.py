@@ -0,0 +1,117 @@
+import asyncio
+import json
+
+import httpc
+import httpx
+
+from WebtoonScraper.__main__ import _list_episodes
+from WebtoonScraper.directory_state import load_information_json
+from WebtoonScraper.scrapers import EpisodeRange, NaverWebtoonScraper
+from WebtoonScraper.scrapers._helpers import SpilledList
+
+from .test_scrapers import _naver_site
+
+
+def _scraper(tmp_path, handler) -> NaverWebtoonScraper:
+    scraper = NaverWebtoonScraper(805702)
+    scraper.client = httpc.AsyncClient(transport=httpx.MockTransport(handler), raise_for_status=True)
+    scraper.base_directory = tmp_path
+    scraper.download_interval = 0
+    scraper.use_progress_bar = False
+    return scraper
+
+
+def test_aiter_episodes(tmp_path, capsys):
+    site = _naver_site(episodes=25, images=1)
+    requested_pages = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/article/list":
+            requested_pages.append(int(request.url.params["page"]))
+        return site(request)
+
+    async def first_episodes(scraper: NaverWebtoonScraper) -> list:
+        episodes = []
+        async for episode in scraper.aiter_episodes():
+            episodes.append(episode)
+            if len(episodes) == 3:
+                break
+        return episodes
+
+    # 첫 페이지만 받고도 에피소드를 반환함
+    scraper = _scraper(tmp_path, handler)
+    assert [episode.title for episode in asyncio.run(first_episodes(scraper))] == ["episode 1", "episode 2", "episode 3"]
+    assert requested_pages == [1]
+
+    # 끝까지 순회하면 fetch_episode_information()을 실행한 것과 같음
+    scraper = _scraper(tmp_path, handler)
+    asyncio.run(_list_episodes(scraper, "ndjson"))
+    lines = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(lines) == 25
+    assert lines[0] == dict(no=1, id=1, title="episode 1", charged=False)
+    assert scraper.episode_ids == list(range(1, 26))
+    requested_pages.clear()
+    asyncio.run(scraper.fetch_episode_information())
+    assert requested_pages == []
+
+
+def test_stream_listing_download(tmp_path):
+    site = _naver_site(episodes=25, images=1)
+    requests = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        if request.url.path == "/api/article/list":
+            await asyncio.sleep(0.05)
+        return site(request)
+
+    scraper = _scraper(tmp_path, handler)
+    scraper.stream_listing = True
+    scraper.download_range = EpisodeRange.from_string("2~3,24", inclusive=True)
+    asyncio.run(scraper.async_download_webtoon())
+
+    # 첫 에피소드는 목록을 모두 불러오기 전에 다운로드됨
+    last_listing = max(index for index, path in enumerate(requests) if path == "/api/article/list")
+    assert requests.index("/webtoon/detail") < last_listing
+    expected = ["skipped_by_range"] * 25
+    expected[1] = expected[2] = expected[23] = "downloaded"
+    assert scraper.download_status == expected
+    information = load_information_json(scraper.directory_manager.webtoon_directory)
+    assert information is not None and information["episode_ids"] == list(range(1, 26))
+
+
+def test_low_memory(tmp_path):
+    scraper = _scraper(tmp_path, _naver_site(episodes=3, images=1))
+    scraper.low_memory = True
+    scraper.information_to_exclude = ()
+    asyncio.run(scraper.async_download_webtoon())
+
+    assert isinstance(scraper.raw_articles, SpilledList)
+    assert [article["no"] for article in scraper.raw_articles] == [1, 2, 3]
+    assert scraper.raw_articles[1:] == [article for article in scraper.raw_articles][1:]
+    information = load_information_json(scraper.directory_manager.webtoon_directory)
+    assert information is not None
+    assert [article["no"] for article in information["extra"]["raw_articles"]] == [1, 2, 3]
+
+
+def test_out_of_order_listing(tmp_path):
+    # 첫 페이지 안에서 순서가 뒤바뀌고, 3화는 다음 페이지에 뒤늦게 도착함
+    pages = [
+        [dict(no=2, subtitle="episode 2", charge=False), dict(no=1, subtitle="episode 1", charge=True), dict(no=4, subtitle="episode 4", charge=False)],
+        [dict(no=3, subtitle="episode 3", charge=True), dict(no=5, subtitle="episode 5", charge=False)],
+    ]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        return httpx.Response(200, json=dict(articleList=pages[min(page, len(pages)) - 1]))
+
+    async def listed(scraper: NaverWebtoonScraper) -> list:
+        return [episode async for episode in scraper.aiter_episodes()]
+
+    scraper = _scraper(tmp_path, handler)
+    episodes = asyncio.run(listed(scraper))
+    # 같은 페이지 안에서 뒤바뀐 에피소드는 빈 자리로 채워지지 않음
+    assert [episode.id for episode in episodes] == [1, 2, None, 4, 5]
+    assert scraper.episode_ids == [1, 2, 3, 4, 5]
+    # 뒤늦게 도착한 유료 에피소드도 건너뜀
+    assert sorted(scraper.skip_download) == [0, 2]
@@ -0,0 +1,160 @@
+import asyncio
+import io
+import time
+from pathlib import Path
+
+import httpc
+import httpx
+import pytest
+from PIL import Image
+
+from WebtoonScraper.directory_state import DirectoryState, check_container_state
+from WebtoonScraper.processing import EpisodeProcessor, ImageConcatenator, ImageTranscoder, concat_episode, concat_images, concat_webtoon, derived_webtoon_directory, episode_images, transcode_episode
+from WebtoonScraper.scrapers import NaverWebtoonScraper
+from WebtoonScraper.webtoon_viewer import build_viewer
+
+from .test_scrapers import _naver_site
+
+
+def _make_episode(directory: Path, sizes, colors) -> Path:
+    directory.mkdir(parents=True)
+    for index, (size, color) in enumerate(zip(sizes, colors, strict=True), 1):
+        Image.new("RGB", size, color).save(directory / f"{index:03d}.png")
+    (directory / f"{len(sizes) + 1:03d}.mp3").write_bytes(b"not an image")
+    return directory
+
+
+def test_concat_strip(tmp_path: Path):
+    episode = _make_episode(tmp_path / "0001. first", [(20, 30), (20, 50), (10, 20)], ["red", "blue", "green"])
+    assert [image.name for image in episode_images(episode)] == ["001.png", "002.png", "003.png"]
+
+    assert concat_episode(episode, tmp_path / "out") == 1
+    with Image.open(tmp_path / "out" / "001.png") as strip:
+        assert strip.size == (20, 100)
+        assert strip.getpixel((0, 0)) == (255, 0, 0)
+        assert strip.getpixel((0, 30)) == (0, 0, 255)
+        # 폭이 좁은 이미지는 가운데 정렬됨
+        assert strip.getpixel((0, 90)) == (255, 255, 255)
+        assert strip.getpixel((10, 90)) == (0, 128, 0)
+
+
+def test_concat_pages(tmp_path: Path):
+    episode = _make_episode(tmp_path / "0001. first", [(20, 30), (20, 50)], ["red", "blue"])
+
+    assert concat_episode(episode, tmp_path / "out", 35, image_format="png") == 3
+    heights = []
+    for page in sorted((tmp_path / "out").iterdir()):
+        with Image.open(page) as image:
+            heights.append(image.height)
+    assert heights == [35, 35, 10]
+
+
+def test_concat_webtoon(tmp_path: Path):
+    webtoon = tmp_path / "title(1234)"
+    _make_episode(webtoon / "0001. first", [(20, 30)], ["red"])
+    _make_episode(webtoon / "0002. second", [(20, 30), (20, 10)], ["red", "blue"])
+    (webtoon / "information.json").write_text("{}")
+
+    target = concat_webtoon(webtoon, max_workers=2)
+    assert target == derived_webtoon_directory(webtoon, "concatenated") == tmp_path / "title(1234, concatenated)"
+    assert (target / "information.json").exists()
+    with Image.open(target / "0002. second" / "001.png") as strip:
+        assert strip.size == (20, 40)
+
+
+def test_transcode_episode(tmp_path: Path):
+    webtoon = tmp_path / "title(1234)"
+    episode = webtoon / "0001. first"
+    episode.mkdir(parents=True)
+    for index in range(1, 3):
+        # 노이즈가 있어야 변환 결과가 원본보다 작아짐
+        Image.effect_noise((64, 64), 40).convert("RGB").save(episode / f"{index:03d}.png")
+    (episode / "003.mp3").write_bytes(b"audio")
+
+    before, after = transcode_episode(episode, "webp", 80, keep_originals=True)
+    assert after < before
+    assert sorted(path.name for path in episode.iterdir()) == ["001.webp", "002.webp", "003.mp3"]
+    assert sorted(path.name for path in (webtoon / "_originals" / episode.name).iterdir()) == ["001.png", "002.png"]
+    # 웹툰 디렉토리는 여전히 인식되어야 함
+    assert check_container_state(webtoon) == DirectoryState.WebtoonDirectory(is_merged=False)
+
+    # 이미 변환된 에피소드는 건너뜀
+    assert transcode_episode(episode, "webp", 80) == (0, 0)
+
+
+def test_build_viewer(tmp_path: Path):
+    webtoon = tmp_path / "title(1234)"
+    _make_episode(webtoon / "0001. first", [(20, 30), (20, 50)], ["red", "blue"])
+    index = build_viewer(webtoon, max_workers=1)
+    assert index == webtoon / "webtoon.html"
+    page = (webtoon / "_viewer" / "episodes" / "0001.html").read_text("utf-8")
+    assert 'width="20" height="50" loading="lazy"' in page
+    assert (webtoon / "_viewer" / "thumbnails" / "0001.jpg").exists()
+    assert check_container_state(webtoon) == DirectoryState.WebtoonDirectory(is_merged=False)
+
+    # 새로운 에피소드만 페이지가 다시 만들어짐
+    (webtoon / "_viewer" / "episodes" / "0001.html").write_text("unchanged", "utf-8")
+    _make_episode(webtoon / "0002. second", [(20, 30)], ["red"])
+    build_viewer(webtoon, max_workers=1)
+    assert (webtoon / "_viewer" / "episodes" / "0001.html").read_text("utf-8") == "unchanged"
+    assert (webtoon / "_viewer" / "episodes" / "0002.html").exists()
+    assert '"page": "0002.html"' in (webtoon / "_viewer" / "episodes.js").read_text("utf-8")
+
+    # 미리 구해둔 크기의 파일 이름이 현재 이미지와 다르다면 사용하지 않음
+    _make_episode(webtoon / "0003. third", [(20, 40)], ["red"])
+    build_viewer(webtoon, max_workers=1, known_sizes={"0003. third": [["001.jpg", 1, 1]]})
+    page = (webtoon / "_viewer" / "episodes" / "0003.html").read_text("utf-8")
+    assert "001.jpg" not in page and 'width="20" height="40"' in page
+
+
+def test_episode_processor_is_abstract():
+    class Incomplete(EpisodeProcessor):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()  # type: ignore
+
+
+def _slow_concat_episode(episode_directory: Path, output_directory: Path, page_height: int | None) -> int:
+    # 이미지 목록을 구한 뒤 파일을 열기까지 시간이 걸리는 경우를 재현함
+    images = episode_images(episode_directory)
+    time.sleep(0.5)
+    output_directory.mkdir(parents=True, exist_ok=True)
+    concat_images(images, output_directory / "001.png")
+    return 1
+
+
+class _SlowConcatenator(ImageConcatenator):
+    def process(self, scraper, episode_no, episode_directory):
+        _, args = super().process(scraper, episode_no, episode_directory)  # type: ignore
+        return _slow_concat_episode, args
+
+
+def test_concat_before_transcode(tmp_path: Path):
+    site = _naver_site(episodes=1, images=5)
+    image = io.BytesIO()
+    Image.new("RGB", (10, 10), "red").save(image, "PNG")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith(".png"):
+            return httpx.Response(200, content=image.getvalue(), headers={"content-type": "image/png"})
+        return site(request)
+
+    scraper = NaverWebtoonScraper(805702)
+    scraper.client = httpc.AsyncClient(transport=httpx.MockTransport(handler), raise_for_status=True)
+    scraper.base_directory = tmp_path
+    scraper.download_interval = 0
+    scraper.use_progress_bar = False
+    concatenator = _SlowConcatenator(max_workers=1)
+    transcoder = ImageTranscoder("webp", max_workers=1)
+    transcoder.dependencies.append(concatenator)
+    concatenator.register(scraper)
+    transcoder.register(scraper)
+    asyncio.run(scraper.async_download_webtoon())
+
+    # 이어붙이기가 끝난 뒤에 변환되므로 원본 이미지 다섯 개가 빠짐없이, 한 번씩만 이어붙여짐
+    episode = scraper.directory_manager.webtoon_directory / "0001. episode 1"
+    assert [path.name for path in episode_images(episode)] == [f"{index:03d}.webp" for index in range(1, 6)]
+    concatenated = derived_webtoon_directory(episode.parent, "concatenated") / episode.name / "001.png"
+    with Image.open(concatenated) as strip:
+        assert strip.size == (10, 50)
@@ -1,8 +1,56 @@
 import asyncio
+import json
+import zipfile
 
+import httpc
+import httpx
 import pytest
 
 from WebtoonScraper.scrapers import *  # type: ignore
+from WebtoonScraper.scrapers._scraper import WebtoonDirectory
+
+
+PNG = b"\x89PNG\r\n\x1a\n" + b"\0" * 100
+
+
+def _naver_site(episodes: int = 2, images: int = 3):
+    """네이버 웹툰을 흉내내는 MockTransport handler를 만듭니다."""
+    articles = [dict(no=no, subtitle=f"episode {no}", charge=False) for no in range(1, episodes + 1)]
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        match request.url.path:
+            case "/api/article/list/info":
+                return httpx.Response(200, json=dict(
+                    sharedThumbnailUrl="https://image-comic.pstatic.net/thumbnail.png",
+                    titleName="title",
+                    communityArtists=[dict(name="author")],
+                    webtoonLevelCode="WEBTOON",
+                    synopsis="synopsis",
+                    age=dict(type="RATE_12"),
+                ))
+            case "/api/article/list":
+                page = int(request.url.params["page"])
+                return httpx.Response(200, json=dict(articleList=articles[(page - 1) * 20 : page * 20] or articles[-20:]))
+            case "/webtoon/detail":
+                no = request.url.params["no"]
+                image_tags = "".join(f'<img src="https://image-comic.pstatic.net/{no}/{index}.png">' for index in range(images))
+                article = json.dumps(dict(no=int(no), subtitle=f"episode {no}", authorWords="words"), separators=(",", ":"))
+                html = f'<html><body><div id="sectionContWide">{image_tags}</div><script>x = {{article: {article}, currentIndex: 0,}}</script></body></html>'
+                return httpx.Response(200, text=html)
+            case _:
+                return httpx.Response(200, content=PNG, headers={"content-type": "image/png"})
+
+    return handler
+
+
+def _mock_naver_scraper(tmp_path, handler) -> NaverWebtoonScraper:
+    scraper = NaverWebtoonScraper(805702)
+    scraper._set_webtoon_type("webtoon")
+    scraper.client = httpc.AsyncClient(transport=httpx.MockTransport(handler), raise_for_status=True)
+    scraper.directory_manager = WebtoonDirectory(tmp_path)
+    scraper.directory_manager.load()
+    scraper.episode_ids = [1]
+    return scraper
 
 
 def test_callback():
@@ -41,3 +89,522 @@ async def async_test_callback():
     with pytest.raises(AssertionError):
         (task,) = await scraper.callbacks.async_callback("async_task_trigger", key="not_a_value")  # type: ignore
         await task
+
+
+def test_naver_comments_incremental(tmp_path):
+    asyncio.run(async_test_naver_comments_incremental(tmp_path))
+
+
+async def async_test_naver_comments_incremental(tmp_path):
+    comment_ids = list(range(30, 0, -1))
+    requested_pages = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        page_size = int(request.url.params["pageSize"])
+        requested_pages.append(page)
+        posts = [dict(id=comment_id) for comment_id in comment_ids[(page - 1) * page_size : page * page_size]]
+        page_info = dict(totalPages=-(-len(comment_ids) // page_size), totalElements=len(comment_ids))
+        return httpx.Response(200, json=dict(result=dict(posts=posts, pageInfo=page_info)))
+
+    scraper = _mock_naver_scraper(tmp_path, handler)
+    scraper.download_comments_option = "new"
+
+    path = await scraper.download_episode_comments(0)
+    assert path == tmp_path / "_comments" / "1.json"
+    assert [comment["id"] for comment in json.loads(path.read_text("utf-8"))["comments"]] == comment_ids
+    assert sorted(requested_pages) == [1, 2]
+
+    # 새 댓글이 생기면 저장된 댓글이 나올 때까지만 받음
+    comment_ids[:0] = [32, 31]
+    requested_pages.clear()
+    await scraper.download_episode_comments(0)
+    assert [comment["id"] for comment in json.loads(path.read_text("utf-8"))["comments"]] == comment_ids
+    assert requested_pages == [1]
+    assert scraper.comment_counts == {0: 32}
+
+
+def test_naver_skipped_comments(tmp_path):
+    async def run(refresh: bool) -> tuple[list[int], int]:
+        scraper = _mock_naver_scraper(tmp_path, lambda request: httpx.Response(404))
+        scraper.download_comments_option = "new"
+        scraper.refresh_skipped_comments = refresh
+        refreshed = []
+        running = peak = 0
+
+        async def download_episode_comments(episode_no: int) -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            refreshed.append(episode_no)
+            running -= 1
+
+        scraper.download_episode_comments = download_episode_comments
+        for episode_no in range(5):
+            scraper._refresh_skipped_comments(reason="already_exist", episode_no=episode_no)
+        await scraper._tasks.join()
+        return refreshed, peak
+
+    # 기본적으로는 건너뛴 에피소드의 댓글을 받지 않음
+    assert asyncio.run(run(False)) == ([], 0)
+    # 건너뛴 에피소드들의 댓글은 하나의 작업에서 차례대로 받음
+    assert asyncio.run(run(True)) == ([0, 1, 2, 3, 4], 1)
+
+
+def test_failed_side_asset(tmp_path):
+    asyncio.run(async_test_failed_side_asset(tmp_path))
+
+
+async def async_test_failed_side_asset(tmp_path):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith(".mp3"):
+            return httpx.Response(404)
+        return httpx.Response(200, content=PNG, headers={"content-type": "image/png"})
+
+    scraper = _mock_naver_scraper(tmp_path, handler)
+    scraper.client.retry = 0
+    scraper.episode_audio_urls = {0: "https://example.com/bgm.mp3"}
+    failed_assets = []
+    scraper.callbacks.register("side_asset_failed", lambda scraper, asset_name, **context: failed_assets.append(asset_name), replace_default=True)
+
+    episode_directory = tmp_path / "0001. first"
+    episode_directory.mkdir()
+    await scraper._download_episode_images(0, ["https://example.com/1.png", "https://example.com/2.png"], episode_directory)
+    assert sorted(path.name for path in episode_directory.iterdir()) == ["001.png", "002.png"]
+    assert failed_assets == ["003.mp3"]
+    assert 0 not in scraper.audio_names
+
+
+def test_extract_naver_episode_page():
+    from WebtoonScraper.scrapers._naver_extraction import extract_episode_page
+
+    page = """<html><body>
+<div id="sectionContWide"><img src="https://example.com/agerate.jpg"><img src="https://example.com/1.jpg"><img src="https://example.com/2.jpg"></div>
+<audio id="bgmPlayer"><source src="https://example.com/bgm.mp3"></audio>
+<script>var x = 1; const data = {
+    article: {"no":3,"subtitle":"제목, 그리고 {괄호}","authorWords":"작가의 말"},
+    currentIndex: 2,
+};</script>
+</body></html>"""
+    result = extract_episode_page(page, "#sectionContWide > img")
+    assert result.image_urls == ["https://example.com/1.jpg", "https://example.com/2.jpg"]
+    assert result.audio_url == "https://example.com/bgm.mp3"
+    assert result.author_comment == "작가의 말"
+
+    # JSON으로 해석할 수 없는 경우 예전 정규식으로 처리함
+    page = page.replace("제목, 그리고", "제목\\'").replace("<audio", "<div").replace("</audio>", "</div>")
+    result = extract_episode_page(page, "#sectionContWide > img")
+    assert result.audio_url is None
+    assert result.author_comment == "작가의 말"
+
+
+def test_callback_dispatch_cache():
+    asyncio.run(async_test_callback_dispatch_cache())
+
+
+async def async_test_callback_dispatch_cache():
+    from WebtoonScraper.scrapers._callback_manager import CallbackManager
+
+    callbacks = CallbackManager()
+    called = []
+    default = callbacks.create(func=lambda **context: called.append("default"))
+    assert callbacks.create("{spam}", level="debug") is callbacks.create("{spam}", level="debug")
+
+    await callbacks.async_callback("trigger", default)
+    # 호출된 뒤에 등록하거나 제거한 콜백도 반영되어야 함
+    replacing = callbacks.register("trigger", lambda **context: called.append("registered"), replace_default=True)
+    await callbacks.async_callback("trigger", default)
+    callbacks.remove("trigger", replacing)
+    await callbacks.async_callback("trigger", default)
+    assert called == ["default", "registered", "default"]
+
+
+def test_background_callbacks():
+    asyncio.run(async_test_background_callbacks())
+
+
+async def async_test_background_callbacks():
+    import threading
+    import time
+
+    from WebtoonScraper.scrapers._callback_manager import CallbackManager
+
+    callbacks = CallbackManager()
+    callbacks.max_pending = 2
+    finished = []
+    main_thread = threading.get_ident()
+
+    @callbacks.register("episode_done", mode="thread")
+    def upload(no, **context):
+        assert threading.get_ident() != main_thread
+        time.sleep(0.02)
+        finished.append(no)
+
+    for no in range(5):
+        await callbacks.async_callback("episode_done", no=no)
+        # 대기열이 가득 차면 호출한 쪽이 기다림
+        assert len(callbacks._pending) <= 2
+    assert await callbacks.drain() == 0
+    assert sorted(finished) == list(range(5))
+
+    @callbacks.register_async("stuck", mode="queue")
+    async def stuck(**context):
+        await asyncio.Event().wait()
+
+    (task,) = await callbacks.async_callback("stuck")  # type: ignore
+    assert await callbacks.drain(cancel=True) == 1
+    assert task.cancelled()
+
+
+def test_download_events(tmp_path):
+    asyncio.run(async_test_download_events(tmp_path))
+
+
+async def async_test_download_events(tmp_path):
+    from WebtoonScraper.events import EventRecorder
+    from WebtoonScraper.scrapers._ledger import record_request, record_response
+
+    scraper = NaverWebtoonScraper(805702)
+    scraper.client = httpc.AsyncClient(
+        transport=httpx.MockTransport(_naver_site(episodes=2)),
+        raise_for_status=True,
+        event_hooks=dict(request=[record_request], response=[record_response]),
+    )
+    scraper.base_directory = tmp_path
+    scraper.download_interval = 0
+    scraper.use_progress_bar = False
+    recorder = EventRecorder(tmp_path / "events.jsonl")
+    recorder.register(scraper)
+    await scraper.async_download_webtoon()
+    recorder.close()
+
+    events = [json.loads(line) for line in (tmp_path / "events.jsonl").read_text("utf-8").splitlines()]
+    assert [event["event"] for event in events] == [
+        "download_started",
+        "downloading",
+        "download_completed",
+        "downloading",
+        "download_completed",
+        "download_ended",
+    ]
+    completed = events[2]
+    assert completed["episode"] == 1
+    # 에피소드 페이지와 이미지 세 개
+    assert completed["requests"] == 4
+    assert completed["files"] == 3
+    assert completed["bytes"] == 3 * len(PNG)
+    assert events[-1]["episodes"] == 2
+
+    information = json.loads((tmp_path / "title(805702)" / "information.json").read_text("utf-8"))
+    assert information["download_stats"]["1"]["files"] == 3
+
+
+def test_metrics(tmp_path):
+    asyncio.run(async_test_metrics(tmp_path))
+
+
+async def async_test_metrics(tmp_path):
+    import urllib.request
+
+    from WebtoonScraper.metrics import MetricsCollector
+    from WebtoonScraper.scrapers._ledger import record_request, record_response
+
+    scraper = NaverWebtoonScraper(805702)
+    scraper.client = httpc.AsyncClient(
+        transport=httpx.MockTransport(_naver_site(episodes=2, images=3)),
+        raise_for_status=True,
+        event_hooks=dict(request=[record_request], response=[record_response]),
+    )
+    scraper.base_directory = tmp_path
+    scraper.download_interval = 0
+    scraper.use_progress_bar = False
+    scraper.download_range = [2]
+
+    collector = MetricsCollector(tmp_path / "metrics.prom")
+    collector.register(scraper)
+    await scraper.async_download_webtoon()
+
+    assert collector.episodes.get("naver_webtoon", "downloaded") == 1
+    assert collector.episodes.get("naver_webtoon", "skipped_by_range") == 1
+    assert scraper.download_status == ["skipped_by_range", "downloaded"]
+    assert collector.downloaded_bytes.get("naver_webtoon") == 3 * len(PNG)
+    # 썸네일과 이미지 세 개
+    assert collector.image_latency.count("naver_webtoon") == 4
+    text = (tmp_path / "metrics.prom").read_text("utf-8")
+    assert 'webtoon_scraper_http_requests_total{platform="naver_webtoon",host="image-comic.pstatic.net",status="200"} 4' in text
+    assert 'webtoon_scraper_episode_seconds_count{platform="naver_webtoon",status="downloaded"} 1' in text
+
+    server = collector.serve(0)
+    with urllib.request.urlopen(f"http://127.0.0.1:{server.server_port}/metrics") as response:
+        assert "webtoon_scraper_requests_in_flight" in response.read().decode()
+    collector.close()
+
+    # 다운로드가 끝나면 스크래퍼를 참조하지 않고, 등록을 해제하면 더 이상 기록하지 않음
+    assert collector._scrapers == {}
+    assert (scraper.requests_in_flight, scraper.background_tasks, scraper.callbacks.pending_count) == (0, 0, 0)
+    collector.unregister(scraper)
+    scraper.download_range = None
+    await scraper.async_download_webtoon()
+    assert collector.episodes.get("naver_webtoon", "downloaded") == 1
+
+
+def test_phase_timer(tmp_path):
+    asyncio.run(async_test_phase_timer(tmp_path))
+
+
+async def async_test_phase_timer(tmp_path):
+    from WebtoonScraper.profiling import PhaseTimer
+
+    scraper = NaverWebtoonScraper(805702)
+    scraper.client = httpc.AsyncClient(transport=httpx.MockTransport(_naver_site(episodes=2)), raise_for_status=True)
+    scraper.base_directory = tmp_path
+    scraper.download_interval = 0
+    scraper.use_progress_bar = False
+    scraper.phase_timer = PhaseTimer()
+    phases = []
+    scraper.callbacks.register("download_ended", lambda scraper, finishing, **context: finishing and phases.append(context["phases"]))
+    await scraper.async_download_webtoon()
+
+    assert phases == [scraper.phase_timer]
+    summary = scraper.phase_timer.summary()
+    for phase in ("fetch_all", "episode_page", "parse_episode_page", "image_transfer", "disk_write", "information_json"):
+        assert phase in summary
+    assert summary["episode_page"]["count"] == 2
+    # 썸네일과 이미지 여섯 개
+    assert summary["image_transfer"]["count"] == 7
+
+
+def test_record_and_replay(tmp_path):
+    asyncio.run(async_test_record_and_replay(tmp_path))
+
+
+async def async_test_record_and_replay(tmp_path):
+    from WebtoonScraper.recording import HTTPRecorder, HTTPReplayer, ReplayMissError
+
+    site = _naver_site(episodes=2)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        response = site(request)
+        response.headers["set-cookie"] = "NID_SES=secret"
+        return response
+
+    def new_scraper(directory) -> NaverWebtoonScraper:
+        scraper = NaverWebtoonScraper(805702)
+        scraper.client = httpc.AsyncClient(transport=httpx.MockTransport(handler), raise_for_status=True)
+        scraper.client.cookies.set("NID_AUT", "secret")
+        scraper.base_directory = directory
+        scraper.download_interval = 0
+        scraper.use_progress_bar = False
+        return scraper
+
+    def recorded_headers(archive_path) -> list[tuple[str, str]]:
+        with zipfile.ZipFile(archive_path) as archive:
+            entries = [json.loads(archive.read(name)) for name in archive.namelist() if name.endswith(".json")]
+        assert entries
+        return [(key.lower(), value) for entry in entries for key, value in entry["request_headers"] + entry["response_headers"]]
+
+    # 인증 정보를 남기도록 하면 쿠키가 기록됨
+    recorder = HTTPRecorder(tmp_path / "credentials.zip", strip_credentials=False)
+    scraper = new_scraper(tmp_path / "credentials")
+    recorder.register(scraper)
+    await scraper.async_download_webtoon()
+    recorder.close()
+    headers = recorded_headers(tmp_path / "credentials.zip")
+    assert ("set-cookie", "NID_SES=secret") in headers
+    assert any(key == "cookie" and "NID_AUT=secret" in value for key, value in headers)
+
+    recorder = HTTPRecorder(tmp_path / "archive.zip")
+    scraper = new_scraper(tmp_path / "recorded")
+    recorder.register(scraper)
+    await scraper.async_download_webtoon()
+    recorder.close()
+    headers = recorded_headers(tmp_path / "archive.zip")
+    assert not any(key in ("cookie", "set-cookie") or "secret" in value for key, value in headers)
+
+    replayer = HTTPReplayer(tmp_path / "archive.zip")
+    scraper = new_scraper(tmp_path / "replayed")
+    replayer.register(scraper)
+    await scraper.async_download_webtoon()
+    recorded = sorted(path.relative_to(tmp_path / "recorded") for path in (tmp_path / "recorded").rglob("*.png"))
+    replayed = sorted(path.relative_to(tmp_path / "replayed") for path in (tmp_path / "replayed").rglob("*.png"))
+    assert recorded == replayed
+    # 썸네일과 이미지 여섯 개
+    assert len(replayed) == 7
+
+    with pytest.raises(ReplayMissError):
+        await scraper.client.get("https://comic.naver.com/not-recorded")
+    replayer.close()
+
+
+def test_streamed_fetch_retry(tmp_path):
+    closed = []
+
+    class Body(httpx.AsyncByteStream):
+        def __init__(self, name: str, fail: bool) -> None:
+            self.name = name
+            self.fail = fail
+
+        async def __aiter__(self):
+            yield PNG[:10]
+            if self.fail:
+                raise httpx.ReadTimeout("stalled in the middle of the body")
+            yield PNG[10:]
+
+        async def aclose(self) -> None:
+            closed.append(self.name)
+
+    attempts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        attempts.append(request.url.path)
+        match len(attempts):
+            case 1:
+                return httpx.Response(503, stream=Body("503", fail=False))
+            case 2:
+                return httpx.Response(200, stream=Body("timeout", fail=True))
+            case _:
+                return httpx.Response(200, stream=Body("ok", fail=False), headers={"content-type": "image/png"})
+
+    async def fetch(retry: int):
+        scraper = NaverWebtoonScraper(805702)
+        scraper.client = httpc.AsyncClient(transport=httpx.MockTransport(handler), retry=retry, raise_for_status=True)
+        return await scraper._fetch_content("https://image-comic.pstatic.net/1/0.png", on_first_byte=lambda: None)
+
+    # 5xx 응답과 본문을 읽다 생긴 오류 모두 재시도되며, 실패한 응답은 닫힘
+    headers, content = asyncio.run(fetch(retry=3))
+    assert content == PNG and len(attempts) == 3
+    assert closed == ["503", "timeout", "ok"]
+
+    attempts.clear()
+    with pytest.raises(ExceptionGroup):
+        asyncio.run(fetch(retry=2))
+
+
+def test_shared_progress(tmp_path):
+    asyncio.run(async_test_shared_progress(tmp_path))
+
+
+async def async_test_shared_progress(tmp_path):
+    from WebtoonScraper.scrapers._progress import DownloadProgress
+
+    transfers = []
+
+    def record_transfer(scraper, **context):
+        task = scraper.progress._tasks[scraper.progress_task_id]
+        transfers.append((scraper.progress, task.fields["transferred"], str(task.description)))
+
+    scrapers = []
+    for directory in ("first", "second"):
+        scraper = NaverWebtoonScraper(805702)
+        scraper.client = httpc.AsyncClient(transport=httpx.MockTransport(_naver_site(episodes=2)), raise_for_status=True)
+        scraper.base_directory = tmp_path / directory
+        scraper.download_interval = 0
+        scraper.callbacks.register("download_completed", record_transfer)
+        scrapers.append(scraper)
+    await asyncio.gather(*(scraper.async_download_webtoon() for scraper in scrapers))
+
+    assert len(transfers) == 4
+    # 두 스크래퍼가 같은 진행 표시줄을 사용함
+    assert len({id(progress) for progress, _, _ in transfers}) == 1
+    assert all(transferred >= len(PNG) * 3 for _, transferred, _ in transfers)
+    assert all("episode" in description for _, _, description in transfers)
+    assert DownloadProgress._shared is None
+
+
+def test_episode_table():
+    from WebtoonScraper.scrapers._episode_table import EpisodeStatus, EpisodeTable
+
+    scraper = NaverWebtoonScraper(805702)
+    with pytest.raises(AttributeError):
+        scraper.episode_ids
+    scraper.episode_ids = [1, 2, None, 4]
+    scraper.episode_titles = ["a", "b", None, "d"]
+    scraper.skip_download.extend([1, 1])
+    scraper.skip_download.append(2)
+    assert scraper.skip_download == {1, 2}
+
+    table = scraper.episode_table
+    table.reset_download_state()
+    scraper.download_status[0] = "downloaded"
+    table.set_status(range(1, 3), "skipped_by_skip_download")
+    assert scraper.download_status == ["downloaded", "skipped_by_skip_download", "skipped_by_skip_download", None]
+    assert table.where(EpisodeStatus.SKIPPED_BY_SKIP_DOWNLOAD, None) == [1, 2, 3]
+    assert table.count("downloaded", "failed") == 1
+    assert table.status_counts() == {EpisodeStatus.PENDING: 1, EpisodeStatus.DOWNLOADED: 1, EpisodeStatus.SKIPPED_BY_SKIP_DOWNLOAD: 2}
+
+    information = json.loads(json.dumps(table.to_information()))
+    assert information["download_status"] == scraper.download_status.tolist()
+    restored = EpisodeTable.from_information(information)
+    assert restored.to_information() == information
+    with pytest.raises(ValueError):
+        EpisodeTable.from_information(dict(episode_ids=[1, 2], download_status=["downloaded"]))
+
+    # strict=False는 ID와 상태만 읽고 알 수 없는 상태는 PENDING으로 취급함
+    legacy = dict(episode_ids=[1, 2, 3], download_status=["downloaded", "renamed_status", "failed"], episode_titles=["a"])
+    lenient = EpisodeTable.from_information(legacy, strict=False)
+    assert lenient.statuses == ["downloaded", None, "failed"]
+    assert lenient.titles is None and lenient.where("failed") == [2]
+    with pytest.raises(ValueError):
+        EpisodeTable.from_information(legacy)
+    with pytest.raises(ValueError):
+        scraper.download_status[0] = "unknown"
+
+
+def test_information_sidecars(tmp_path):
+    asyncio.run(async_test_information_sidecars(tmp_path))
+
+
+async def async_test_information_sidecars(tmp_path):
+    from WebtoonScraper.directory_state import InformationSidecar, load_information_json
+
+    async def download(information_to_exclude):
+        scraper = NaverWebtoonScraper(805702)
+        scraper.client = httpc.AsyncClient(transport=httpx.MockTransport(_naver_site(episodes=2, images=1)), raise_for_status=True)
+        scraper.base_directory = tmp_path
+        scraper.download_interval = 0
+        scraper.use_progress_bar = False
+        scraper.information_to_exclude = information_to_exclude
+        await scraper.async_download_webtoon()
+        return scraper.directory_manager.webtoon_directory
+
+    webtoon_directory = await download(())
+    assert (webtoon_directory / "information.extra.json.gz").exists()
+    core = json.loads((webtoon_directory / "information.json").read_text("utf-8"))
+    assert "extra" not in core
+    assert core["sidecars"] == {"extra": "information.extra.json.gz"}
+
+    information = load_information_json(webtoon_directory)
+    assert information is not None
+    extra = information["extra"]
+    assert isinstance(extra, InformationSidecar) and extra._data is None
+    assert information["download_status"] == ["downloaded", "downloaded"]
+    assert [article["no"] for article in extra["raw_articles"]] == [1, 2]
+
+    # 예전 형식의 information.json도 읽을 수 있음
+    legacy = dict(core, extra=dict(extra))
+    del legacy["sidecars"]
+    (webtoon_directory / "information.json").write_text(json.dumps(legacy), "utf-8")
+    assert load_information_json(webtoon_directory)["extra"] == dict(extra)  # type: ignore
+
+    # extra를 제외하면 이전의 sidecar는 삭제됨
+    await download(("extra/",))
+    assert not (webtoon_directory / "information.extra.json.gz").exists()
+    assert "sidecars" not in json.loads((webtoon_directory / "information.json").read_text("utf-8"))
+
+
+def test_sidecar_written_atomically(tmp_path, monkeypatch):
+    from WebtoonScraper import directory_state
+
+    directory_state.save_information_json(tmp_path, dict(title="title", extra=dict(value=1)))
+
+    # sidecar를 교체하기 전에 중단되더라도 이전 sidecar는 그대로 남음
+    def interrupted(src, dst):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(directory_state.os, "replace", interrupted)
+    with pytest.raises(KeyboardInterrupt):
+        directory_state.save_information_json(tmp_path, dict(title="title", extra=dict(value=2)))
+    monkeypatch.undo()
+    information = directory_state.load_information_json(tmp_path)
+    assert information is not None and dict(information["extra"]) == dict(value=1)
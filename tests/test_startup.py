@@ -0,0 +1,45 @@
+import subprocess
+import sys
+import time
+
+import pytest
+
+HEAVY_MODULES = ("asyncio", "rich", "httpx", "httpc", "certifi", "yarl", "fieldenum", "filetype", "WebtoonScraper.scrapers")
+STARTUP_BUDGET = 0.15
+
+
+def _run(*code_or_args: str) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, *code_or_args], check=True, capture_output=True)
+    return time.perf_counter() - start
+
+
+@pytest.mark.parametrize("argv", [["--help"], ["--version"], ["--mock", "download", "819217"], ["download", "--help"]])
+def test_cli_does_not_import_heavy_modules(argv):
+    code = (
+        "import sys\n"
+        "from WebtoonScraper.__main__ import main\n"
+        "try:\n"
+        f"    main({argv!r})\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"print(','.join(module for module in {HEAVY_MODULES!r} if module in sys.modules))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True)
+    assert result.stdout.splitlines()[-1] == ""
+
+
+def test_platforms_are_loaded_lazily():
+    from WebtoonScraper.base import get_platform, platform_names
+    from WebtoonScraper.scrapers import NaverWebtoonScraper
+
+    assert "naver_webtoon" in platform_names()
+    assert get_platform("naver_webtoon") is NaverWebtoonScraper
+    assert get_platform("unknown") is None
+
+
+def test_startup_budget():
+    # 인터프리터 자체의 시작 시간은 환경마다 크게 다르기 때문에 빼고 측정함
+    interpreter = min(_run("-c", "pass") for _ in range(3))
+    help_command = min(_run("-m", "WebtoonScraper", "--help") for _ in range(3))
+    assert help_command - interpreter < STARTUP_BUDGET